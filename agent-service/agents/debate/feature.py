@@ -157,7 +157,7 @@ class DebateFeature(FeatureBase):
         award_excerpts = ""
         rag_sources: List[Dict[str, Any]] = []
         try:
-            retriever, _ = ensure_retriever(config, logger)
+            retriever, _ = await asyncio.to_thread(ensure_retriever, config, logger)
             query_parts = [
                 scenario.award_name,
                 scenario.shift_date,
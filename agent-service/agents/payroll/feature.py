@@ -1,4 +1,4 @@
-"""PayrollFeature — explains a single payroll compliance issue using RAG + LLM."""
+"""PayrollFeature — explains payroll compliance issues using RAG + LLM."""
 
 import asyncio
 import json
@@ -14,6 +14,8 @@ from shared.rag.retriever_manager import ensure_retriever
 
 _PROMPTS_DIR = Path(__file__).parent / "prompts"
 LLM_TIMEOUT_SECONDS = 20
+# LLM calls in flight at once for one batch request.
+BATCH_LLM_CONCURRENCY = 4
 
 
 class PayrollFeature(FeatureBase):
@@ -34,13 +36,11 @@ class PayrollFeature(FeatureBase):
         # --- Phase 1: Input + retrieval (no retry) ---
         try:
             # 1. Build RAG query
-            category_type = payload["categoryType"]
-            context_label = payload["description"]["contextLabel"]
-            query = f"{category_type} {context_label}"
+            query = self._build_query(payload)
 
             # 2. Retrieve Award excerpts
             top_k = config.get("faiss", {}).get("similarity_search_k_docs", 3)
-            retriever, _vectorstore = ensure_retriever(config, logger)
+            retriever, _vectorstore = await asyncio.to_thread(ensure_retriever, config, logger)
             retrieval_result = await retriever.retrieve(query, top_k=top_k)
             award_excerpts = retriever.format_context_for_llm(retrieval_result)
 
@@ -53,15 +53,7 @@ class PayrollFeature(FeatureBase):
             )
 
             # 3. Build prompts
-            system_prompt = (_PROMPTS_DIR / "system.txt").read_text(encoding="utf-8")
-            user_template = (_PROMPTS_DIR / "user.txt").read_text(encoding="utf-8")
-            user_message = user_template.replace(
-                "{issue_json}", json.dumps(payload, indent=2)
-            ).replace("{award_excerpts}", award_excerpts)
-            messages = [
-                {"role": "system", "content": system_prompt},
-                {"role": "user", "content": user_message},
-            ]
+            messages = self._build_messages(payload, award_excerpts, *self._load_prompts())
         except KeyError as e:
             # Log 2: Input validation failed (defensive — Pydantic covers this)
             logger.warning("Missing field in payload: %s", e)
@@ -85,6 +77,82 @@ class PayrollFeature(FeatureBase):
 
         return result
 
+    async def process_batch(self, payloads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Explain several issues with one batched retrieval.
+
+        All RAG queries go through ``retrieve_many`` (one embeddings request,
+        the FAISS searches in one worker thread); the LLM calls then run
+        concurrently, at most BATCH_LLM_CONCURRENCY at a time. Each entry of ``data.results`` carries
+        the issueId and the same code/msg/data a single explain would return.
+        """
+        logger = logging.getLogger(__name__)
+        config = load_config()
+        start_time = time.time()
+        logger.info("Payroll explain batch request: %d issues", len(payloads))
+
+        try:
+            queries = [self._build_query(payload) for payload in payloads]
+            top_k = config.get("faiss", {}).get("similarity_search_k_docs", 3)
+            retriever, _vectorstore = await asyncio.to_thread(ensure_retriever, config, logger)
+            retrievals = await retriever.retrieve_many(queries, top_k=top_k)
+            logger.info("FAISS batch retrieval: %d queries, %d distinct", len(queries), len(set(queries)))
+
+            prompts = self._load_prompts()
+            messages = [
+                self._build_messages(payload, retriever.format_context_for_llm(retrieval), *prompts)
+                for payload, retrieval in zip(payloads, retrievals)
+            ]
+        except KeyError as e:
+            logger.warning("Missing field in batch payload: %s", e)
+            return {"code": 400, "msg": "Invalid issue JSON"}
+        except Exception:
+            logger.exception("Internal error during batch retrieval phase")
+            return {"code": 500, "msg": "Internal processing error"}
+
+        semaphore = asyncio.Semaphore(BATCH_LLM_CONCURRENCY)
+
+        async def explain(index: int) -> Dict[str, Any]:
+            async with semaphore:
+                result = await self._call_llm_with_retry(
+                    messages[index],
+                    retrievals[index].metadatas,
+                    retrievals[index].documents,
+                    logger,
+                )
+            return {"issueId": payloads[index].get("issueId"), **result}
+
+        results = await asyncio.gather(*(explain(index) for index in range(len(payloads))))
+        logger.info("Payroll explain batch completed in %.2fs", time.time() - start_time)
+        return {"code": 200, "msg": "OK", "data": {"results": list(results)}}
+
+    @staticmethod
+    def _build_query(payload: Dict[str, Any]) -> str:
+        category_type = payload["categoryType"]
+        context_label = payload["description"]["contextLabel"]
+        return f"{category_type} {context_label}"
+
+    @staticmethod
+    def _load_prompts() -> tuple[str, str]:
+        system_prompt = (_PROMPTS_DIR / "system.txt").read_text(encoding="utf-8")
+        user_template = (_PROMPTS_DIR / "user.txt").read_text(encoding="utf-8")
+        return system_prompt, user_template
+
+    @staticmethod
+    def _build_messages(
+        payload: Dict[str, Any],
+        award_excerpts: str,
+        system_prompt: str,
+        user_template: str,
+    ) -> List[Dict[str, str]]:
+        user_message = user_template.replace(
+            "{issue_json}", json.dumps(payload, indent=2)
+        ).replace("{award_excerpts}", award_excerpts)
+        return [
+            {"role": "system", "content": system_prompt},
+            {"role": "user", "content": user_message},
+        ]
+
     async def _call_llm_with_retry(
         self,
         messages: List[Dict[str, str]],
@@ -1,8 +1,8 @@
 """Pydantic request models for the Payroll Explain endpoint."""
 
-from typing import Optional
+from typing import List, Optional
 
-from pydantic import BaseModel
+from pydantic import BaseModel, Field
 
 
 class IssueDescription(BaseModel):
@@ -22,3 +22,7 @@ class PayrollExplainRequest(BaseModel):
     impactAmount: float
     description: IssueDescription
     warning: Optional[str] = None
+
+
+class PayrollExplainBatchRequest(BaseModel):
+    issues: List[PayrollExplainRequest] = Field(min_length=1, max_length=50)
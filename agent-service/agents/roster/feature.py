@@ -1,20 +1,93 @@
-from typing import Dict, Any
+from typing import BinaryIO, Dict, Any, Mapping, Optional, Tuple
+import asyncio
+import json
 import logging
-import tempfile
-from pathlib import Path
+import os
+import threading
+import time
+from dataclasses import replace
 
-from master_agent.feature_registry import FeatureBase, feature_response
-from .services.roster_import import RosterExcelParser, ParseMode
+from pydantic import TypeAdapter
+
+from master_agent.feature_registry import EncodedFeatureResult, FeatureBase, encode_json, feature_response
+from .services.parse_executor import ParseQueueFullError, ParseTimeoutError, RosterParseExecutor
+from .services.roster_import import RosterExcelParser, ParseIssue, ParseLimits, ParseMode, ParseResponse, RawRowsMode
+from .services.roster_import.diagnostics import NO_DIAGNOSTICS, ParseDiagnostics
+from .services.roster_import.issue_store import IssueStore
+from .services.roster_import.limits import (
+    ERROR_LIMIT_EXCEEDED,
+    PARSE_CANCELLED,
+    ROW_LIMIT_EXCEEDED,
+    TIME_LIMIT_EXCEEDED,
+)
+from .services.roster_import.result_cache import CacheKey, ParseResultCache, hash_stream
+from .services.roster_import.uploads import spool_upload
+
+_ISSUE_LIST = TypeAdapter(list[ParseIssue])
+
+# Only complete parses are cached. A read or row failure may be transient, a
+# budget stop depends on the configured limits (and the clock on load), and a
+# cancelled parse was abandoned; none of them is a property of the file alone.
+_UNCACHEABLE_CODES = frozenset({
+    "FILE_READ_ERROR",
+    "ROW_PARSE_ERROR",
+    ROW_LIMIT_EXCEEDED,
+    ERROR_LIMIT_EXCEEDED,
+    TIME_LIMIT_EXCEEDED,
+    PARSE_CANCELLED,
+})
+
+
+def _inline_limit_from_env() -> Optional[int]:
+    raw = os.getenv("ROSTER_ISSUE_INLINE_LIMIT", "").strip()
+    return int(raw) if raw else None
+
+
+def _raw_rows_mode_from_env() -> RawRowsMode:
+    return RawRowsMode(os.getenv("ROSTER_RAW_ROWS_MODE", RawRowsMode.FULL.value).strip().lower())
+
+
+def _diagnostics_from_env() -> bool:
+    return os.getenv("ROSTER_PARSE_DIAGNOSTICS", "").strip().lower() in ("1", "true", "yes", "on")
 
 
 class RosterFeature(FeatureBase):
     """Roster Feature - Handle roster file upload and parsing."""
 
-    def __init__(self):
+    def __init__(
+        self,
+        parse_executor: Optional[RosterParseExecutor] = None,
+        result_cache: Optional[ParseResultCache] = None,
+        issue_store: Optional[IssueStore] = None,
+        issue_inline_limit: Optional[int] = None,
+        raw_rows_mode: Optional[RawRowsMode] = None,
+        log_diagnostics: Optional[bool] = None,
+        parse_limits: Optional[ParseLimits] = None,
+    ):
         self.logger = logging.getLogger(__name__)
         self.roster_parser = RosterExcelParser()
+        # Parsing is CPU-bound openpyxl work; run it on a bounded pool so one
+        # large upload does not stall every other request on this worker.
+        self.parse_executor = parse_executor or RosterParseExecutor.from_env()
+        # Re-uploads of the same file (re-validate, retry) skip the parse.
+        self.result_cache = result_cache or ParseResultCache.from_env()
+        # Responses carry at most issue_inline_limit issues (None: all of
+        # them); the full list is kept in issue_store for paging.
+        self.issue_store = issue_store or IssueStore.from_env()
+        self.issue_inline_limit = (
+            issue_inline_limit if issue_inline_limit is not None else _inline_limit_from_env()
+        )
+        # raw_rows (the spreadsheet preview copy) can be dropped or sent
+        # columnar when the caller does not need one dict per row.
+        self.raw_rows_mode = raw_rows_mode or _raw_rows_mode_from_env()
+        # Per-stage timings and counters are collected only when logged
+        # (log_diagnostics) or asked for in the request's context_payload.
+        self.log_diagnostics = log_diagnostics if log_diagnostics is not None else _diagnostics_from_env()
+        # Row / error / wall-clock budgets: a pathological upload stops early
+        # with a BLOCKING response instead of holding a worker to the end.
+        self.parse_limits = parse_limits or ParseLimits.from_env()
 
-    async def process(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+    async def process(self, payload: Dict[str, Any]) -> Mapping[str, Any]:
         """Process roster file upload and parsing."""
         file_upload = payload.get("file")
         file_name = payload.get("file_name")
@@ -27,40 +100,98 @@ class RosterFeature(FeatureBase):
                 note="FILE_REQUIRED",
             )
 
-        return await self._parse_roster_file(file_upload, file_name)
+        issue_limit = self.issue_inline_limit
+        raw_rows_mode = self.raw_rows_mode
+        include_diagnostics = False
+        context_payload = payload.get("context_payload")
+        if isinstance(context_payload, dict):
+            if isinstance(context_payload.get("issue_limit"), int):
+                issue_limit = context_payload["issue_limit"]
+            if "raw_rows" in context_payload:
+                try:
+                    raw_rows_mode = RawRowsMode(context_payload["raw_rows"])
+                except ValueError:
+                    self.logger.warning("Ignoring unknown raw_rows option: %r", context_payload["raw_rows"])
+            include_diagnostics = context_payload.get("diagnostics") is True
+
+        diagnostics = (
+            ParseDiagnostics() if include_diagnostics or self.log_diagnostics else NO_DIAGNOSTICS
+        )
+        with diagnostics.stage("total"):
+            response = await self._parse_roster_file(file_upload, file_name, issue_limit, raw_rows_mode, diagnostics)
+        if diagnostics.enabled and isinstance(response, EncodedFeatureResult):
+            report = diagnostics.as_dict()
+            self.logger.info("Roster parse diagnostics: %s", json.dumps(report, separators=(",", ":")))
+            if include_diagnostics:
+                response.fields["diagnostics"] = report
+        return response
 
     async def _parse_roster_file(
-        self, file: Any, file_name: str
-    ) -> Dict[str, Any]:
-        """Parse roster Excel file and return structured data."""
-        temp_file_path = None
+        self,
+        file: Any,
+        file_name: str,
+        issue_limit: Optional[int] = None,
+        raw_rows_mode: RawRowsMode = RawRowsMode.FULL,
+        diagnostics: ParseDiagnostics = NO_DIAGNOSTICS,
+    ) -> Mapping[str, Any]:
+        """Parse roster Excel/CSV file and return structured data."""
+        started_at = time.perf_counter()
+        stream = None
+        # Once a worker has picked up the parse, the job closes the stream;
+        # a timed-out parse may still be reading it.
+        job_started = False
         try:
-            # Save uploaded file to temporary location
-            with tempfile.NamedTemporaryFile(
-                mode="wb", suffix=".xlsx", delete=False
-            ) as temp_file:
-                content = await file.read()
-                temp_file.write(content)
-                temp_file_path = temp_file.name
-
-            # Parse the roster file using LENIENT mode (allow warnings)
-            parse_response = self.roster_parser.parse_roster_excel(
-                file_path=temp_file_path, mode=ParseMode.LENIENT
-            )
-
-            # Return model_dump() at top level — the .NET backend deserializes
-            # this directly as ParseResponse (result, issues, summary).
-            # Standard fields (type, message, etc.) are merged alongside.
-            result = parse_response.model_dump()
-            result.update({
-                "type": "roster",
-                "message": f"Roster file '{file_name}' parsed successfully.",
-                "model": None,
-                "sources": [],
-                "note": None,
-            })
-            return result
+            with diagnostics.stage("spool"):
+                stream = await spool_upload(file)
+            cache_key = None
+            parsed = None
+            if self.result_cache.enabled:
+                with diagnostics.stage("hash"):
+                    content_hash = await asyncio.to_thread(hash_stream, stream)
+                cache_key = self.result_cache.make_key(
+                    content_hash, ParseMode.LENIENT, None, file_name, raw_rows_mode
+                )
+                parsed = self.result_cache.get_encoded(cache_key)
+            if parsed is not None:
+                self.logger.info("Roster parse cache hit: %s", self.result_cache.stats())
+                diagnostics.count("cache_hits")
+                body, fields = parsed, {}
+                if issue_limit is not None:
+                    body, fields = await asyncio.to_thread(
+                        self._truncate_encoded, parsed, issue_limit, diagnostics
+                    )
+                return self._roster_response(body, fields, file_name)
 
+            # Set by the executor on timeout; the parse stops at its next row.
+            cancel = threading.Event()
+            job_started = True
+            body, fields = await self.parse_executor.run(
+                self._parse_roster_stream,
+                stream,
+                file_name,
+                cache_key,
+                raw_rows_mode,
+                diagnostics,
+                issue_limit,
+                replace(self.parse_limits, cancel=cancel),
+                cancel=cancel,
+            )
+        except ParseQueueFullError as exc:
+            job_started = False
+            self.logger.warning(f"Roster parse rejected: {exc}")
+            return feature_response(
+                type="roster",
+                message="Roster parser is busy, please retry shortly.",
+                note="PARSE_BUSY",
+            )
+        except ParseTimeoutError as exc:
+            job_started = exc.started
+            self.logger.warning(f"Roster parse timed out: {exc}")
+            return feature_response(
+                type="roster",
+                message=f"Failed to parse roster file: {str(exc)}",
+                note="PARSE_TIMEOUT",
+            )
         except Exception as exc:
             self.logger.error(f"Failed to parse roster file: {exc}", exc_info=True)
             return feature_response(
@@ -69,6 +200,129 @@ class RosterFeature(FeatureBase):
                 note="PARSE_ERROR",
             )
         finally:
-            # Clean up temporary file
-            if temp_file_path and Path(temp_file_path).exists():
-                Path(temp_file_path).unlink()
+            if stream is not None and not job_started:
+                stream.close()
+
+        stats = self.parse_executor.stats()
+        self.logger.info(
+            "Roster parse completed: elapsed_ms=%s, queued=%s, running=%s, max_queue_depth=%s",
+            int((time.perf_counter() - started_at) * 1000),
+            stats["queued"],
+            stats["running"],
+            stats["max_queue_depth"],
+        )
+        return self._roster_response(body, fields, file_name)
+
+    def _parse_roster_stream(
+        self,
+        stream: BinaryIO,
+        file_name: str,
+        cache_key: Optional[CacheKey] = None,
+        raw_rows_mode: RawRowsMode = RawRowsMode.FULL,
+        diagnostics: ParseDiagnostics = NO_DIAGNOSTICS,
+        issue_limit: Optional[int] = None,
+        limits: Optional[ParseLimits] = None,
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """
+        Blocking part of the upload: parse, serialize and bound the issues. Runs on the executor.
+
+        Returns the response body and any top-level fields to merge after it
+        (``issues_truncated`` / ``issue_result_id`` when issues were cut).
+        Closes ``stream`` when done: the job owns it once it has started.
+        """
+        try:
+            return self._parse_and_encode(stream, file_name, cache_key, raw_rows_mode, diagnostics, issue_limit, limits)
+        finally:
+            stream.close()
+
+    def _parse_and_encode(
+        self,
+        stream: BinaryIO,
+        file_name: str,
+        cache_key: Optional[CacheKey],
+        raw_rows_mode: RawRowsMode,
+        diagnostics: ParseDiagnostics,
+        issue_limit: Optional[int],
+        limits: Optional[ParseLimits],
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        # The upload is parsed straight from its (spooled) stream; file_name
+        # supplies the suffix for picking the Excel or CSV reader, and
+        # unknown or missing suffixes are sniffed from content.
+        parse_response = self.roster_parser.parse_roster_excel(
+            file_path=stream,
+            mode=ParseMode.LENIENT,
+            file_name=file_name,
+            raw_rows=raw_rows_mode,
+            diagnostics=diagnostics,
+            limits=limits or self.parse_limits,
+        )
+        truncate = issue_limit is not None and len(parse_response.issues) > issue_limit
+        incomplete = any(group.code in _UNCACHEABLE_CODES for group in parse_response.issue_summary)
+        cacheable = cache_key is not None and not incomplete
+
+        body, fields = b"", {}
+        if cacheable or not truncate:
+            # Serialized once, straight to JSON; this is what the response
+            # and the cache carry, with no model_dump() / jsonable_encoder pass.
+            with diagnostics.stage("serialize"):
+                body = parse_response.model_dump_json().encode("utf-8")
+            if cacheable:
+                self.result_cache.put_encoded(cache_key, body)
+        if truncate:
+            with diagnostics.stage("truncate_issues"):
+                body, fields = self._truncate_issues(parse_response, issue_limit)
+        diagnostics.count("response_bytes", len(body))
+        return body, fields
+
+    def _truncate_issues(self, parse_response: ParseResponse, issue_limit: int) -> Tuple[bytes, Dict[str, Any]]:
+        # summary / issue_summary still describe every issue; the full list
+        # is dumped (and sized) once for the store, and can be paged from
+        # /api/agent/roster/issues/{issue_result_id}.
+        issues = parse_response.issues
+        result_id = None
+        if self.issue_store.enabled:
+            result_id = self.issue_store.put(
+                _ISSUE_LIST.dump_python(issues, mode="json"), len(_ISSUE_LIST.dump_json(issues))
+            )
+        if result_id is None:
+            self.logger.warning(
+                "Roster issue list not stored (store disabled or over budget): issues=%s", len(issues)
+            )
+        inline = parse_response.model_copy(update={"issues": issues[: max(issue_limit, 0)]})
+        body = inline.model_dump_json().encode("utf-8")
+        return body, {"issues_truncated": True, "issue_result_id": result_id}
+
+    def _truncate_encoded(
+        self,
+        body: bytes,
+        issue_limit: int,
+        diagnostics: ParseDiagnostics = NO_DIAGNOSTICS,
+    ) -> Tuple[bytes, Dict[str, Any]]:
+        """Bound the issues of a cached body. Decodes it, so it runs off the event loop."""
+        with diagnostics.stage("truncate_issues"):
+            parsed = json.loads(body)
+            issues = parsed.get("issues") or []
+            if len(issues) <= issue_limit:
+                return body, {}
+            # Decoded issues are already JSON-compatible; store them as is.
+            result_id = self.issue_store.put(issues)
+            if result_id is None:
+                self.logger.warning(
+                    "Roster issue list not stored (store disabled or over budget): issues=%s", len(issues)
+                )
+            parsed["issues"] = issues[: max(issue_limit, 0)]
+            return encode_json(parsed), {"issues_truncated": True, "issue_result_id": result_id}
+
+    def _roster_response(self, body: bytes, fields: Dict[str, Any], file_name: str) -> EncodedFeatureResult:
+        # The serialized ParseResponse goes out at top level — the .NET
+        # backend deserializes this directly as ParseResponse (result,
+        # issues, summary). Truncation fields and the standard fields (type,
+        # message, etc.) are merged alongside.
+        return EncodedFeatureResult(body, {
+            **fields,
+            "type": "roster",
+            "message": f"Roster file '{file_name}' parsed successfully.",
+            "model": None,
+            "sources": [],
+            "note": None,
+        })
@@ -0,0 +1,156 @@
+"""Bounded worker pool for running roster parses off the event loop."""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional, TypeVar
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 2
+DEFAULT_MAX_QUEUE = 8
+DEFAULT_TIMEOUT_SECONDS = 120.0
+
+
+class ParseQueueFullError(RuntimeError):
+    """Raised when every worker is busy and the wait queue is full."""
+
+
+class ParseTimeoutError(TimeoutError):
+    """
+    Raised when a job does not finish (queue wait included) within its timeout.
+
+    ``started`` is False when the job was cancelled before a worker picked it
+    up, so anything it would have released is still the caller's to release.
+    """
+
+    def __init__(self, message: str, started: bool = True) -> None:
+        super().__init__(message)
+        self.started = started
+
+
+class RosterParseExecutor:
+    """
+    Runs blocking parse jobs on a fixed-size thread pool.
+
+    ``max_workers`` caps how many parses run at once, ``max_queue`` caps how
+    many more may wait for a worker (further submissions are rejected), and
+    every job gets a timeout that covers both waiting and running. A job that
+    times out while still queued is cancelled. One that is already running
+    cannot be interrupted from outside: it keeps its worker (so the
+    concurrency limit stays honest) until it returns, which is prompt only if
+    it watches the ``cancel`` event passed to ``run``.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        max_queue: int = DEFAULT_MAX_QUEUE,
+        timeout_seconds: Optional[float] = DEFAULT_TIMEOUT_SECONDS,
+    ) -> None:
+        if max_workers < 1:
+            raise ValueError("max_workers must be at least 1")
+        if max_queue < 0:
+            raise ValueError("max_queue must not be negative")
+
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.timeout_seconds = timeout_seconds
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="roster-parse")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self._max_queue_depth = 0
+        self._completed = 0
+        self._failed = 0
+        self._timed_out = 0
+        self._rejected = 0
+
+    @classmethod
+    def from_env(cls) -> "RosterParseExecutor":
+        """Build from ROSTER_PARSE_MAX_WORKERS / _MAX_QUEUE / _TIMEOUT_SECONDS."""
+        timeout = float(os.getenv("ROSTER_PARSE_TIMEOUT_SECONDS", str(DEFAULT_TIMEOUT_SECONDS)))
+        return cls(
+            max_workers=int(os.getenv("ROSTER_PARSE_MAX_WORKERS", str(DEFAULT_MAX_WORKERS))),
+            max_queue=int(os.getenv("ROSTER_PARSE_MAX_QUEUE", str(DEFAULT_MAX_QUEUE))),
+            timeout_seconds=timeout if timeout > 0 else None,
+        )
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of queue depth and job counters."""
+        with self._lock:
+            return {
+                "queued": self._queued,
+                "running": self._running,
+                "max_queue_depth": self._max_queue_depth,
+                "completed": self._completed,
+                "failed": self._failed,
+                "timed_out": self._timed_out,
+                "rejected": self._rejected,
+            }
+
+    async def run(
+        self,
+        fn: Callable[..., T],
+        *args: Any,
+        timeout: Optional[float] = None,
+        cancel: Optional[threading.Event] = None,
+        **kwargs: Any,
+    ) -> T:
+        """
+        Run ``fn(*args, **kwargs)`` on a worker thread and await its result.
+
+        Raises ParseQueueFullError if the pool is saturated and
+        ParseTimeoutError if the job exceeds ``timeout`` (default:
+        ``timeout_seconds``). Exceptions raised by ``fn`` propagate unchanged.
+        ``cancel`` is set on timeout so a job that checks it can stop early
+        and free its worker; the job must own everything it reads, since the
+        caller has moved on by then.
+        """
+        with self._lock:
+            if self._queued + self._running >= self.max_workers + self.max_queue:
+                self._rejected += 1
+                raise ParseQueueFullError(
+                    f"Roster parser is busy ({self._running} running, {self._queued} queued)"
+                )
+            self._queued += 1
+            self._max_queue_depth = max(self._max_queue_depth, self._queued)
+
+        future = self._executor.submit(self._run_job, fn, args, kwargs)
+        limit = self.timeout_seconds if timeout is None else timeout
+        try:
+            return await asyncio.wait_for(asyncio.wrap_future(future), limit)
+        except asyncio.TimeoutError:
+            if cancel is not None:
+                cancel.set()
+            with self._lock:
+                self._timed_out += 1
+                # Cancelled before a worker picked it up: it never left the queue.
+                started = not future.cancel()
+                if not started:
+                    self._queued -= 1
+            raise ParseTimeoutError(f"Roster parse timed out after {limit:g}s", started=started) from None
+
+    def _run_job(self, fn: Callable[..., T], args: tuple, kwargs: Dict[str, Any]) -> T:
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+        failed = False
+        try:
+            return fn(*args, **kwargs)
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                self._running -= 1
+                if failed:
+                    self._failed += 1
+                else:
+                    self._completed += 1
+
+    def shutdown(self, wait: bool = True) -> None:
+        self._executor.shutdown(wait=wait, cancel_futures=True)
@@ -1,14 +1,18 @@
 """Roster import package."""
 
 from .parser import RosterExcelParser
+from .limits import ParseLimits
 from .models import (
     ParseIssueSeverity,
     ParseResultStatus,
     ParseMode,
+    RawRowsMode,
+    RawRowTable,
     ParseIssue,
     ParseIssueError,
     RosterEntry,
     EmployeeEntry,
+    RosterAggregates,
     RosterParseResult,
     EmployeeParseResult,
     IssueGroupSummary,
@@ -18,13 +22,17 @@ from .models import (
 
 __all__ = [
     "RosterExcelParser",
+    "ParseLimits",
     "ParseIssueSeverity",
     "ParseResultStatus",
     "ParseMode",
+    "RawRowsMode",
+    "RawRowTable",
     "ParseIssue",
     "ParseIssueError",
     "RosterEntry",
     "EmployeeEntry",
+    "RosterAggregates",
     "RosterParseResult",
     "EmployeeParseResult",
     "IssueGroupSummary",
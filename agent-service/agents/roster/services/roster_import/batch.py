@@ -0,0 +1,211 @@
+"""
+Parallel roster import across several files and/or every sheet of a workbook.
+
+Library-only: this works on files already on disk and is not wired into
+RosterFeature or any HTTP route (uploads go through the parse executor).
+"""
+
+from __future__ import annotations
+
+import multiprocessing
+import os
+import threading
+from collections import Counter
+from concurrent.futures import Executor, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional, Sequence
+
+from .issues import build_response
+from .models import (
+    ParseIssue,
+    ParseIssueSeverity,
+    ParseMode,
+    ParseResponse,
+    RosterParseResult,
+)
+from .parser import RosterExcelParser
+from .readers import list_sheets
+
+# Sheet-level failures that just mean "this sheet is not a roster" (e.g. the
+# template's Instructions tab) when sheets were discovered rather than named.
+_SKIPPABLE_SHEET_CODES = {"EMPTY_FILE", "MISSING_REQUIRED_COLUMNS", "INVALID_HEADER_ROW"}
+
+# Worker processes are expensive to start, so pools are kept for the life of
+# the process (one per worker count) and shared by every batch call. Workers
+# are spawned rather than forked: the caller may be a threaded server, and a
+# forked child inherits whatever locks other threads held at fork time.
+_MP_CONTEXT = multiprocessing.get_context("spawn")
+_POOLS: dict[int, ProcessPoolExecutor] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class BatchJob:
+    """One sheet to parse. Must stay picklable: it is sent to worker processes."""
+
+    file_path: str
+    sheet_name: Optional[str]
+    label: str
+    discovered: bool = False
+
+
+def plan_jobs(
+    file_paths: Sequence[str],
+    sheet_name: Optional[str] = None,
+    all_sheets: bool = True,
+) -> list[BatchJob]:
+    """
+    Expand files into per-sheet jobs.
+
+    With ``all_sheets`` every worksheet of every workbook is parsed; otherwise
+    only ``sheet_name`` (or the active sheet). Labels are the sheet name for a
+    single workbook and ``"<file>:<sheet>"`` when several files are given;
+    files that share a name (from different directories) are told apart as
+    ``"<file>#<n>"``, numbered in the order given.
+    """
+    multi_file = len(file_paths) > 1
+    name_counts = Counter(Path(file_path).name for file_path in file_paths)
+    seen: Counter[str] = Counter()
+    jobs: list[BatchJob] = []
+    for file_path in file_paths:
+        file_name = Path(file_path).name
+        if name_counts[file_name] > 1:
+            seen[file_name] += 1
+            file_name = f"{file_name}#{seen[file_name]}"
+        try:
+            sheets = list_sheets(file_path) if all_sheets and not sheet_name else [sheet_name]
+        except (FileNotFoundError, ValueError, OSError):
+            # Let the per-sheet parse report the failure as a normal issue.
+            sheets = [sheet_name]
+
+        discovered = all_sheets and not sheet_name and len(sheets) > 1
+        for sheet in sheets:
+            if sheet is None:
+                label = file_name
+            elif multi_file:
+                label = f"{file_name}:{sheet}"
+            else:
+                label = sheet
+            jobs.append(BatchJob(file_path=str(file_path), sheet_name=sheet, label=label, discovered=discovered))
+    return jobs
+
+
+def _parse_roster_job(job: BatchJob, header_row: Optional[int], mode: ParseMode) -> ParseResponse:
+    """Worker entry point; top-level so ProcessPoolExecutor can pickle it."""
+    return RosterExcelParser().parse_roster_excel(
+        job.file_path,
+        job.sheet_name,
+        header_row=header_row,
+        mode=mode,
+    )
+
+
+def _shared_pool(workers: int) -> ProcessPoolExecutor:
+    with _POOLS_LOCK:
+        pool = _POOLS.get(workers)
+        if pool is None:
+            pool = _POOLS[workers] = ProcessPoolExecutor(max_workers=workers, mp_context=_MP_CONTEXT)
+        return pool
+
+
+def _discard_pool(workers: int, pool: ProcessPoolExecutor) -> None:
+    with _POOLS_LOCK:
+        if _POOLS.get(workers) is pool:
+            del _POOLS[workers]
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _is_skippable(job: BatchJob, response: ParseResponse) -> bool:
+    return (
+        job.discovered
+        and not response.result.entries
+        and bool(response.issues)
+        and all(issue.row == 0 and issue.code in _SKIPPABLE_SHEET_CODES for issue in response.issues)
+    )
+
+
+def merge_responses(parts: Sequence[tuple[BatchJob, ParseResponse]]) -> ParseResponse:
+    """
+    Merge per-sheet responses into one roster ParseResponse.
+
+    Issues keep their sheet-local row numbers and are tagged with the job
+    label in ``sheet``; raw rows get a ``"__sheet__"`` key for the same reason.
+    Discovered sheets that are not rosters are reported as a SHEET_SKIPPED
+    warning, unless no sheet in the batch could be parsed.
+    """
+    usable = [(job, response) for job, response in parts if not _is_skippable(job, response)]
+    skipped = [(job, response) for job, response in parts if _is_skippable(job, response)]
+    if not usable:
+        usable, skipped = list(parts), []
+
+    entries = []
+    raw_rows = []
+    issues: list[ParseIssue] = []
+    for job, response in usable:
+        entries.extend(response.result.entries)
+        for raw_row in response.result.raw_rows:
+            raw_row["__sheet__"] = job.label
+            raw_rows.append(raw_row)
+        for issue in response.issues:
+            issue.sheet = job.label
+            issues.append(issue)
+
+    for job, response in skipped:
+        issues.append(
+            ParseIssue(
+                row=0,
+                sheet=job.label,
+                severity=ParseIssueSeverity.WARNING,
+                code="SHEET_SKIPPED",
+                message=f"Sheet '{job.label}' skipped: {response.issues[0].message}",
+            )
+        )
+
+    return build_response(RosterParseResult(entries=entries, raw_rows=raw_rows), issues)
+
+
+def parse_roster_batch(
+    file_paths: Sequence[str],
+    sheet_name: Optional[str] = None,
+    header_row: Optional[int] = None,
+    mode: ParseMode = ParseMode.LENIENT,
+    all_sheets: bool = True,
+    max_workers: Optional[int] = None,
+    executor: Optional[Executor] = None,
+) -> ParseResponse:
+    """
+    Parse several roster files / sheets in a process pool and merge the results.
+
+    A single job is parsed in-process; there is nothing to parallelise.
+    Jobs run on ``executor`` when given (it is left running for its owner),
+    otherwise on a process pool shared across calls with ``max_workers``
+    workers, by default ``os.cpu_count()``.
+    """
+    mode = mode if isinstance(mode, ParseMode) else ParseMode(mode)
+    jobs = plan_jobs(file_paths, sheet_name=sheet_name, all_sheets=all_sheets)
+    if not jobs:
+        return build_response(RosterParseResult(entries=[], raw_rows=[]), [])
+
+    if len(jobs) == 1 or (max_workers == 1 and executor is None):
+        responses = [_parse_roster_job(job, header_row, mode) for job in jobs]
+    else:
+        workers = max_workers or os.cpu_count() or 1
+        pool = executor or _shared_pool(workers)
+        try:
+            responses = list(
+                pool.map(
+                    _parse_roster_job,
+                    jobs,
+                    [header_row] * len(jobs),
+                    [mode] * len(jobs),
+                )
+            )
+        except BrokenProcessPool:
+            # A worker died; the next call starts a fresh pool.
+            if executor is None:
+                _discard_pool(workers, pool)
+            raise
+
+    return merge_responses(list(zip(jobs, responses)))
@@ -0,0 +1,39 @@
+"""Per-import parsing state shared by the row parsers."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import Any, Optional
+from datetime import date, time
+
+from .utils import DateColumnParser, EmailValidator, TimeParser
+
+
+@dataclass
+class ParseContext:
+    """
+    State that lives for one parse job (one sheet) and is threaded through
+    the row parsers. Row parsers called without a context behave exactly as
+    before, just without the per-column learning.
+    """
+
+    date_sample_size: int = 20
+    date_columns: dict[str, DateColumnParser] = field(default_factory=dict)
+    time_parser: TimeParser = field(default_factory=TimeParser)
+    emails: EmailValidator = field(default_factory=EmailValidator)
+
+    def date_parser(self, column: str) -> DateColumnParser:
+        parser = self.date_columns.get(column)
+        if parser is None:
+            parser = DateColumnParser(sample_size=self.date_sample_size)
+            self.date_columns[column] = parser
+        return parser
+
+    def parse_date(self, column: str, value: Any) -> Optional[date]:
+        return self.date_parser(column).parse(value)
+
+    def parse_time(self, value: Any) -> Optional[time]:
+        return self.time_parser.parse(value)
+
+    def validate_email(self, value: str) -> Optional[str]:
+        return self.emails.validate(value)
@@ -0,0 +1,178 @@
+"""CSV/TSV file reader with the same header row detection as the Excel reader."""
+
+from __future__ import annotations
+
+import codecs
+import csv
+import io
+from pathlib import Path
+from typing import Any, BinaryIO, Callable, Generator, Iterator, Optional, Union
+
+from .excel_reader import iter_row_dicts
+
+# Suffix -> delimiter. Other suffixes are sniffed from the file content.
+CSV_DELIMITERS: dict[str, str] = {
+    ".csv": ",",
+    ".tsv": "\t",
+    ".tab": "\t",
+}
+
+_SNIFF_BYTES = 64 * 1024
+_SNIFF_DELIMITERS = ",\t;|"
+
+
+def _clean_value(value: str) -> Optional[str]:
+    value = value.strip()
+    return value or None
+
+
+def _detect_encoding(sample: bytes) -> str:
+    """Prefer UTF-8 (with optional BOM); fall back to Windows-1252 for legacy exports."""
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(sample, final=False)
+    except UnicodeDecodeError:
+        return "cp1252"
+    return "utf-8-sig"
+
+
+def _sniff_delimiter(text: str) -> str:
+    try:
+        return csv.Sniffer().sniff(text, delimiters=_SNIFF_DELIMITERS).delimiter
+    except csv.Error:
+        return ","
+
+
+def open_csv_rows(
+    file_path: Union[str, BinaryIO],
+    header_row: Optional[int] = None,
+    delimiter: Optional[str] = None,
+    file_name: Optional[str] = None,
+) -> tuple[list[Any], Generator[tuple[int, tuple[Any, ...]], None, None]]:
+    """
+    Open a delimited text file, locate its header row and return (headers, rows).
+
+    Mirrors ``excel_reader.open_excel_rows``: ``rows`` lazily yields
+    ``(row_num, values)`` for each non-empty record, where ``row_num`` is the
+    1-based record number (the row a spreadsheet would show it on). The file is
+    closed when ``rows`` is exhausted or closed. The delimiter is taken from the
+    suffix (.csv / .tsv / .tab) or sniffed from the first few KB.
+
+    ``file_path`` may also be a seekable binary stream (e.g. an upload); it is
+    read from its current position and left open. ``file_name`` then supplies
+    the suffix used to pick the delimiter.
+    """
+    if isinstance(file_path, (str, Path)):
+        path = Path(file_path)
+        if not path.exists():
+            raise FileNotFoundError(f"File not found: {file_path}")
+        suffix = path.suffix.lower()
+    else:
+        path = None
+        suffix = Path(file_name).suffix.lower() if file_name else ""
+
+    try:
+        if path is not None:
+            with path.open("rb") as raw:
+                sample = raw.read(_SNIFF_BYTES)
+        else:
+            start = file_path.tell()
+            sample = file_path.read(_SNIFF_BYTES)
+            file_path.seek(start)
+        encoding = _detect_encoding(sample)
+        if delimiter is None:
+            delimiter = CSV_DELIMITERS.get(suffix)
+        if delimiter is None:
+            delimiter = _sniff_delimiter(sample.decode(encoding, errors="replace"))
+        if path is not None:
+            handle = path.open("r", encoding=encoding, errors="replace", newline="")
+            close = handle.close
+        else:
+            handle = io.TextIOWrapper(file_path, encoding=encoding, errors="replace", newline="")
+            # Detach rather than close so the caller's stream stays usable.
+            close = handle.detach
+    except OSError as exc:
+        raise ValueError(f"Failed to read CSV file: {str(exc)}") from exc
+
+    records = enumerate(csv.reader(handle, delimiter=delimiter), start=1)
+    header_values: Optional[list[Any]] = None
+    try:
+        if header_row is not None:
+            target = max(header_row, 1)
+            for row_num, record in records:
+                if row_num == target:
+                    header_values = [_clean_value(v) for v in record]
+                    break
+        else:
+            for _, record in records:
+                values = [_clean_value(v) for v in record]
+                if sum(1 for v in values if v is not None) >= 2:
+                    header_values = values
+                    break
+
+        if header_values is None and header_row is not None:
+            raise ValueError(f"Header row not found: {header_row}")
+    except csv.Error as exc:
+        close()
+        raise ValueError(f"Failed to read CSV file: {str(exc)}") from exc
+    except BaseException:
+        close()
+        raise
+
+    if header_values is None:
+        close()
+        return [], (row for row in ())
+
+    width = 0
+    for idx, header in enumerate(header_values):
+        if header:
+            width = idx + 1
+    headers = header_values[:width]
+
+    return headers, _iter_csv_rows(close, records, headers)
+
+
+def _iter_csv_rows(
+    close: Callable[[], Any],
+    records: Iterator[tuple[int, list[str]]],
+    headers: list[Any],
+) -> Generator[tuple[int, tuple[Any, ...]], None, None]:
+    width = len(headers)
+    named_columns = [i for i, header in enumerate(headers) if header]
+    row_num = 0
+    try:
+        for row_num, record in records:
+            values = [_clean_value(v) for v in record[:width]]
+            if len(values) < width:
+                values.extend([None] * (width - len(values)))
+
+            if all(values[i] is None for i in named_columns):
+                continue
+            yield row_num, tuple(values)
+    except csv.Error as exc:
+        raise ValueError(f"Failed to read CSV file near row {row_num + 1}: {str(exc)}") from exc
+    finally:
+        close()
+
+
+def iter_csv(
+    file_path: str,
+    header_row: Optional[int] = None,
+    delimiter: Optional[str] = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily yield data rows from a CSV/TSV file as dictionaries.
+
+    Each dict includes '__row__' key with the 1-based record number, matching
+    ``iter_excel``.
+    """
+    headers, rows = open_csv_rows(file_path, header_row=header_row, delimiter=delimiter)
+    yield from iter_row_dicts(headers, rows)
+
+
+def read_csv(
+    file_path: str,
+    header_row: Optional[int] = None,
+    delimiter: Optional[str] = None,
+) -> list[dict[str, Any]]:
+    """Read a CSV/TSV file and return data as a list of dictionaries."""
+    return list(iter_csv(file_path, header_row=header_row, delimiter=delimiter))
@@ -0,0 +1,98 @@
+"""Opt-in stage timers and counters for a single roster import."""
+
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager, nullcontext
+from typing import Any, Iterator, Optional, TypeVar
+
+T = TypeVar("T")
+
+
+class ParseDiagnostics:
+    """
+    Collects per-stage wall time and counters for one import.
+
+    Stages are timed around whole steps (opening the workbook, the row loop,
+    building the response, ...), never per cell, so an enabled instance adds
+    a few microseconds per import plus one timer pair per row read (see
+    ``timed_rows``). Code paths take ``NO_DIAGNOSTICS`` by default, whose
+    methods do nothing.
+    """
+
+    enabled = True
+
+    def __init__(self) -> None:
+        self.stages: dict[str, float] = {}
+        self.counters: dict[str, int] = {}
+
+    @contextmanager
+    def stage(self, name: str, exclude: Optional[str] = None) -> Iterator[None]:
+        """
+        Add the block's wall time to stage ``name``.
+
+        With ``exclude``, time recorded under that stage while the block runs
+        is subtracted, e.g. the row loop minus the time spent reading rows.
+        """
+        excluded_before = self.stages.get(exclude, 0.0) if exclude else 0.0
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - started
+            if exclude:
+                elapsed -= self.stages.get(exclude, 0.0) - excluded_before
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+
+    def count(self, name: str, amount: int = 1) -> None:
+        self.counters[name] = self.counters.get(name, 0) + amount
+
+    def timed_rows(self, name: str, rows: Iterator[T]) -> Iterator[T]:
+        """Wrap a row iterator, timing each ``next()`` under ``name`` and counting rows."""
+        return self._timed_rows(name, rows)
+
+    def _timed_rows(self, name: str, rows: Iterator[T]) -> Iterator[T]:
+        clock = time.perf_counter
+        elapsed = 0.0
+        count = 0
+        try:
+            while True:
+                started = clock()
+                try:
+                    row = next(rows)
+                except StopIteration:
+                    return
+                finally:
+                    elapsed += clock() - started
+                count += 1
+                yield row
+        finally:
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed
+            self.count("rows_read", count)
+            close = getattr(rows, "close", None)
+            if close is not None:
+                close()
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "stages_ms": {name: round(seconds * 1000, 3) for name, seconds in self.stages.items()},
+            "counters": dict(self.counters),
+        }
+
+
+class _NoDiagnostics(ParseDiagnostics):
+    """Disabled diagnostics: every hook is a no-op."""
+
+    enabled = False
+
+    def stage(self, name: str, exclude: Optional[str] = None) -> Any:
+        return nullcontext()
+
+    def count(self, name: str, amount: int = 1) -> None:
+        return None
+
+    def timed_rows(self, name: str, rows: Iterator[T]) -> Iterator[T]:
+        return rows
+
+
+NO_DIAGNOSTICS = _NoDiagnostics()
@@ -2,16 +2,17 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Generator, Iterator, Optional
 from pathlib import Path
 
 from openpyxl import load_workbook
 from openpyxl.cell.cell import Cell
 
+from .diagnostics import NO_DIAGNOSTICS, ParseDiagnostics
 
-def _get_cell_value(cell: Cell) -> Any:
-    """Extract value from an Excel cell, handling various types."""
-    value = cell.value
+
+def _clean_value(value: Any) -> Any:
+    """Normalize a raw cell value: strip strings and map blanks to None."""
     if isinstance(value, str):
         value = value.strip()
         if value == "":
@@ -19,15 +20,29 @@ def _get_cell_value(cell: Cell) -> Any:
     return value
 
 
-def read_excel(
+def _get_cell_value(cell: Cell) -> Any:
+    """Extract value from an Excel cell, handling various types."""
+    return _clean_value(cell.value)
+
+
+def open_excel_rows(
     file_path: str,
     sheet_name: Optional[str] = None,
     header_row: Optional[int] = None,
-) -> list[dict[str, Any]]:
+    values_only: bool = False,
+    diagnostics: ParseDiagnostics = NO_DIAGNOSTICS,
+) -> tuple[list[Any], Generator[tuple[int, tuple[Any, ...]], None, None]]:
     """
-    Read an Excel file and return data as a list of dictionaries.
+    Open a sheet, locate its header row and return (headers, rows).
 
-    Each dict includes '__row__' key with the real Excel row number.
+    ``rows`` lazily yields ``(excel_row, values)`` for each non-empty data row,
+    where ``values`` is aligned with ``headers`` by column index. The workbook is
+    closed when ``rows`` is exhausted or closed. If no header row can be detected
+    the headers are empty and ``rows`` yields nothing.
+
+    With ``values_only=True`` rows are read via ``iter_rows(values_only=True)``
+    with an enumerated row counter instead of ``Cell`` objects, and data rows
+    are cut off at the last non-empty header column.
     """
     path = Path(file_path)
     if not path.exists():
@@ -36,67 +51,230 @@ def read_excel(
     if path.suffix.lower() != ".xlsx":
         raise ValueError(f"Invalid file format. Expected .xlsx, got: {path.suffix}")
 
+    return open_workbook_rows(
+        file_path, sheet_name, header_row=header_row, values_only=values_only, diagnostics=diagnostics
+    )
+
+
+def list_worksheets(source: Any) -> list[str]:
+    """Return the worksheet titles of a workbook (path or binary file object)."""
     try:
-        workbook = load_workbook(filename=file_path, read_only=True, data_only=True)
+        workbook = load_workbook(source, read_only=True, data_only=True)
     except Exception as exc:
         raise ValueError(f"Failed to read Excel file: {str(exc)}") from exc
+    try:
+        return [sheet.title for sheet in workbook.worksheets]
+    finally:
+        workbook.close()
 
-    if sheet_name:
-        if sheet_name not in workbook.sheetnames:
-            workbook.close()
-            raise ValueError(f"Sheet '{sheet_name}' not found. Available sheets: {workbook.sheetnames}")
-        sheet = workbook[sheet_name]
-    else:
-        sheet = workbook.active
-
-    row_iter = sheet.iter_rows()
-
-    header_cells = None
-    if header_row is not None:
-        header_index = max(header_row - 1, 0)
-        for idx, row in enumerate(row_iter):
-            if idx == header_index:
-                header_cells = row
-                break
-    else:
-        for row in row_iter:
-            values = [_get_cell_value(cell) for cell in row]
-            non_empty = [v for v in values if v not in (None, "")]
-            if len(non_empty) >= 2:
-                header_cells = row
-                break
 
-    if header_cells is None:
+def open_workbook_rows(
+    source: Any,
+    sheet_name: Optional[str] = None,
+    header_row: Optional[int] = None,
+    values_only: bool = False,
+    diagnostics: ParseDiagnostics = NO_DIAGNOSTICS,
+) -> tuple[list[Any], Generator[tuple[int, tuple[Any, ...]], None, None]]:
+    """
+    ``open_excel_rows`` without the path and suffix checks.
+
+    ``source`` is anything ``openpyxl.load_workbook`` accepts (a path or a
+    binary file object); used when the format was detected from content.
+    Workbook loading and the header scan are timed as the ``load_workbook``
+    and ``header_detect`` stages of ``diagnostics``.
+    """
+    try:
+        with diagnostics.stage("load_workbook"):
+            workbook = load_workbook(source, read_only=True, data_only=True)
+    except Exception as exc:
+        raise ValueError(f"Failed to read Excel file: {str(exc)}") from exc
+
+    try:
+        if sheet_name:
+            if sheet_name not in workbook.sheetnames:
+                raise ValueError(f"Sheet '{sheet_name}' not found. Available sheets: {workbook.sheetnames}")
+            sheet = workbook[sheet_name]
+        else:
+            sheet = workbook.active
+
+        if values_only:
+            with diagnostics.stage("header_detect"):
+                return _open_value_rows(workbook, sheet, header_row)
+
+        row_iter = sheet.iter_rows()
+
+        header_cells = None
         if header_row is not None:
-            workbook.close()
+            header_index = max(header_row - 1, 0)
+            for idx, row in enumerate(row_iter):
+                if idx == header_index:
+                    header_cells = row
+                    break
+        else:
+            for row in row_iter:
+                values = [_get_cell_value(cell) for cell in row]
+                non_empty = [v for v in values if v not in (None, "")]
+                if len(non_empty) >= 2:
+                    header_cells = row
+                    break
+
+        if header_cells is None and header_row is not None:
             raise ValueError(f"Header row not found: {header_row}")
+    except BaseException:
         workbook.close()
-        return []
+        raise
+
+    if header_cells is None:
+        workbook.close()
+        return [], (row for row in ())
 
     headers = [_get_cell_value(cell) for cell in header_cells]
     headers = [h.strip() if isinstance(h, str) else h for h in headers]
 
-    data: list[dict[str, Any]] = []
-    for row in row_iter:
-        row_dict: dict[str, Any] = {}
-        is_empty_row = True
-        real_row_num: Optional[int] = None
-
-        for cell in row:
-            if hasattr(cell, "row") and cell.row is not None:
-                real_row_num = cell.row
-                break
-
-        for i, cell in enumerate(row):
-            if i < len(headers) and headers[i]:
-                value = _get_cell_value(cell)
-                if value is not None:
-                    is_empty_row = False
-                row_dict[headers[i]] = value
-
-        if not is_empty_row and real_row_num is not None:
+    return headers, _iter_data_rows(workbook, row_iter, headers)
+
+
+def _iter_data_rows(
+    workbook: Any,
+    row_iter: Iterator[tuple[Cell, ...]],
+    headers: list[Any],
+) -> Generator[tuple[int, tuple[Any, ...]], None, None]:
+    width = len(headers)
+    named_columns = [i for i, header in enumerate(headers) if header]
+    try:
+        for row in row_iter:
+            real_row_num: Optional[int] = None
+            for cell in row:
+                if hasattr(cell, "row") and cell.row is not None:
+                    real_row_num = cell.row
+                    break
+            if real_row_num is None:
+                continue
+
+            values = [_get_cell_value(cell) for cell in row[:width]]
+            if len(values) < width:
+                values.extend([None] * (width - len(values)))
+
+            if all(values[i] is None for i in named_columns):
+                continue
+            yield real_row_num, tuple(values)
+    finally:
+        workbook.close()
+
+
+def _open_value_rows(
+    workbook: Any,
+    sheet: Any,
+    header_row: Optional[int],
+) -> tuple[list[Any], Generator[tuple[int, tuple[Any, ...]], None, None]]:
+    """values_only variant of the header scan in ``open_excel_rows``."""
+    header_values: Optional[list[Any]] = None
+    header_row_num = 0
+    scan = sheet.iter_rows(values_only=True)
+    try:
+        if header_row is not None:
+            target = max(header_row, 1)
+            for row_num, row in enumerate(scan, start=1):
+                if row_num == target:
+                    header_values = [_clean_value(v) for v in row]
+                    header_row_num = row_num
+                    break
+        else:
+            for row_num, row in enumerate(scan, start=1):
+                values = [_clean_value(v) for v in row]
+                if sum(1 for v in values if v is not None) >= 2:
+                    header_values = values
+                    header_row_num = row_num
+                    break
+    finally:
+        scan.close()
+
+    if header_values is None:
+        if header_row is not None:
+            raise ValueError(f"Header row not found: {header_row}")
+        workbook.close()
+        return [], (row for row in ())
+
+    # Trailing header-less columns are never read into a row dict, so stop at
+    # the last named column rather than walking formatted-but-empty cells.
+    width = 0
+    for idx, header in enumerate(header_values):
+        if header:
+            width = idx + 1
+    headers = header_values[:width]
+
+    if width == 0:
+        workbook.close()
+        return headers, (row for row in ())
+
+    row_iter = sheet.iter_rows(min_row=header_row_num + 1, max_col=width, values_only=True)
+    return headers, _iter_value_rows(workbook, row_iter, headers, header_row_num + 1)
+
+
+def _iter_value_rows(
+    workbook: Any,
+    row_iter: Generator[tuple[Any, ...], None, None],
+    headers: list[Any],
+    first_row_num: int,
+) -> Generator[tuple[int, tuple[Any, ...]], None, None]:
+    width = len(headers)
+    named_columns = [i for i, header in enumerate(headers) if header]
+    try:
+        for row_num, row in enumerate(row_iter, start=first_row_num):
+            values = [_clean_value(v) for v in row]
+            if len(values) < width:
+                values.extend([None] * (width - len(values)))
+
+            if all(values[i] is None for i in named_columns):
+                continue
+            yield row_num, tuple(values)
+    finally:
+        row_iter.close()
+        workbook.close()
+
+
+def iter_excel(
+    file_path: str,
+    sheet_name: Optional[str] = None,
+    header_row: Optional[int] = None,
+    values_only: bool = False,
+) -> Iterator[dict[str, Any]]:
+    """
+    Lazily yield data rows from an Excel file as dictionaries.
+
+    Each dict includes '__row__' key with the real Excel row number. The
+    workbook is opened on the first ``next()`` and closed once the generator
+    is exhausted or closed, so only one row is held in memory at a time.
+    """
+    headers, rows = open_excel_rows(file_path, sheet_name, header_row=header_row, values_only=values_only)
+    yield from iter_row_dicts(headers, rows)
+
+
+def iter_row_dicts(
+    headers: list[Any],
+    rows: Generator[tuple[int, tuple[Any, ...]], None, None],
+) -> Iterator[dict[str, Any]]:
+    """Turn positional ``(row_num, values)`` pairs into row dicts keyed by header."""
+    named_columns = [(i, header) for i, header in enumerate(headers) if header]
+    try:
+        for real_row_num, values in rows:
+            row_dict: dict[str, Any] = {header: values[i] for i, header in named_columns}
             row_dict["__row__"] = real_row_num
-            data.append(row_dict)
+            yield row_dict
+    finally:
+        rows.close()
+
 
-    workbook.close()
-    return data
+def read_excel(
+    file_path: str,
+    sheet_name: Optional[str] = None,
+    header_row: Optional[int] = None,
+    values_only: bool = False,
+) -> list[dict[str, Any]]:
+    """
+    Read an Excel file and return data as a list of dictionaries.
+
+    Each dict includes '__row__' key with the real Excel row number.
+    Prefer ``iter_excel`` for large sheets; this materialises every row.
+    """
+    return list(iter_excel(file_path, sheet_name, header_row=header_row, values_only=values_only))
@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import re
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
+
+from .utils import RAW_CELL_TYPES, raw_cell_value
 
 
 EXTRA_KEY = "__extra__"
@@ -56,15 +58,139 @@ def normalize_header(header: str) -> str:
     return header.strip()
 
 
+class SheetSchema:
+    """
+    A header row resolved once per sheet.
+
+    Maps canonical keys (and extra columns) to column indexes so row values can
+    be read positionally without re-normalizing headers on every row. Resolution
+    mirrors ``HeaderMap.normalize_and_detect_duplicates`` on a row dict: repeated
+    raw headers keep the last column, and canonical keys keep first-seen order.
+    """
+
+    def __init__(self, headers: Sequence[Any], alias_to_canonical: dict[str, str]) -> None:
+        self.headers = tuple(headers)
+
+        key_index: dict[Any, int] = {}
+        for idx, header in enumerate(self.headers):
+            if header:
+                key_index[header] = idx
+
+        columns: dict[str, int] = {}
+        extras: dict[str, int] = {}
+        seen: dict[str, str] = {}
+        duplicates: dict[str, list[str]] = {}
+        for key, idx in key_index.items():
+            canonical = alias_to_canonical.get(normalize_header(str(key)))
+            if canonical:
+                if canonical in seen:
+                    if canonical not in duplicates:
+                        duplicates[canonical] = [seen[canonical]]
+                    duplicates[canonical].append(str(key))
+                else:
+                    seen[canonical] = str(key)
+                columns[canonical] = idx
+            else:
+                extras[str(key)] = idx
+
+        self.columns = columns
+        self.extras = extras
+        self.duplicates = duplicates
+
+        # Display keys for raw rows are fixed per sheet, so resolve extra-column
+        # name clashes here instead of in every build_raw_row call.
+        taken = {"excel_row", *columns}
+        raw_extras: list[tuple[str, int]] = []
+        for name, idx in extras.items():
+            key_to_use = f"{name} (extra)" if name in taken else name
+            taken.add(key_to_use)
+            raw_extras.append((key_to_use, idx))
+        self._raw_columns = tuple(columns.items())
+        self._raw_extras = tuple(raw_extras)
+        self.raw_row_columns = ["excel_row", *columns, *(key for key, _ in raw_extras)]
+
+    def value(self, values: Sequence[Any], key: str) -> Any:
+        """Return the value for a canonical key, or None if the column is absent."""
+        idx = self.columns.get(key)
+        if idx is None or idx >= len(values):
+            return None
+        return values[idx]
+
+    def missing_keys(self, required_keys: list[str]) -> list[str]:
+        """Return required canonical keys with no matching column."""
+        available = {key.lower() for key in self.columns}
+        return [key for key in required_keys if key.lower() not in available]
+
+    def normalize(self, values: Sequence[Any]) -> dict[str, Any]:
+        """Build the same canonical dict as ``HeaderMap.normalize_headers``."""
+        normalized: dict[str, Any] = {key: self.value(values, key) for key in self.columns}
+        if self.extras:
+            normalized[EXTRA_KEY] = {
+                name: values[idx] if idx < len(values) else None for name, idx in self.extras.items()
+            }
+        return normalized
+
+    def build_raw_row(self, values: Sequence[Any], row_num: int) -> dict[str, Any]:
+        """Build a display-friendly raw row, equivalent to ``utils.build_raw_row``."""
+        size = len(values)
+        raw: dict[str, Any] = {"excel_row": row_num}
+        for key, idx in self._raw_columns:
+            value = values[idx] if idx < size else None
+            if isinstance(value, RAW_CELL_TYPES):
+                value = raw_cell_value(value)
+            raw[key] = value
+        for key, idx in self._raw_extras:
+            value = values[idx] if idx < size else None
+            if isinstance(value, RAW_CELL_TYPES):
+                value = raw_cell_value(value)
+            raw[key] = value
+        return raw
+
+    def build_raw_values(self, values: Sequence[Any], row_num: int) -> list[Any]:
+        """``build_raw_row`` as a list aligned with ``raw_row_columns``."""
+        size = len(values)
+        raw: list[Any] = [row_num]
+        for _, idx in self._raw_columns:
+            value = values[idx] if idx < size else None
+            if isinstance(value, RAW_CELL_TYPES):
+                value = raw_cell_value(value)
+            raw.append(value)
+        for _, idx in self._raw_extras:
+            value = values[idx] if idx < size else None
+            if isinstance(value, RAW_CELL_TYPES):
+                value = raw_cell_value(value)
+            raw.append(value)
+        return raw
+
+
 class HeaderMap:
     """Maps raw header strings to canonical keys."""
 
+    _SCHEMA_CACHE_SIZE = 64
+
     def __init__(self, aliases: Optional[dict[str, list[str]]] = None) -> None:
         self._aliases = aliases or HEADER_ALIASES
         self._alias_to_canonical: dict[str, str] = {}
         for canonical, alias_list in self._aliases.items():
             for alias in alias_list:
                 self._alias_to_canonical[normalize_header(alias)] = canonical
+        self._schemas: dict[tuple[Any, ...], SheetSchema] = {}
+
+    def compile(self, headers: Sequence[Any]) -> SheetSchema:
+        """Resolve a header row into a SheetSchema (memoised per header tuple)."""
+        key = tuple(headers)
+        schema = self._schemas.get(key)
+        if schema is None:
+            if len(self._schemas) >= self._SCHEMA_CACHE_SIZE:
+                self._schemas.clear()
+            schema = SheetSchema(key, self._alias_to_canonical)
+            self._schemas[key] = schema
+        return schema
+
+    def compile_row(self, row: dict[str, Any]) -> tuple[SheetSchema, tuple[Any, ...]]:
+        """Split a row dict into its (memoised) schema and a positional value tuple."""
+        keys = [key for key in row if key != "__row__"]
+        return self.compile(keys), tuple(row[key] for key in keys)
 
     def normalize_headers(self, row: dict[str, Any]) -> dict[str, Any]:
         """
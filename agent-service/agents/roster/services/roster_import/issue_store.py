@@ -0,0 +1,119 @@
+"""Server-side store of full issue lists for responses that inline only a few."""
+
+from __future__ import annotations
+
+import json
+import os
+import uuid
+from typing import Any, Dict, List, Optional
+
+from shared.ttl_cache import TTLCache
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def _encoded_size(issues: List[Dict[str, Any]]) -> int:
+    return len(json.dumps(issues, separators=(",", ":")).encode("utf-8"))
+
+
+class IssueStore:
+    """
+    LRU/TTL store of dumped issue lists, keyed by a random result id.
+
+    When a roster response carries only the first N issues, the full list is
+    kept here so the backend can page through it afterwards. Lists are stored
+    as given: JSON-compatible dicts (the ``issues`` part of
+    ``ParseResponse.model_dump(mode="json")``), never mutated after ``put``.
+    The store is per process: with several workers, the page request must
+    reach the worker that parsed the upload.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 64,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 1800.0,
+    ) -> None:
+        self._cache: TTLCache[str, List[Dict[str, Any]]] = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+            size_of=_encoded_size,
+        )
+
+    @classmethod
+    def from_env(cls) -> "IssueStore":
+        """Build from ROSTER_ISSUE_STORE_ENTRIES / _MAX_BYTES / _TTL_SECONDS (0 entries disables)."""
+        ttl = float(os.getenv("ROSTER_ISSUE_STORE_TTL_SECONDS", "1800"))
+        return cls(
+            max_entries=int(os.getenv("ROSTER_ISSUE_STORE_ENTRIES", "64")),
+            max_bytes=int(os.getenv("ROSTER_ISSUE_STORE_MAX_BYTES", str(64 * 1024 * 1024))),
+            ttl_seconds=ttl if ttl > 0 else None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    def put(self, issues: List[Dict[str, Any]], encoded_size: Optional[int] = None) -> Optional[str]:
+        """
+        Store a dumped issue list and return its result id.
+
+        ``encoded_size`` is the list's compact JSON size when the caller has
+        already serialized it; otherwise it is measured here. Returns None
+        when the store is disabled or the list alone exceeds the byte budget,
+        in which case nothing can be paged later.
+        """
+        if not self.enabled:
+            return None
+        result_id = uuid.uuid4().hex
+        if not self._cache.put(result_id, issues, size=encoded_size):
+            return None
+        return result_id
+
+    def page(
+        self,
+        result_id: str,
+        code: Optional[str] = None,
+        column: Optional[str] = None,
+        row_from: Optional[int] = None,
+        row_to: Optional[int] = None,
+        offset: int = 0,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Return one page of a stored issue list, or None if the id is unknown or expired.
+
+        Filters combine: ``code`` and ``column`` match exactly, and the row
+        range is inclusive. ``total`` counts the issues matching the filters.
+        """
+        issues = self._cache.get(result_id)
+        if issues is None:
+            return None
+
+        if code is not None or column is not None or row_from is not None or row_to is not None:
+            issues = [
+                issue
+                for issue in issues
+                if (code is None or issue.get("code") == code)
+                and (column is None or issue.get("column") == column)
+                and (row_from is None or issue.get("row", 0) >= row_from)
+                and (row_to is None or issue.get("row", 0) <= row_to)
+            ]
+
+        offset = max(offset, 0)
+        limit = min(max(limit, 1), MAX_PAGE_SIZE)
+        return {
+            "result_id": result_id,
+            "total": len(issues),
+            "offset": offset,
+            "limit": limit,
+            "issues": issues[offset:offset + limit],
+        }
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
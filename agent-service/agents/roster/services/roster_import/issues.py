@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
 from .models import (
     ParseIssue,
@@ -13,71 +13,148 @@ from .models import (
     ParseResponse,
 )
 
+_ERROR = ParseIssueSeverity.ERROR.value
+_WARNING = ParseIssueSeverity.WARNING.value
 
-def _is_severity(issue: ParseIssue, severity: ParseIssueSeverity) -> bool:
-    return issue.severity == severity or issue.severity == severity.value
+
+def _severity_value(issue: ParseIssue) -> str:
+    # ParseIssue stores the enum value, but model_construct'ed issues may not.
+    severity = issue.severity
+    return severity.value if isinstance(severity, ParseIssueSeverity) else severity
 
 
 def is_blocking_issue(issue: ParseIssue) -> bool:
     """Return True if the issue should block the entire import."""
-    return issue.row == 0 and _is_severity(issue, ParseIssueSeverity.ERROR)
+    return issue.row == 0 and _severity_value(issue) == _ERROR
+
+
+class _IssueGroup:
+    __slots__ = ("code", "column", "severity", "count", "sample_rows", "sample_messages")
+
+    def __init__(self, code: str, column: Optional[str], severity: str) -> None:
+        self.code = code
+        self.column = column
+        self.severity = severity
+        self.count = 0
+        self.sample_rows: list[int] = []
+        self.sample_messages: list[str] = []
+
+
+class IssueAccumulator:
+    """
+    Collects parse issues as they occur and keeps the summary up to date.
+
+    Counts, groups and per-group samples are updated in the same pass as the
+    issue is added, so building the response costs O(groups) rather than
+    several walks over the issue list.
+
+    ``max_issues`` caps how many issues are kept for the ``issues`` detail
+    list; once reached, further issues still update the counts and groups
+    (which stay exact) but are not stored. ``None`` keeps every issue.
+    """
+
+    def __init__(self, sample_size: int = 3, max_issues: Optional[int] = None) -> None:
+        self.sample_size = sample_size
+        self.max_issues = max_issues
+        self.issues: list[ParseIssue] = []
+        self.total = 0
+        self.error_count = 0
+        self.warning_count = 0
+        self.blocking_count = 0
+        self._groups: dict[tuple[str, Optional[str], str], _IssueGroup] = {}
+
+    @property
+    def truncated(self) -> bool:
+        """True if some issues were counted but not kept in ``issues``."""
+        return self.total > len(self.issues)
+
+    def add(self, issue: ParseIssue) -> None:
+        severity = _severity_value(issue)
+        self.total += 1
+        if severity == _ERROR:
+            self.error_count += 1
+            if issue.row == 0:
+                self.blocking_count += 1
+        elif severity == _WARNING:
+            self.warning_count += 1
+
+        key = (issue.code, issue.column, severity)
+        group = self._groups.get(key)
+        if group is None:
+            group = self._groups[key] = _IssueGroup(issue.code, issue.column, severity)
+        group.count += 1
+        if len(group.sample_rows) < self.sample_size:
+            group.sample_rows.append(issue.row)
+            group.sample_messages.append(issue.message)
+
+        if self.max_issues is None or len(self.issues) < self.max_issues:
+            self.issues.append(issue)
+
+    def extend(self, issues: Iterable[ParseIssue]) -> None:
+        for issue in issues:
+            self.add(issue)
+
+    def summary(self) -> ParseResultSummary:
+        if self.blocking_count > 0:
+            status = ParseResultStatus.BLOCKING
+        elif self.error_count > 0:
+            status = ParseResultStatus.ROW_ERROR
+        elif self.warning_count > 0:
+            status = ParseResultStatus.WARNING
+        else:
+            status = ParseResultStatus.OK
+
+        return ParseResultSummary(
+            status=status,
+            total_issues=self.total,
+            error_count=self.error_count,
+            warning_count=self.warning_count,
+            blocking_count=self.blocking_count,
+        )
+
+    def issue_summary(self) -> list[IssueGroupSummary]:
+        # Errors first, then by descending count; ties keep first-seen order.
+        groups = sorted(
+            self._groups.values(),
+            key=lambda group: (0 if group.severity == _ERROR else 1, -group.count, group.code),
+        )
+        return [
+            IssueGroupSummary(
+                code=group.code,
+                column=group.column,
+                severity=group.severity,
+                count=group.count,
+                sample_rows=list(group.sample_rows),
+                sample_messages=list(group.sample_messages),
+            )
+            for group in groups
+        ]
+
+    def build_response(self, result: Any) -> ParseResponse:
+        return ParseResponse(
+            result=result,
+            issues=self.issues,
+            summary=self.summary(),
+            issue_summary=self.issue_summary(),
+        )
 
 
 def build_summary(issues: list[ParseIssue]) -> ParseResultSummary:
-    error_count = sum(1 for issue in issues if _is_severity(issue, ParseIssueSeverity.ERROR))
-    warning_count = sum(1 for issue in issues if _is_severity(issue, ParseIssueSeverity.WARNING))
-    blocking_count = sum(1 for issue in issues if is_blocking_issue(issue))
-
-    if blocking_count > 0:
-        status = ParseResultStatus.BLOCKING
-    elif error_count > 0:
-        status = ParseResultStatus.ROW_ERROR
-    elif warning_count > 0:
-        status = ParseResultStatus.WARNING
-    else:
-        status = ParseResultStatus.OK
-
-    return ParseResultSummary(
-        status=status,
-        total_issues=len(issues),
-        error_count=error_count,
-        warning_count=warning_count,
-        blocking_count=blocking_count,
-    )
+    accumulator = IssueAccumulator()
+    accumulator.extend(issues)
+    return accumulator.summary()
 
 
 def build_issue_summary(
     issues: list[ParseIssue],
     sample_size: int = 3,
 ) -> list[IssueGroupSummary]:
-    groups: dict[tuple[str, Optional[str], ParseIssueSeverity], IssueGroupSummary] = {}
-    for issue in issues:
-        key = (issue.code, issue.column, issue.severity)
-        group = groups.get(key)
-        if group is None:
-            group = IssueGroupSummary(
-                code=issue.code,
-                column=issue.column,
-                severity=issue.severity,
-                count=0,
-                sample_rows=[],
-                sample_messages=[],
-            )
-            groups[key] = group
-        group.count += 1
-        if len(group.sample_rows) < sample_size:
-            group.sample_rows.append(issue.row)
-        if len(group.sample_messages) < sample_size:
-            group.sample_messages.append(issue.message)
-
-    def sort_key(group: IssueGroupSummary) -> tuple[int, int, str]:
-        severity_rank = 0 if group.severity in (ParseIssueSeverity.ERROR, ParseIssueSeverity.ERROR.value) else 1
-        return (severity_rank, -group.count, group.code)
-
-    return sorted(groups.values(), key=sort_key)
+    accumulator = IssueAccumulator(sample_size=sample_size)
+    accumulator.extend(issues)
+    return accumulator.issue_summary()
 
 
 def build_response(result: Any, issues: list[ParseIssue]) -> ParseResponse:
-    summary = build_summary(issues)
-    issue_summary = build_issue_summary(issues)
-    return ParseResponse(result=result, issues=issues, summary=summary, issue_summary=issue_summary)
+    accumulator = IssueAccumulator()
+    accumulator.extend(issues)
+    return accumulator.build_response(result)
@@ -0,0 +1,137 @@
+"""Row, error and wall-clock budgets that stop a parse early."""
+
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from typing import Optional
+
+from .models import ParseIssue, ParseIssueSeverity
+
+ROW_LIMIT_EXCEEDED = "ROW_LIMIT_EXCEEDED"
+ERROR_LIMIT_EXCEEDED = "ERROR_LIMIT_EXCEEDED"
+TIME_LIMIT_EXCEEDED = "TIME_LIMIT_EXCEEDED"
+PARSE_CANCELLED = "PARSE_CANCELLED"
+
+
+@dataclass(frozen=True)
+class ParseLimits:
+    """
+    Budgets for one parse; ``None`` means unlimited.
+
+    ``max_rows`` counts data rows, ``max_errors`` counts row errors (so
+    ``max_errors=1`` fails fast on the first bad row, which suits STRICT
+    mode), and ``max_seconds`` is wall-clock time from the start of the parse.
+    When one is hit the parse stops, keeps what it has parsed so far and adds
+    a row-0 error, which makes the response BLOCKING.
+
+    ``cancel`` is a per-job event set by whoever is waiting on the parse
+    (see RosterParseExecutor.run); once set, the parse stops at the next row.
+    """
+
+    max_rows: Optional[int] = None
+    max_errors: Optional[int] = None
+    max_seconds: Optional[float] = None
+    cancel: Optional[threading.Event] = field(default=None, compare=False, repr=False)
+
+    @classmethod
+    def from_env(cls) -> "ParseLimits":
+        """Build from ROSTER_PARSE_ROW_LIMIT / _ERROR_LIMIT / _TIME_LIMIT_SECONDS (unset or 0: unlimited)."""
+        rows = int(os.getenv("ROSTER_PARSE_ROW_LIMIT", "0") or 0)
+        errors = int(os.getenv("ROSTER_PARSE_ERROR_LIMIT", "0") or 0)
+        seconds = float(os.getenv("ROSTER_PARSE_TIME_LIMIT_SECONDS", "0") or 0)
+        return cls(
+            max_rows=rows if rows > 0 else None,
+            max_errors=errors if errors > 0 else None,
+            max_seconds=seconds if seconds > 0 else None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return (
+            self.max_rows is not None
+            or self.max_errors is not None
+            or self.max_seconds is not None
+            or self.cancel is not None
+        )
+
+
+NO_LIMITS = ParseLimits()
+
+
+class RowBudget:
+    """
+    Checks ParseLimits from inside a parse loop.
+
+    ``before_row`` is called before a row is parsed and ``after_row`` once its
+    issues are recorded; each returns the blocking issue to add and stop on,
+    or None to carry on. Unset limits cost one ``is None`` test per call.
+    """
+
+    __slots__ = ("limits", "rows", "deadline")
+
+    def __init__(self, limits: ParseLimits, started: Optional[float] = None) -> None:
+        self.limits = limits
+        self.rows = 0
+        if limits.max_seconds is None:
+            self.deadline: Optional[float] = None
+        else:
+            self.deadline = (time.perf_counter() if started is None else started) + limits.max_seconds
+
+    def before_row(self, row: int) -> Optional[ParseIssue]:
+        self.rows += 1
+        max_rows = self.limits.max_rows
+        if max_rows is not None and self.rows > max_rows:
+            return _limit_issue(
+                ROW_LIMIT_EXCEEDED,
+                f"Parse stopped at row {row}: the file has more than {max_rows} data rows",
+                row,
+                max_rows,
+                "Split the roster into smaller files",
+            )
+        if self.deadline is not None and time.perf_counter() > self.deadline:
+            return _limit_issue(
+                TIME_LIMIT_EXCEEDED,
+                f"Parse stopped at row {row}: it took longer than {self.limits.max_seconds:g} seconds",
+                row,
+                self.limits.max_seconds,
+                "Split the roster into smaller files",
+            )
+        cancel = self.limits.cancel
+        if cancel is not None and cancel.is_set():
+            return _limit_issue(
+                PARSE_CANCELLED,
+                f"Parse stopped at row {row}: the request gave up waiting for it",
+                row,
+                None,
+                "Upload the file again",
+            )
+        return None
+
+    def after_row(self, row: int, error_count: int) -> Optional[ParseIssue]:
+        max_errors = self.limits.max_errors
+        if max_errors is not None and error_count >= max_errors:
+            return _limit_issue(
+                ERROR_LIMIT_EXCEEDED,
+                f"Parse stopped after row {row}: {error_count} rows have errors (limit {max_errors})",
+                row,
+                max_errors,
+                "Fix the reported rows and upload the file again",
+            )
+        return None
+
+
+def _limit_issue(code: str, message: str, row: int, limit: Optional[float], hint: str) -> ParseIssue:
+    # Row 0 marks the issue as file-level, so the summary status is BLOCKING;
+    # the sheet row where parsing stopped is kept in ``detail``.
+    return ParseIssue(
+        row=0,
+        severity=ParseIssueSeverity.ERROR,
+        code=code,
+        message=message,
+        value=None if limit is None else f"{limit:g}",
+        hint=hint,
+        detail=f"stopped_at_row={row}",
+    )
@@ -4,14 +4,20 @@ Pydantic models and enums for roster import.
 
 from __future__ import annotations
 
-from typing import Any, Optional
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Annotated, Any, Iterable, Optional, Union
 from datetime import date, time, datetime, timedelta
 from enum import Enum
 from decimal import Decimal
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, computed_field
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, PlainSerializer, PrivateAttr, computed_field, model_serializer
 from pydantic.alias_generators import to_camel
 
+# Hours go to the backend as JSON numbers, as jsonable_encoder has always sent
+# them; model_dump() (python mode) still returns Decimal.
+JsonDecimal = Annotated[Decimal, PlainSerializer(float, return_type=float, when_used="json")]
+
 
 class ParseIssueSeverity(Enum):
     """Severity level for parse issues."""
@@ -33,6 +39,13 @@ class ParseMode(Enum):
     LENIENT = "lenient"
 
 
+class RawRowsMode(Enum):
+    """How ``raw_rows`` (the display copy of each sheet row) is returned."""
+    FULL = "full"  # one dict per row
+    NONE = "none"  # not built; raw_rows is []
+    COLUMNAR = "columnar"  # a RawRowTable: column names once, then value lists
+
+
 class ParseIssue(BaseModel):
     """Represents a parsing issue (error or warning)."""
     model_config = ConfigDict(
@@ -45,11 +58,21 @@ class ParseIssue(BaseModel):
     code: str
     message: str
     row: int
+    sheet: Optional[str] = None
     column: Optional[str] = None
     value: Optional[str] = None
     hint: Optional[str] = None
     detail: Optional[str] = None
 
+    @model_serializer(mode="wrap")
+    def _omit_unset_sheet(self, handler):
+        # ``sheet`` is only set by batch imports; single-file responses keep
+        # their original shape without a "sheet": null on every issue.
+        data = handler(self)
+        if self.sheet is None:
+            data.pop("sheet", None)
+        return data
+
 
 class ParseIssueError(Exception):
     """Exception wrapper for row-level parse issues."""
@@ -64,6 +87,9 @@ class RosterEntry(BaseModel):
     model_config = ConfigDict(
         alias_generator=to_camel,
         populate_by_name=True,
+        # Immutable so the memoised hours below (and roster totals) cannot go
+        # stale; use model_copy(update=...) for a changed entry.
+        frozen=True,
     )
 
     excel_row: int
@@ -85,9 +111,11 @@ class RosterEntry(BaseModel):
     location: Optional[str] = None
     notes: Optional[str] = None
 
+    # Derived values are memoised on first access (entries are frozen), so
+    # repeated dumps don't redo the Decimal arithmetic.
     @computed_field
-    @property
-    def duration_hours(self) -> Decimal:
+    @cached_property
+    def duration_hours(self) -> JsonDecimal:
         """
         Shift duration in hours (gross, before breaks).
         Handles overnight shifts (e.g., 22:00 - 06:00 = 8 hours).
@@ -100,13 +128,52 @@ class RosterEntry(BaseModel):
         return Decimal(str(duration.total_seconds() / 3600)).quantize(Decimal("0.01"))
 
     @computed_field
-    @property
-    def net_hours(self) -> Decimal:
+    @cached_property
+    def net_hours(self) -> JsonDecimal:
         """Net working hours (duration minus breaks)."""
         total_break_minutes = (self.meal_break_duration or 0) + (self.rest_breaks_duration or 0)
         break_hours = Decimal(str(total_break_minutes / 60))
         return (self.duration_hours - break_hours).quantize(Decimal("0.01"))
 
+    def model_copy(self, *, update: Optional[dict[str, Any]] = None, deep: bool = False) -> "RosterEntry":
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            # Drop memoised hours so they are recomputed from the new fields.
+            copied.__dict__.pop("duration_hours", None)
+            copied.__dict__.pop("net_hours", None)
+        return copied
+
+
+@dataclass
+class RosterAggregates:
+    """Roster-level totals, accumulated one entry at a time."""
+    entry_count: int = 0
+    week_start_date: Optional[date] = None
+    week_end_date: Optional[date] = None
+    total_hours: Decimal = Decimal("0.00")
+    employee_keys: set[str] = field(default_factory=set)
+
+    def add(self, entry: RosterEntry) -> None:
+        self.entry_count += 1
+        if self.week_start_date is None or entry.date < self.week_start_date:
+            self.week_start_date = entry.date
+        if self.week_end_date is None or entry.date > self.week_end_date:
+            self.week_end_date = entry.date
+        self.total_hours += entry.duration_hours
+        if entry.employee_number:
+            self.employee_keys.add(f"num:{entry.employee_number.strip().lower()}")
+        elif entry.employee_email:
+            self.employee_keys.add(f"email:{str(entry.employee_email).strip().lower()}")
+        else:
+            self.employee_keys.add("unknown")
+
+    @classmethod
+    def from_entries(cls, entries: Iterable[RosterEntry]) -> "RosterAggregates":
+        aggregates = cls()
+        for entry in entries:
+            aggregates.add(entry)
+        return aggregates
+
 
 class EmployeeEntry(BaseModel):
     """Represents a single employee entry parsed from Excel."""
@@ -123,6 +190,16 @@ class EmployeeEntry(BaseModel):
     start_date: Optional[date] = None
 
 
+class RawRowTable(BaseModel):
+    """Columnar raw rows: ``rows[i][j]`` is the value of ``columns[j]`` in row i."""
+
+    columns: list[str]
+    rows: list[list[Any]] = Field(default_factory=list)
+
+
+RawRows = Union[list[dict[str, Any]], RawRowTable]
+
+
 class EmployeeParseResult(BaseModel):
     """Result of parsing an employee Excel file."""
     model_config = ConfigDict(
@@ -131,7 +208,7 @@ class EmployeeParseResult(BaseModel):
     )
 
     entries: list[EmployeeEntry]
-    raw_rows: list[dict[str, Any]]
+    raw_rows: RawRows
 
 
 class RosterParseResult(BaseModel):
@@ -146,23 +223,50 @@ class RosterParseResult(BaseModel):
     )
 
     entries: list[RosterEntry]
-    raw_rows: list[dict[str, Any]]
+    raw_rows: RawRows
+
+    _aggregates: Optional[RosterAggregates] = PrivateAttr(default=None)
+    # The entries the cached totals were computed from, in order.
+    _aggregated: tuple[RosterEntry, ...] = PrivateAttr(default=())
+
+    def set_aggregates(self, aggregates: RosterAggregates) -> None:
+        """Attach totals the parser already accumulated while building ``entries``."""
+        self._aggregates = aggregates
+        self._aggregated = tuple(self.entries)
+
+    @property
+    def aggregates(self) -> RosterAggregates:
+        """
+        Roster totals, computed in one pass over ``entries`` and cached.
+
+        Entries are frozen, so the totals are stale only if the list itself
+        changed: they are recomputed whenever an entry was added, removed or
+        replaced (or ``entries`` reassigned) since they were cached.
+        """
+        aggregates = self._aggregates
+        if aggregates is None or not self._same_entries():
+            aggregates = RosterAggregates.from_entries(self.entries)
+            self._aggregates = aggregates
+            self._aggregated = tuple(self.entries)
+        return aggregates
+
+    def _same_entries(self) -> bool:
+        entries, aggregated = self.entries, self._aggregated
+        return len(entries) == len(aggregated) and all(
+            entry is cached for entry, cached in zip(entries, aggregated)
+        )
 
     @computed_field
     @property
     def week_start_date(self) -> Optional[date]:
         """Earliest shift date in the roster."""
-        if not self.entries:
-            return None
-        return min(entry.date for entry in self.entries)
+        return self.aggregates.week_start_date
 
     @computed_field
     @property
     def week_end_date(self) -> Optional[date]:
         """Latest shift date in the roster."""
-        if not self.entries:
-            return None
-        return max(entry.date for entry in self.entries)
+        return self.aggregates.week_end_date
 
     @computed_field
     @property
@@ -172,29 +276,15 @@ class RosterParseResult(BaseModel):
 
     @computed_field
     @property
-    def total_hours(self) -> Decimal:
+    def total_hours(self) -> JsonDecimal:
         """Total gross hours across all shifts."""
-        if not self.entries:
-            return Decimal("0.00")
-        total = sum((entry.duration_hours for entry in self.entries), Decimal("0.00"))
-        return total.quantize(Decimal("0.01"))
+        return self.aggregates.total_hours.quantize(Decimal("0.01"))
 
     @computed_field
     @property
     def unique_employees(self) -> int:
         """Number of unique employees in the roster."""
-        if not self.entries:
-            return 0
-        keys: set[str] = set()
-        for entry in self.entries:
-            if entry.employee_number:
-                keys.add(f"num:{entry.employee_number.strip().lower()}")
-                continue
-            if entry.employee_email:
-                keys.add(f"email:{str(entry.employee_email).strip().lower()}")
-                continue
-            keys.add("unknown")
-        return len(keys)
+        return len(self.aggregates.employee_keys)
 
 
 class IssueGroupSummary(BaseModel):
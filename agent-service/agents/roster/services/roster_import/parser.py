@@ -2,15 +2,21 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
-from datetime import date, time, datetime
-from pathlib import Path
+from concurrent.futures import Executor
+from typing import Any, Generator, Iterator, Optional, Sequence
+from time import perf_counter
 
 from fastapi import UploadFile
 
-from .excel_reader import read_excel
-from .header_map import HeaderMap, EXTRA_KEY
-from .issues import build_response
+from .context import ParseContext
+from .csv_reader import read_csv
+from .diagnostics import NO_DIAGNOSTICS, ParseDiagnostics
+from .excel_reader import iter_excel, read_excel
+from .header_map import HeaderMap, SheetSchema
+from .issues import IssueAccumulator, build_response
+from .limits import NO_LIMITS, ParseLimits, RowBudget
+from .readers import RowSource, iter_rows, open_rows
+from .uploads import spool_upload
 from .models import (
     EmployeeParseResult,
     ParseIssue,
@@ -18,15 +24,17 @@ from .models import (
     ParseIssueSeverity,
     ParseMode,
     ParseResponse,
+    RawRowsMode,
+    RawRowTable,
+    RosterAggregates,
     RosterParseResult,
 )
-from .row_parsers import parse_employee_row, parse_roster_row
-from .utils import build_raw_row
+from .row_parsers import parse_employee_values, parse_roster_values
 
 
 class RosterExcelParser:
     """
-    Parses roster Excel files into typed shift entries.
+    Parses roster Excel files (and CSV/TSV exports) into typed shift entries.
     """
 
     ROSTER_REQUIRED_KEYS = ["employee_number", "date", "start_time", "end_time"]
@@ -40,8 +48,33 @@ class RosterExcelParser:
         file_path: str,
         sheet_name: Optional[str] = None,
         header_row: Optional[int] = None,
+        values_only: bool = False,
     ) -> list[dict[str, Any]]:
-        return read_excel(file_path, sheet_name, header_row=header_row)
+        """
+        Read a sheet into row dicts.
+
+        ``values_only=True`` selects the faster reader built on
+        ``iter_rows(values_only=True)``; the returned rows are identical.
+        """
+        return read_excel(file_path, sheet_name, header_row=header_row, values_only=values_only)
+
+    def iter_excel(
+        self,
+        file_path: str,
+        sheet_name: Optional[str] = None,
+        header_row: Optional[int] = None,
+        values_only: bool = False,
+    ) -> Iterator[dict[str, Any]]:
+        return iter_excel(file_path, sheet_name, header_row=header_row, values_only=values_only)
+
+    def read_csv(
+        self,
+        file_path: str,
+        header_row: Optional[int] = None,
+        delimiter: Optional[str] = None,
+    ) -> list[dict[str, Any]]:
+        """Read a CSV/TSV file into row dicts shaped like ``read_excel`` output."""
+        return read_csv(file_path, header_row=header_row, delimiter=delimiter)
 
     def validate_headers(
         self,
@@ -63,106 +96,219 @@ class RosterExcelParser:
 
     def parse_roster_excel(
         self,
-        file_path: str,
+        file_path: RowSource,
         sheet_name: Optional[str] = None,
         header_row: Optional[int] = None,
         mode: ParseMode = ParseMode.LENIENT,
+        file_name: Optional[str] = None,
+        max_issues: Optional[int] = None,
+        raw_rows: RawRowsMode | str = RawRowsMode.FULL,
+        diagnostics: Optional[ParseDiagnostics] = None,
+        limits: ParseLimits = NO_LIMITS,
     ) -> ParseResponse:
+        """
+        Parse a roster sheet into entries and issues.
+
+        ``file_path`` may be a path, the upload's bytes or a seekable binary
+        stream; for the latter two ``file_name`` supplies the original suffix.
+        ``max_issues`` caps the detailed ``issues`` list; summary counts and
+        groups always cover every issue. ``raw_rows`` selects how the display
+        copy of each row is returned (see ``RawRowsMode``). ``diagnostics``
+        collects per-stage timings and counters when given. ``limits`` stops
+        the parse early on too many rows, errors or seconds (see ``ParseLimits``).
+        """
+        started = perf_counter()
         mode = self._coerce_mode(mode)
-        data, error_response = self._read_and_validate_excel(
-            file_path, sheet_name, header_row, self.ROSTER_REQUIRED_KEYS, RosterParseResult
+        raw_rows_mode = RawRowsMode(raw_rows)
+        diagnostics = diagnostics or NO_DIAGNOSTICS
+        schema, rows, error_response = self._read_and_validate_excel(
+            file_path,
+            sheet_name,
+            header_row,
+            self.ROSTER_REQUIRED_KEYS,
+            RosterParseResult,
+            file_name=file_name,
+            diagnostics=diagnostics,
         )
         if error_response:
             return error_response
 
         entries = []
-        issues: list[ParseIssue] = []
-        raw_rows: list[dict[str, Any]] = []
+        aggregates = RosterAggregates()
+        issues = IssueAccumulator(max_issues=max_issues)
+        raw_row_list: list[Any] = []
+        build_raw = self._raw_row_builder(schema, raw_rows_mode)
+        context = ParseContext()
+        budget = RowBudget(limits, started) if limits.enabled else None
 
-        for row in data:
-            real_row = row.get("__row__", 0)
-            normalized = self._header_map.normalize_headers(row)
-            raw_rows.append(build_raw_row(normalized, real_row, EXTRA_KEY))
+        # Rows are pulled from the reader one at a time; only the parsed
+        # entries are retained, and roster totals are accumulated as they are.
+        with diagnostics.stage("parse_rows", exclude="read_rows"):
             try:
-                entry, row_warnings = parse_roster_row(row, real_row, self._header_map, mode=mode)
-                entries.append(entry)
-                issues.extend(row_warnings)
+                for real_row, values in rows:
+                    if budget is not None and self._stop(budget.before_row(real_row), issues):
+                        break
+                    if build_raw is not None:
+                        raw_row_list.append(build_raw(values, real_row))
+                    try:
+                        entry, row_warnings = parse_roster_values(values, real_row, schema, mode=mode, context=context)
+                        entries.append(entry)
+                        aggregates.add(entry)
+                        issues.extend(row_warnings)
+                    except ParseIssueError as exc:
+                        issues.add(exc.issue)
+                    except Exception as exc:
+                        issues.add(
+                            ParseIssue(
+                                row=real_row,
+                                severity=ParseIssueSeverity.ERROR,
+                                code="ROW_PARSE_ERROR",
+                                message=str(exc),
+                            )
+                        )
+                    if budget is not None and self._stop(budget.after_row(real_row, issues.error_count), issues):
+                        break
             except ParseIssueError as exc:
-                issues.append(exc.issue)
-            except Exception as exc:
-                issues.append(
-                    ParseIssue(
-                        row=real_row,
-                        severity=ParseIssueSeverity.ERROR,
-                        code="ROW_PARSE_ERROR",
-                        message=str(exc),
-                    )
-                )
+                # A read failure part-way through the file (see _prepend).
+                issues.add(exc.issue)
+            finally:
+                rows.close()
+
+        # Entries are already validated; wrap them without a second pass.
+        with diagnostics.stage("build_result"):
+            raw_rows = self._pack_raw_rows(schema, raw_rows_mode, raw_row_list)
+            result = RosterParseResult.model_construct(entries=entries, raw_rows=raw_rows)
+            result.set_aggregates(aggregates)
+
+        with diagnostics.stage("build_response"):
+            response = issues.build_response(result)
+        self._count_results(diagnostics, response)
+        return response
 
-        return build_response(RosterParseResult(entries=entries, raw_rows=raw_rows), issues)
+    def parse_roster_batch(
+        self,
+        file_paths: Sequence[str],
+        sheet_name: Optional[str] = None,
+        header_row: Optional[int] = None,
+        mode: ParseMode = ParseMode.LENIENT,
+        all_sheets: bool = True,
+        max_workers: Optional[int] = None,
+        executor: Optional[Executor] = None,
+    ) -> ParseResponse:
+        """
+        Parse several roster files, or every sheet of a workbook, in a process pool.
+
+        Results are merged into a single ParseResponse; issues are tagged with
+        the sheet they came from. See ``batch.parse_roster_batch``.
+        """
+        from .batch import parse_roster_batch
+
+        return parse_roster_batch(
+            file_paths,
+            sheet_name=sheet_name,
+            header_row=header_row,
+            mode=self._coerce_mode(mode),
+            all_sheets=all_sheets,
+            max_workers=max_workers,
+            executor=executor,
+        )
 
     def parse_employee_excel(
         self,
-        file_path: str,
+        file_path: RowSource,
         sheet_name: Optional[str] = None,
         header_row: Optional[int] = None,
         mode: ParseMode = ParseMode.LENIENT,
+        file_name: Optional[str] = None,
+        max_issues: Optional[int] = None,
+        raw_rows: RawRowsMode | str = RawRowsMode.FULL,
+        limits: ParseLimits = NO_LIMITS,
     ) -> ParseResponse:
+        started = perf_counter()
         mode = self._coerce_mode(mode)
-        data, error_response = self._read_and_validate_excel(
-            file_path, sheet_name, header_row, self.EMPLOYEE_REQUIRED_KEYS, EmployeeParseResult
+        raw_rows_mode = RawRowsMode(raw_rows)
+        schema, rows, error_response = self._read_and_validate_excel(
+            file_path, sheet_name, header_row, self.EMPLOYEE_REQUIRED_KEYS, EmployeeParseResult, file_name=file_name
         )
         if error_response:
             return error_response
 
         entries = []
-        issues: list[ParseIssue] = []
-        raw_rows: list[dict[str, Any]] = []
+        issues = IssueAccumulator(max_issues=max_issues)
+        raw_row_list: list[Any] = []
+        build_raw = self._raw_row_builder(schema, raw_rows_mode)
+        context = ParseContext()
+        budget = RowBudget(limits, started) if limits.enabled else None
 
-        for row in data:
-            real_row = row.get("__row__", 0)
-            try:
-                normalized = self._header_map.normalize_headers(row)
-                raw_rows.append(build_raw_row(normalized, real_row, EXTRA_KEY))
-                entry, row_warnings = parse_employee_row(row, real_row, self._header_map, mode=mode)
-                entries.append(entry)
-                issues.extend(row_warnings)
-            except ParseIssueError as exc:
-                issues.append(exc.issue)
-            except Exception as exc:
-                issues.append(
-                    ParseIssue(
-                        row=real_row,
-                        severity=ParseIssueSeverity.ERROR,
-                        code="ROW_PARSE_ERROR",
-                        message=str(exc),
+        try:
+            for real_row, values in rows:
+                if budget is not None and self._stop(budget.before_row(real_row), issues):
+                    break
+                try:
+                    if build_raw is not None:
+                        raw_row_list.append(build_raw(values, real_row))
+                    entry, row_warnings = parse_employee_values(values, real_row, schema, mode=mode, context=context)
+                    entries.append(entry)
+                    issues.extend(row_warnings)
+                except ParseIssueError as exc:
+                    issues.add(exc.issue)
+                except Exception as exc:
+                    issues.add(
+                        ParseIssue(
+                            row=real_row,
+                            severity=ParseIssueSeverity.ERROR,
+                            code="ROW_PARSE_ERROR",
+                            message=str(exc),
+                        )
                     )
-                )
+                if budget is not None and self._stop(budget.after_row(real_row, issues.error_count), issues):
+                    break
+        except ParseIssueError as exc:
+            issues.add(exc.issue)
+        finally:
+            rows.close()
 
-        return build_response(EmployeeParseResult(entries=entries, raw_rows=raw_rows), issues)
+        raw_rows = self._pack_raw_rows(schema, raw_rows_mode, raw_row_list)
+        return issues.build_response(EmployeeParseResult(entries=entries, raw_rows=raw_rows))
 
     async def parse_excel(
         self,
         file: UploadFile,
         header_row: Optional[int] = None,
     ) -> list[dict[str, Any]]:
-        import os
-        import tempfile
+        with await spool_upload(file) as stream:
+            return list(iter_rows(stream, header_row=header_row, file_name=file.filename))
 
-        suffix = Path(file.filename).suffix if file.filename else ".xlsx"
-        tmp_path: Optional[str] = None
-        try:
-            with tempfile.NamedTemporaryFile(delete=False, suffix=suffix) as tmp:
-                tmp_path = tmp.name
-                content = await file.read()
-                tmp.write(content)
-            return self.read_excel(tmp_path, header_row=header_row)
-        finally:
-            if tmp_path:
-                try:
-                    os.unlink(tmp_path)
-                except FileNotFoundError:
-                    pass
+    @staticmethod
+    def _stop(limit_issue: Optional[ParseIssue], issues: IssueAccumulator) -> bool:
+        if limit_issue is None:
+            return False
+        issues.add(limit_issue)
+        return True
+
+    @staticmethod
+    def _count_results(diagnostics: ParseDiagnostics, response: ParseResponse) -> None:
+        if not diagnostics.enabled:
+            return
+        summary = response.summary
+        diagnostics.count("entries", len(response.result.entries))
+        diagnostics.count("issues", summary.total_issues)
+        diagnostics.count("errors", summary.error_count)
+        diagnostics.count("warnings", summary.warning_count)
+
+    @staticmethod
+    def _raw_row_builder(schema: SheetSchema, raw_rows: RawRowsMode):
+        if raw_rows is RawRowsMode.FULL:
+            return schema.build_raw_row
+        if raw_rows is RawRowsMode.COLUMNAR:
+            return schema.build_raw_values
+        return None
+
+    @staticmethod
+    def _pack_raw_rows(schema: SheetSchema, raw_rows: RawRowsMode, built: list[Any]) -> Any:
+        if raw_rows is RawRowsMode.COLUMNAR:
+            return RawRowTable.model_construct(columns=list(schema.raw_row_columns), rows=built)
+        return built
 
     def _coerce_mode(self, mode: ParseMode | str) -> ParseMode:
         if isinstance(mode, ParseMode):
@@ -171,19 +317,32 @@ class RosterExcelParser:
 
     def _read_and_validate_excel(
         self,
-        file_path: str,
+        file_path: RowSource,
         sheet_name: Optional[str],
         header_row: Optional[int],
         required_keys: list[str],
         result_class: type,
-    ) -> tuple[Optional[list[dict[str, Any]]], Optional[ParseResponse]]:
+        file_name: Optional[str] = None,
+        diagnostics: ParseDiagnostics = NO_DIAGNOSTICS,
+    ) -> tuple[
+        Optional[SheetSchema],
+        Optional[Generator[tuple[int, tuple[Any, ...]], None, None]],
+        Optional[ParseResponse],
+    ]:
         """
-        Common logic for reading and validating Excel files.
+        Common logic for reading and validating Excel and CSV/TSV files.
 
-        Returns (data, error_response). If error_response is not None, caller should return it.
+        Returns (schema, rows, error_response). If error_response is not None, caller
+        should return it. The header row is compiled into a SheetSchema once; only
+        the first data row is read eagerly, and the returned iterator yields it
+        followed by the remaining ``(excel_row, values)`` pairs as they are read.
         """
         try:
-            data = self.read_excel(file_path, sheet_name, header_row=header_row)
+            headers, row_iter = open_rows(
+                file_path, sheet_name, header_row=header_row, file_name=file_name, diagnostics=diagnostics
+            )
+            row_iter = diagnostics.timed_rows("read_rows", row_iter)
+            first_row = next(row_iter, None)
         except FileNotFoundError as exc:
             issues = [
                 ParseIssue(
@@ -193,7 +352,7 @@ class RosterExcelParser:
                     message=str(exc),
                 )
             ]
-            return None, build_response(result_class(entries=[], raw_rows=[]), issues)
+            return None, None, build_response(result_class(entries=[], raw_rows=[]), issues)
         except (ValueError, OSError) as exc:
             code = "INVALID_HEADER_ROW" if "Header row not found" in str(exc) else "FILE_READ_ERROR"
             issues = [
@@ -204,9 +363,9 @@ class RosterExcelParser:
                     message=str(exc),
                 )
             ]
-            return None, build_response(result_class(entries=[], raw_rows=[]), issues)
+            return None, None, build_response(result_class(entries=[], raw_rows=[]), issues)
 
-        if not data:
+        if first_row is None:
             issues = [
                 ParseIssue(
                     row=0,
@@ -215,10 +374,13 @@ class RosterExcelParser:
                     message="Excel file is empty or contains no data rows",
                 )
             ]
-            return None, build_response(result_class(entries=[], raw_rows=[]), issues)
+            return None, None, build_response(result_class(entries=[], raw_rows=[]), issues)
 
-        is_valid, missing = self.validate_headers(data, required_keys)
-        if not is_valid:
+        with diagnostics.stage("schema"):
+            schema = self._header_map.compile(headers)
+            missing = schema.missing_keys(required_keys)
+        if missing:
+            row_iter.close()
             issues = [
                 ParseIssue(
                     row=0,
@@ -227,6 +389,26 @@ class RosterExcelParser:
                     message=f"Missing required columns: {', '.join(missing)}",
                 )
             ]
-            return None, build_response(result_class(entries=[], raw_rows=[]), issues)
+            return None, None, build_response(result_class(entries=[], raw_rows=[]), issues)
 
-        return data, None
+        return schema, _prepend(first_row, row_iter), None
+
+
+def _prepend(first: Any, rest: Generator[Any, None, None]) -> Generator[Any, None, None]:
+    # Unlike itertools.chain, closing this generator closes the reader too.
+    # Reader errors after the first row surface as a FILE_READ_ERROR issue.
+    try:
+        yield first
+        try:
+            yield from rest
+        except (ValueError, OSError) as exc:
+            raise ParseIssueError(
+                ParseIssue(
+                    row=0,
+                    severity=ParseIssueSeverity.ERROR,
+                    code="FILE_READ_ERROR",
+                    message=str(exc),
+                )
+            ) from exc
+    finally:
+        rest.close()
@@ -0,0 +1,189 @@
+"""Dispatch roster files to the Excel or CSV reader by suffix or content."""
+
+from __future__ import annotations
+
+import codecs
+import io
+from pathlib import Path
+from typing import Any, BinaryIO, Generator, Iterator, Optional, Union
+
+from .csv_reader import CSV_DELIMITERS, open_csv_rows
+from .diagnostics import NO_DIAGNOSTICS, ParseDiagnostics
+from .excel_reader import iter_row_dicts, list_worksheets, open_excel_rows, open_workbook_rows
+
+# A path on disk, raw upload bytes, or a seekable binary stream.
+RowSource = Union[str, bytes, bytearray, BinaryIO]
+
+FORMAT_XLSX = "xlsx"
+FORMAT_CSV = "csv"
+
+# Suffixes read as delimited text; .txt exports have their delimiter sniffed.
+_TEXT_SUFFIXES = frozenset(CSV_DELIMITERS) | {".txt"}
+
+_ZIP_SIGNATURE = b"PK\x03\x04"
+_OLE_SIGNATURE = b"\xd0\xcf\x11\xe0"
+_SNIFF_BYTES = 4096
+
+
+def _looks_like_text(head: bytes) -> bool:
+    if b"\x00" in head:
+        return False
+    try:
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=False)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def detect_format(file_path: Union[str, BinaryIO], file_name: Optional[str] = None) -> str:
+    """
+    Return FORMAT_XLSX or FORMAT_CSV for a roster file.
+
+    Known suffixes win (from ``file_name`` for streams); otherwise the first
+    bytes are sniffed: zip archives are read as .xlsx, and files without a
+    suffix are read as CSV when they look like UTF-8 text. Legacy binary .xls
+    workbooks and any other suffix are rejected. A stream's position is left
+    unchanged.
+    """
+    is_path = isinstance(file_path, (str, Path))
+    name = file_path if is_path else file_name
+    suffix = Path(name).suffix.lower() if name else ""
+    if suffix == ".xlsx":
+        return FORMAT_XLSX
+    if suffix in _TEXT_SUFFIXES:
+        return FORMAT_CSV
+
+    if is_path:
+        with Path(file_path).open("rb") as fh:
+            head = fh.read(_SNIFF_BYTES)
+    else:
+        start = file_path.tell()
+        head = file_path.read(_SNIFF_BYTES)
+        file_path.seek(start)
+    if head.startswith(_ZIP_SIGNATURE):
+        return FORMAT_XLSX
+    if head.startswith(_OLE_SIGNATURE):
+        raise ValueError("Invalid file format. Legacy .xls workbooks are not supported; save as .xlsx or .csv")
+    if suffix or not _looks_like_text(head):
+        raise ValueError(f"Invalid file format. Expected .xlsx, got: {suffix or 'binary data'}")
+    return FORMAT_CSV
+
+
+def source_size(file_path: RowSource) -> Optional[int]:
+    """Size in bytes of a path, bytes or seekable stream; None if unknown."""
+    if isinstance(file_path, (bytes, bytearray)):
+        return len(file_path)
+    if isinstance(file_path, (str, Path)):
+        try:
+            return Path(file_path).stat().st_size
+        except OSError:
+            return None
+    try:
+        start = file_path.tell()
+        end = file_path.seek(0, io.SEEK_END)
+        file_path.seek(start)
+    except (AttributeError, OSError, ValueError):
+        return None
+    return end - start
+
+
+def list_sheets(file_path: str) -> list[Optional[str]]:
+    """
+    Return the worksheet names of a roster file, in workbook order.
+
+    CSV/TSV files have a single unnamed sheet, reported as ``[None]``.
+    """
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    if detect_format(file_path) == FORMAT_CSV:
+        return [None]
+    if path.suffix.lower() == ".xlsx":
+        return list(list_worksheets(file_path))
+    with path.open("rb") as handle:
+        return list(list_worksheets(handle))
+
+
+def open_rows(
+    file_path: RowSource,
+    sheet_name: Optional[str] = None,
+    header_row: Optional[int] = None,
+    file_name: Optional[str] = None,
+    diagnostics: ParseDiagnostics = NO_DIAGNOSTICS,
+) -> tuple[list[Any], Generator[tuple[int, tuple[Any, ...]], None, None]]:
+    """
+    Open an .xlsx or CSV/TSV roster file and return (headers, rows).
+
+    See ``excel_reader.open_excel_rows`` for the shape of ``rows``. ``sheet_name``
+    only applies to workbooks.
+
+    Besides a path, ``file_path`` may be the upload's bytes or a seekable
+    binary stream (such as ``UploadFile.file``); these are read in place with
+    no temp file, and a stream is left open for its owner. ``file_name`` is
+    the original upload name, used for its suffix. ``diagnostics`` receives
+    the reader's stage timings (``load_csv`` for text files; see
+    ``open_workbook_rows`` for workbooks) and the source size as
+    ``bytes_read``.
+    """
+    if isinstance(file_path, (bytes, bytearray)):
+        file_path = io.BytesIO(file_path)
+    if diagnostics.enabled:
+        size = source_size(file_path)
+        if size is not None:
+            diagnostics.count("bytes_read", size)
+
+    if not isinstance(file_path, (str, Path)):
+        if detect_format(file_path, file_name) == FORMAT_CSV:
+            with diagnostics.stage("load_csv"):
+                return open_csv_rows(file_path, header_row=header_row, file_name=file_name)
+        return open_workbook_rows(
+            file_path, sheet_name, header_row=header_row, values_only=True, diagnostics=diagnostics
+        )
+
+    path = Path(file_path)
+    if not path.exists():
+        raise FileNotFoundError(f"File not found: {file_path}")
+
+    if detect_format(file_path) == FORMAT_CSV:
+        with diagnostics.stage("load_csv"):
+            return open_csv_rows(file_path, header_row=header_row)
+
+    if path.suffix.lower() == ".xlsx":
+        return open_excel_rows(
+            file_path, sheet_name, header_row=header_row, values_only=True, diagnostics=diagnostics
+        )
+
+    # Workbook detected from content under another name: openpyxl refuses
+    # unknown extensions for paths, so hand it the open file instead.
+    handle = path.open("rb")
+    try:
+        headers, rows = open_workbook_rows(
+            handle, sheet_name, header_row=header_row, values_only=True, diagnostics=diagnostics
+        )
+    except BaseException:
+        handle.close()
+        raise
+    return headers, _close_after(rows, handle)
+
+
+def _close_after(
+    rows: Generator[tuple[int, tuple[Any, ...]], None, None],
+    handle: BinaryIO,
+) -> Generator[tuple[int, tuple[Any, ...]], None, None]:
+    try:
+        yield from rows
+    finally:
+        rows.close()
+        handle.close()
+
+
+def iter_rows(
+    file_path: RowSource,
+    sheet_name: Optional[str] = None,
+    header_row: Optional[int] = None,
+    file_name: Optional[str] = None,
+) -> Iterator[dict[str, Any]]:
+    """Lazily yield row dicts (with '__row__') from an .xlsx or CSV/TSV file or stream."""
+    headers, rows = open_rows(file_path, sheet_name, header_row=header_row, file_name=file_name)
+    yield from iter_row_dicts(headers, rows)
@@ -0,0 +1,92 @@
+"""Content-hash cache of serialized roster parse results."""
+
+from __future__ import annotations
+
+import hashlib
+import os
+from pathlib import Path
+from typing import BinaryIO, Dict, Optional, Tuple
+
+from shared.ttl_cache import TTLCache
+
+from .models import ParseMode, RawRowsMode
+
+_HASH_CHUNK_BYTES = 1024 * 1024
+
+# (sha256 of content, mode, header_row, suffix, raw rows mode)
+CacheKey = Tuple[str, str, Optional[int], str, str]
+
+
+def hash_stream(stream: BinaryIO) -> str:
+    """SHA-256 of a seekable stream's content; the stream is rewound afterwards."""
+    start = stream.tell()
+    digest = hashlib.sha256()
+    for chunk in iter(lambda: stream.read(_HASH_CHUNK_BYTES), b""):
+        digest.update(chunk)
+    stream.seek(start)
+    return digest.hexdigest()
+
+
+class ParseResultCache:
+    """
+    LRU/TTL cache of parse results, keyed by upload content.
+
+    The key combines the content hash with everything else that changes the
+    outcome: ParseMode, header_row, the upload's suffix (which picks the
+    reader and CSV delimiter) and the raw rows mode. Values are the
+    ``ParseResponse.model_dump_json()`` bytes the response is built from, so
+    cached results cannot be mutated by callers, the byte budget is exact, and
+    a hit is served without decoding unless its issues must be truncated.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 32,
+        max_bytes: int = 64 * 1024 * 1024,
+        ttl_seconds: Optional[float] = 600.0,
+    ) -> None:
+        self._cache: TTLCache[CacheKey, bytes] = TTLCache(
+            max_entries=max_entries,
+            ttl_seconds=ttl_seconds,
+            max_bytes=max_bytes,
+            size_of=len,
+        )
+
+    @classmethod
+    def from_env(cls) -> "ParseResultCache":
+        """Build from ROSTER_PARSE_CACHE_ENTRIES / _MAX_BYTES / _TTL_SECONDS (0 entries disables)."""
+        ttl = float(os.getenv("ROSTER_PARSE_CACHE_TTL_SECONDS", "600"))
+        return cls(
+            max_entries=int(os.getenv("ROSTER_PARSE_CACHE_ENTRIES", "32")),
+            max_bytes=int(os.getenv("ROSTER_PARSE_CACHE_MAX_BYTES", str(64 * 1024 * 1024))),
+            ttl_seconds=ttl if ttl > 0 else None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    @staticmethod
+    def make_key(
+        content_hash: str,
+        mode: ParseMode,
+        header_row: Optional[int] = None,
+        file_name: Optional[str] = None,
+        raw_rows: RawRowsMode = RawRowsMode.FULL,
+    ) -> CacheKey:
+        suffix = Path(file_name).suffix.lower() if file_name else ""
+        return (content_hash, ParseMode(mode).value, header_row, suffix, RawRowsMode(raw_rows).value)
+
+    def get_encoded(self, key: CacheKey) -> Optional[bytes]:
+        """The cached JSON bytes as stored, without decoding."""
+        return self._cache.get(key)
+
+    def put_encoded(self, key: CacheKey, payload: bytes) -> None:
+        """Store an already serialized ParseResponse (``model_dump_json()`` bytes)."""
+        self._cache.put(key, payload)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
@@ -2,12 +2,11 @@
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Optional, Sequence
 from datetime import datetime, timedelta
 
-from pydantic import EmailStr, TypeAdapter, ValidationError
-
-from .header_map import HeaderMap
+from .context import ParseContext
+from .header_map import HeaderMap, SheetSchema
 from .models import (
     EmployeeEntry,
     ParseIssue,
@@ -23,23 +22,18 @@ from .utils import (
     parse_date,
     parse_int,
     parse_time,
+    validate_email,
 )
 
-_email_validator = TypeAdapter(EmailStr)
-
 
-def parse_roster_row(
-    row: dict[str, Any],
+def _duplicate_column_warnings(
+    schema: SheetSchema,
     row_num: int,
-    header_map: HeaderMap,
     mode: ParseMode,
-) -> tuple[RosterEntry, list[ParseIssue]]:
-    """Parse a single row into a RosterEntry with warnings."""
+) -> list[ParseIssue]:
+    """Report columns that resolve to the same canonical key (resolved once per sheet)."""
     warnings: list[ParseIssue] = []
-
-    # Optimize: normalize and detect duplicates in single pass
-    normalized, duplicate_headers = header_map.normalize_and_detect_duplicates(row)
-    for canonical, headers in duplicate_headers.items():
+    for canonical, headers in schema.duplicates.items():
         issue = ParseIssue(
             row=row_num,
             severity=ParseIssueSeverity.WARNING,
@@ -50,9 +44,39 @@ def parse_roster_row(
         if mode == ParseMode.STRICT:
             issue.severity = ParseIssueSeverity.ERROR
             raise ParseIssueError(issue)
+        # In LENIENT mode, collect warning instead of silently ignoring
         warnings.append(issue)
+    return warnings
+
+
+def parse_roster_row(
+    row: dict[str, Any],
+    row_num: int,
+    header_map: HeaderMap,
+    mode: ParseMode,
+) -> tuple[RosterEntry, list[ParseIssue]]:
+    """Parse a single row into a RosterEntry with warnings."""
+    schema, values = header_map.compile_row(row)
+    return parse_roster_values(values, row_num, schema, mode)
+
+
+def parse_roster_values(
+    values: Sequence[Any],
+    row_num: int,
+    schema: SheetSchema,
+    mode: ParseMode,
+    context: Optional[ParseContext] = None,
+) -> tuple[RosterEntry, list[ParseIssue]]:
+    """
+    Parse positional row values (aligned with ``schema``) into a RosterEntry with warnings.
+
+    Pass the job's ParseContext so per-column state (such as the inferred
+    date format) carries across rows.
+    """
+    warnings = _duplicate_column_warnings(schema, row_num, mode) if schema.duplicates else []
+    field = schema.value
 
-    employee_number = get_string(normalized.get("employee_number"))
+    employee_number = get_string(field(values, "employee_number"))
     if not employee_number:
         raise ParseIssueError(
             ParseIssue(
@@ -64,12 +88,12 @@ def parse_roster_row(
             )
         )
 
-    raw_email = normalized.get("employee_email")
+    raw_email = field(values, "employee_email")
     employee_email = get_string(raw_email)
     if employee_email:
-        try:
-            _email_validator.validate_python(employee_email)
-        except ValidationError as exc:
+        # Keep the normalised address, as RosterEntry validation would.
+        normalised = context.validate_email(employee_email) if context else validate_email(employee_email)
+        if normalised is None:
             raise ParseIssueError(
                 ParseIssue(
                     row=row_num,
@@ -79,11 +103,12 @@ def parse_roster_row(
                     column="employee_email",
                     value=employee_email,
                 )
-            ) from exc
+            )
+        employee_email = normalised
 
-    raw_date = normalized.get("date")
+    raw_date = field(values, "date")
     try:
-        date_value = parse_date(raw_date)
+        date_value = context.parse_date("date", raw_date) if context else parse_date(raw_date)
     except ValueError as exc:
         raise ParseIssueError(
             ParseIssue(
@@ -107,9 +132,9 @@ def parse_roster_row(
             )
         )
 
-    raw_start = normalized.get("start_time")
+    raw_start = field(values, "start_time")
     try:
-        start_time = parse_time(raw_start)
+        start_time = context.parse_time(raw_start) if context else parse_time(raw_start)
     except ValueError as exc:
         raise ParseIssueError(
             ParseIssue(
@@ -133,9 +158,9 @@ def parse_roster_row(
             )
         )
 
-    raw_end = normalized.get("end_time")
+    raw_end = field(values, "end_time")
     try:
-        end_time = parse_time(raw_end)
+        end_time = context.parse_time(raw_end) if context else parse_time(raw_end)
     except ValueError as exc:
         raise ParseIssueError(
             ParseIssue(
@@ -159,7 +184,7 @@ def parse_roster_row(
             )
         )
 
-    raw_overnight = normalized.get("is_overnight")
+    raw_overnight = field(values, "is_overnight")
     explicit_provided = raw_overnight is not None and str(raw_overnight).strip() != ""
     explicit_value = parse_boolean(raw_overnight) if explicit_provided else None
     inferred_overnight = end_time < start_time
@@ -180,8 +205,8 @@ def parse_roster_row(
             raise ParseIssueError(issue)
         warnings.append(issue)
 
-    has_meal_break = parse_boolean(normalized.get("has_meal_break"))
-    meal_break_duration, meal_warning = parse_int(normalized.get("meal_break_duration"))
+    has_meal_break = parse_boolean(field(values, "has_meal_break"))
+    meal_break_duration, meal_warning = parse_int(field(values, "meal_break_duration"))
     if meal_warning:
         warnings.append(
             ParseIssue(
@@ -190,7 +215,7 @@ def parse_roster_row(
                 code="FRACTIONAL_VALUE_ROUNDED",
                 message=meal_warning,
                 column="meal_break_duration",
-                value=str(normalized.get("meal_break_duration")),
+                value=str(field(values, "meal_break_duration")),
                 hint="Duration should be a whole number in minutes",
             )
         )
@@ -218,8 +243,8 @@ def parse_roster_row(
             )
         )
 
-    has_rest_breaks = parse_boolean(normalized.get("has_rest_breaks"))
-    rest_breaks_duration, rest_warning = parse_int(normalized.get("rest_breaks_duration"))
+    has_rest_breaks = parse_boolean(field(values, "has_rest_breaks"))
+    rest_breaks_duration, rest_warning = parse_int(field(values, "rest_breaks_duration"))
     if rest_warning:
         warnings.append(
             ParseIssue(
@@ -228,7 +253,7 @@ def parse_roster_row(
                 code="FRACTIONAL_VALUE_ROUNDED",
                 message=rest_warning,
                 column="rest_breaks_duration",
-                value=str(normalized.get("rest_breaks_duration")),
+                value=str(field(values, "rest_breaks_duration")),
                 hint="Duration should be a whole number in minutes",
             )
         )
@@ -281,7 +306,7 @@ def parse_roster_row(
                 )
             )
 
-    raw_employment_type = get_string(normalized.get("employment_type"))
+    raw_employment_type = get_string(field(values, "employment_type"))
     employment_type = normalize_employment_type(raw_employment_type)
     if raw_employment_type is None:
         issue = ParseIssue(
@@ -311,11 +336,16 @@ def parse_roster_row(
             raise ParseIssueError(issue)
         warnings.append(issue)
 
+    # The plain fields go through normal (cheap) validation. The email has
+    # already been checked and normalised above, and EmailStr is by far the
+    # most expensive part of building an entry, so it is set afterwards
+    # instead of being validated a second time. (``model_construct`` skips
+    # validation too, but is slower than validating these simple fields.)
     entry = RosterEntry(
         excel_row=row_num,
-        employee_email=employee_email,
-    employee_number=employee_number,
-        employee_name=get_string(normalized.get("employee_name")),
+        employee_email=None,
+        employee_number=employee_number,
+        employee_name=get_string(field(values, "employee_name")),
         employment_type=employment_type or raw_employment_type,
         date=date_value,
         start_time=start_time,
@@ -325,16 +355,20 @@ def parse_roster_row(
         meal_break_duration=meal_break_duration,
         has_rest_breaks=has_rest_breaks,
         rest_breaks_duration=rest_breaks_duration,
-        is_public_holiday=parse_boolean(normalized.get("is_public_holiday")),
-        public_holiday_name=get_string(normalized.get("public_holiday_name")),
-        is_on_call=parse_boolean(normalized.get("is_on_call")),
-        location=get_string(normalized.get("location")),
-        notes=get_string(normalized.get("notes")),
+        is_public_holiday=parse_boolean(field(values, "is_public_holiday")),
+        public_holiday_name=get_string(field(values, "public_holiday_name")),
+        is_on_call=parse_boolean(field(values, "is_on_call")),
+        location=get_string(field(values, "location")),
+        notes=get_string(field(values, "notes")),
     )
+    if employee_email is not None:
+        # RosterEntry is frozen; write the field directly, as model_copy does.
+        entry.__dict__["employee_email"] = employee_email
 
     return entry, warnings
 
 
+
 def parse_employee_row(
     row: dict[str, Any],
     row_num: int,
@@ -342,25 +376,22 @@ def parse_employee_row(
     mode: ParseMode,
 ) -> tuple[EmployeeEntry, list[ParseIssue]]:
     """Parse a single row into an EmployeeEntry with warnings."""
-    warnings: list[ParseIssue] = []
+    schema, values = header_map.compile_row(row)
+    return parse_employee_values(values, row_num, schema, mode)
 
-    # Optimize: normalize and detect duplicates in single pass
-    normalized, duplicate_headers = header_map.normalize_and_detect_duplicates(row)
-    for canonical, headers in duplicate_headers.items():
-        issue = ParseIssue(
-            row=row_num,
-            severity=ParseIssueSeverity.WARNING,
-            code="DUPLICATE_CANONICAL_COLUMN_IN_ROW",
-            message=f"Multiple columns map to '{canonical}': {', '.join(headers)}",
-            column=canonical,
-        )
-        if mode == ParseMode.STRICT:
-            issue.severity = ParseIssueSeverity.ERROR
-            raise ParseIssueError(issue)
-        # In LENIENT mode, collect warning instead of silently ignoring
-        warnings.append(issue)
 
-    name = get_string(normalized.get("name"))
+def parse_employee_values(
+    values: Sequence[Any],
+    row_num: int,
+    schema: SheetSchema,
+    mode: ParseMode,
+    context: Optional[ParseContext] = None,
+) -> tuple[EmployeeEntry, list[ParseIssue]]:
+    """Parse positional row values (aligned with ``schema``) into an EmployeeEntry with warnings."""
+    warnings = _duplicate_column_warnings(schema, row_num, mode) if schema.duplicates else []
+    field = schema.value
+
+    name = get_string(field(values, "name"))
     if not name:
         raise ParseIssueError(
             ParseIssue(
@@ -372,11 +403,11 @@ def parse_employee_row(
             )
         )
 
-    email = get_string(normalized.get("email"))
+    email = get_string(field(values, "email"))
+    normalised_email = None
     if email:
-        try:
-            _email_validator.validate_python(email)
-        except ValidationError as exc:
+        normalised_email = context.validate_email(email) if context else validate_email(email)
+        if normalised_email is None:
             raise ParseIssueError(
                 ParseIssue(
                     row=row_num,
@@ -386,9 +417,9 @@ def parse_employee_row(
                     column="email",
                     value=email,
                 )
-            ) from exc
+            )
 
-    role = get_string(normalized.get("role"))
+    role = get_string(field(values, "role"))
     if not role:
         raise ParseIssueError(
             ParseIssue(
@@ -400,9 +431,9 @@ def parse_employee_row(
             )
         )
 
-    raw_start_date = normalized.get("start_date")
+    raw_start_date = field(values, "start_date")
     try:
-        start_date = parse_date(raw_start_date)
+        start_date = context.parse_date("start_date", raw_start_date) if context else parse_date(raw_start_date)
     except ValueError as exc:
         raise ParseIssueError(
             ParseIssue(
@@ -418,10 +449,12 @@ def parse_employee_row(
     entry = EmployeeEntry(
         excel_row=row_num,
         name=name,
-        email=email,
+        email=None,
         role=role,
-        department=get_string(normalized.get("department")),
+        department=get_string(field(values, "department")),
         start_date=start_date,
     )
+    # Already validated above; assigning skips a second EmailStr pass.
+    entry.email = normalised_email
 
     return entry, warnings
@@ -0,0 +1,66 @@
+"""Turn an upload into a seekable stream the readers can parse in place."""
+
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+from typing import Any, BinaryIO, Optional
+
+# Uploads larger than this are spooled to disk instead of held in memory.
+DEFAULT_SPOOL_THRESHOLD = int(os.getenv("ROSTER_UPLOAD_SPOOL_BYTES", str(8 * 1024 * 1024)))
+
+
+async def spool_upload(file: Any, threshold: int = DEFAULT_SPOOL_THRESHOLD) -> BinaryIO:
+    """
+    Return a seekable binary stream over an upload's content, owned by the caller.
+
+    The request closes a Starlette ``UploadFile`` when it ends, which can be
+    before a timed-out parse has finished reading, so its stream is never
+    handed out as-is. When it has rolled over to disk the descriptor is
+    duplicated (no copy); otherwise its bytes are copied. Other upload
+    objects are read into memory. Content over ``threshold`` bytes is moved
+    into a SpooledTemporaryFile that rolls over to disk, and no named temp
+    file is written. The caller must close the returned stream.
+    """
+    underlying = getattr(file, "file", None)
+    if underlying is not None and hasattr(underlying, "seek") and _seekable(underlying):
+        owned = _reopen(underlying)
+        if owned is not None:
+            return owned
+        underlying.seek(0)
+        content = underlying.read()
+    else:
+        content = await file.read()
+
+    if len(content) <= threshold:
+        return io.BytesIO(content)
+
+    spool = tempfile.SpooledTemporaryFile(max_size=threshold)
+    spool.write(content)
+    spool.seek(0)
+    return spool
+
+
+def _reopen(stream: Any) -> Optional[BinaryIO]:
+    # A stream backed by a real file gets its own descriptor, which stays
+    # open when the request closes the original. The two share a file
+    # offset, which is harmless: the request does not read it again. An
+    # in-memory SpooledTemporaryFile has no name, and asking for its
+    # fileno() would force it onto disk.
+    if getattr(stream, "name", None) is None:
+        return None
+    try:
+        fd = os.dup(stream.fileno())
+    except (AttributeError, OSError, ValueError):
+        return None
+    owned = os.fdopen(fd, "rb")
+    owned.seek(0)
+    return owned
+
+
+def _seekable(stream: Any) -> bool:
+    try:
+        return bool(stream.seekable())
+    except (AttributeError, ValueError):
+        return False
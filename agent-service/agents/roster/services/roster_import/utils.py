@@ -2,10 +2,12 @@
 
 from __future__ import annotations
 
-from typing import Any, Optional
-from datetime import date, time, datetime
+from typing import Any, Iterable, Optional, Union
+from datetime import date, time, datetime, timedelta
 import re
 
+from pydantic import EmailStr, TypeAdapter, ValidationError
+
 
 _EMPLOYMENT_TYPE_MAP = {
     "fulltime": "full-time",
@@ -38,6 +40,81 @@ def normalize_employment_type(value: Optional[str]) -> Optional[str]:
     return _EMPLOYMENT_TYPE_MAP.get(key)
 
 
+_DATE_FORMATS = [
+    "%Y-%m-%d",
+    "%d/%m/%Y",
+    "%m/%d/%Y",
+    "%d-%m-%Y",
+    "%Y/%m/%d",
+    "%d.%m.%Y",
+]
+
+_YMD_DASH = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_YMD_SLASH = re.compile(r"(\d{4})/(\d{1,2})/(\d{1,2})")
+_XXY_SLASH = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4})")
+_DMY_DASH = re.compile(r"(\d{1,2})-(\d{1,2})-(\d{4})")
+_DMY_DOT = re.compile(r"(\d{1,2})\.(\d{1,2})\.(\d{4})")
+
+
+def _make_date(year: str, month: str, day: str) -> Optional[date]:
+    try:
+        return date(int(year), int(month), int(day))
+    except ValueError:
+        return None
+
+
+def _fixed_width_parser(pattern: re.Pattern[str], order: str):
+    """Build an exception-free parser for one entry of _DATE_FORMATS."""
+    y, m, d = order.index("y") + 1, order.index("m") + 1, order.index("d") + 1
+
+    def parse(value: str) -> Optional[date]:
+        match = pattern.fullmatch(value)
+        if match is None:
+            return None
+        return _make_date(match.group(y), match.group(m), match.group(d))
+
+    return parse
+
+
+# Fast equivalents of _DATE_FORMATS, same order. Each returns None where
+# strptime would raise; anything they miss still goes through strptime.
+_DATE_PARSERS = [
+    _fixed_width_parser(_YMD_DASH, "ymd"),
+    _fixed_width_parser(_XXY_SLASH, "dmy"),
+    _fixed_width_parser(_XXY_SLASH, "mdy"),
+    _fixed_width_parser(_DMY_DASH, "dmy"),
+    _fixed_width_parser(_YMD_SLASH, "ymd"),
+    _fixed_width_parser(_DMY_DOT, "dmy"),
+]
+
+# Formats that can also match a value of the key format and come earlier in
+# _DATE_FORMATS, so must still be tried first to keep the list's precedence
+# (e.g. 05/06/2024 is 5 June, even in a column of MM/DD/YYYY dates).
+_DATE_FORMAT_PRECEDENCE = {2: (1,)}
+
+
+def _parse_date_string(value: str, order: list[int]) -> tuple[Optional[date], Optional[int]]:
+    """Return (date, index of the format that matched) using the fast parsers in ``order``."""
+    for index in order:
+        parsed = _DATE_PARSERS[index](value)
+        if parsed is not None:
+            return parsed, index
+    return None, None
+
+
+def _parse_date_strptime(value: str) -> date:
+    for fmt in _DATE_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date()
+        except ValueError:
+            continue
+
+    raise ValueError(f"Unable to parse date: {value}. Expected formats: YYYY-MM-DD, DD/MM/YYYY, MM/DD/YYYY, etc.")
+
+
+_DEFAULT_DATE_ORDER = list(range(len(_DATE_FORMATS)))
+
+
 def parse_date(value: Any) -> Optional[date]:
     """
     Parse various date formats into a date object.
@@ -69,24 +146,56 @@ def parse_date(value: Any) -> Optional[date]:
         if not value:
             return None
 
-        formats = [
-            "%Y-%m-%d",
-            "%d/%m/%Y",
-            "%m/%d/%Y",
-            "%d-%m-%Y",
-            "%Y/%m/%d",
-            "%d.%m.%Y",
-        ]
+        parsed, _ = _parse_date_string(value, _DEFAULT_DATE_ORDER)
+        if parsed is not None:
+            return parsed
+        return _parse_date_strptime(value)
 
-        for fmt in formats:
-            try:
-                return datetime.strptime(value, fmt).date()
-            except ValueError:
-                continue
+    raise ValueError(f"Invalid date type: {type(value).__name__}")
 
-        raise ValueError(f"Unable to parse date: {value}. Expected formats: YYYY-MM-DD, DD/MM/YYYY, MM/DD/YYYY, etc.")
 
-    raise ValueError(f"Invalid date type: {type(value).__name__}")
+class DateColumnParser:
+    """
+    ``parse_date`` for one column, with the column's format inferred.
+
+    The first ``sample_size`` string values are parsed in the standard order
+    while counting which format matched; after that the most common format is
+    tried first. Results are identical to ``parse_date`` (earlier formats that
+    could claim the same value still take precedence); the fixed-width
+    parsers only change how many patterns are tried before the hit.
+    """
+
+    def __init__(self, sample_size: int = 20) -> None:
+        self.sample_size = sample_size
+        self.locked_format: Optional[str] = None
+        self._order = _DEFAULT_DATE_ORDER
+        self._hits = [0] * len(_DATE_FORMATS)
+        self._sampled = 0
+
+    def parse(self, value: Any) -> Optional[date]:
+        if not isinstance(value, str):
+            return parse_date(value)
+
+        value = value.strip()
+        if not value:
+            return None
+
+        parsed, index = _parse_date_string(value, self._order)
+        if parsed is None:
+            return _parse_date_strptime(value)
+
+        if self.locked_format is None:
+            self._hits[index] += 1
+            self._sampled += 1
+            if self._sampled >= self.sample_size:
+                self._lock()
+        return parsed
+
+    def _lock(self) -> None:
+        best = max(range(len(self._hits)), key=self._hits.__getitem__)
+        first = [*_DATE_FORMAT_PRECEDENCE.get(best, ()), best]
+        self._order = first + [i for i in _DEFAULT_DATE_ORDER if i not in first]
+        self.locked_format = _DATE_FORMATS[best]
 
 
 def parse_time(value: Any) -> Optional[time]:
@@ -162,6 +271,144 @@ def parse_time(value: Any) -> Optional[time]:
     raise ValueError(f"Invalid time type: {type(value)}")
 
 
+TimeResult = Union[time, ValueError, None]
+
+
+class TimeParser:
+    """
+    ``parse_time`` with a bounded memo of raw value -> result.
+
+    Roster time columns hold a few dozen distinct strings ("09:00",
+    "5:30 PM", Excel fractions) repeated across every shift, so each distinct
+    value is parsed once per job. Failures are memoised too and re-raised as
+    a fresh ValueError with the original message. Once ``max_entries``
+    distinct values have been seen, new values are parsed without being
+    stored, so a column of unique junk cannot grow the table without bound.
+    """
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self.max_entries = max_entries
+        self._memo: dict[Any, Union[time, str, None]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def parse(self, value: Any) -> Optional[time]:
+        if value is None or isinstance(value, time):
+            return value
+        if isinstance(value, datetime):
+            return value.time()
+
+        # bool is an int subclass and hashes equal to 0/1; keep it apart.
+        key = (type(value) is bool, value)
+        try:
+            cached = self._memo[key]
+        except KeyError:
+            self.misses += 1
+        except TypeError:
+            return parse_time(value)  # unhashable; let parse_time report it
+        else:
+            self.hits += 1
+            if isinstance(cached, str):
+                raise ValueError(cached)
+            return cached
+
+        try:
+            parsed = parse_time(value)
+        except ValueError as exc:
+            if len(self._memo) < self.max_entries:
+                self._memo[key] = str(exc)
+            raise
+        if len(self._memo) < self.max_entries:
+            self._memo[key] = parsed
+        return parsed
+
+    def parse_many(self, values: Iterable[Any]) -> list[TimeResult]:
+        """
+        Parse a whole column, returning one result per value.
+
+        Failures are returned in place as ValueError instances rather than
+        raised, so one bad cell does not abort the column.
+        """
+        results: list[TimeResult] = []
+        append = results.append
+        for value in values:
+            try:
+                append(self.parse(value))
+            except ValueError as exc:
+                append(exc)
+        return results
+
+    def __len__(self) -> int:
+        return len(self._memo)
+
+
+def parse_time_column(values: Iterable[Any], parser: Optional[TimeParser] = None) -> list[TimeResult]:
+    """Parse a column of time cells; see ``TimeParser.parse_many``."""
+    return (parser or TimeParser()).parse_many(values)
+
+
+_email_adapter = TypeAdapter(EmailStr)
+
+# email-validator maps these full stops to "." when normalising the domain.
+_DOMAIN_DOTS = (".", "\u3002", "\uff0e", "\uff61")
+
+
+def _email_shape_ok(value: str) -> bool:
+    """
+    Cheap structural check run before the full EmailStr validator.
+
+    Only rejects strings the validator would reject as well: no "@", an empty
+    local part or domain, or a domain without a dot.
+    """
+    local, at, domain = value.rpartition("@")
+    return bool(at and local and domain) and any(dot in domain for dot in _DOMAIN_DOTS)
+
+
+def validate_email(value: str) -> Optional[str]:
+    """Return the normalised address, or None if ``value`` is not a valid email."""
+    if not _email_shape_ok(value):
+        return None
+    try:
+        return _email_adapter.validate_python(value)
+    except ValidationError:
+        return None
+
+
+class EmailValidator:
+    """
+    ``validate_email`` with a bounded memo of address -> normalised result.
+
+    An employee's address repeats on every one of their shifts, and the
+    EmailStr validator is the most expensive per-row call in the import, so
+    each distinct address is validated once per job. Invalid addresses are
+    memoised as None. As with ``TimeParser``, new values stop being stored
+    once ``max_entries`` is reached.
+    """
+
+    def __init__(self, max_entries: int = 8192) -> None:
+        self.max_entries = max_entries
+        self._memo: dict[str, Optional[str]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def validate(self, value: str) -> Optional[str]:
+        try:
+            result = self._memo[value]
+        except KeyError:
+            self.misses += 1
+        else:
+            self.hits += 1
+            return result
+
+        result = validate_email(value)
+        if len(self._memo) < self.max_entries:
+            self._memo[value] = result
+        return result
+
+    def __len__(self) -> int:
+        return len(self._memo)
+
+
 def parse_boolean(value: Any) -> bool:
     """
     Parse various boolean representations.
@@ -237,6 +484,19 @@ def parse_int(value: Any, allow_fractional: bool = False) -> tuple[Optional[int]
     return None, None
 
 
+# Cell types that are not JSON-native. Raw rows are serialized by pydantic,
+# which writes timedelta as an ISO 8601 duration ("P1DT6H"); they are
+# converted up front to what jsonable_encoder wrote for them instead.
+RAW_CELL_TYPES = (datetime, date, time, timedelta)
+
+
+def raw_cell_value(value: Any) -> Any:
+    """Convert a RAW_CELL_TYPES cell for a raw row: ISO string, or seconds for a duration."""
+    if isinstance(value, timedelta):
+        return value.total_seconds()
+    return value.isoformat()
+
+
 def build_raw_row(normalized: dict[str, Any], row_num: int, extra_key: str) -> dict[str, Any]:
     """Build a display-friendly raw row for UI rendering."""
     raw: dict[str, Any] = {"excel_row": row_num}
@@ -248,10 +508,12 @@ def build_raw_row(normalized: dict[str, Any], row_num: int, extra_key: str) -> d
                 key_to_use = extra_key_name
                 if key_to_use in raw:
                     key_to_use = f"{extra_key_name} (extra)"
+                if isinstance(extra_value, RAW_CELL_TYPES):
+                    extra_value = raw_cell_value(extra_value)
                 raw[key_to_use] = extra_value
             continue
-        if isinstance(value, (datetime, date, time)):
-            raw[key] = value.isoformat()
+        if isinstance(value, RAW_CELL_TYPES):
+            raw[key] = raw_cell_value(value)
         else:
             raw[key] = value
     return raw
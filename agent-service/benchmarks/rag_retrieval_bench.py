@@ -0,0 +1,136 @@
+"""Event-loop responsiveness while RAG retrievals run concurrently.
+
+Builds an in-memory FAISS index over synthetic chunks with an embedding model
+that stands in for the real one: ``embed_query`` blocks for ``--embed-ms``
+(the HTTP round trip to OpenAI, or HuggingFace inference) and ``aembed_query``
+either awaits the same delay (``--embed-mode async``, like OpenAIEmbeddings) or
+is left to langchain's default, which runs ``embed_query`` on the executor
+(``--embed-mode sync``, like HuggingFaceEmbeddings).
+
+``--queries`` retrievals are started at once, two ways:
+
+* blocking:  ``similarity_search_with_score`` called inside the coroutine,
+  as ``RAGRetriever.retrieve`` used to;
+* async:     ``RAGRetriever.retrieve`` (``aembed_query`` + search in a thread).
+
+While they run, a heartbeat task sleeps 5 ms at a time and records how late it
+wakes up; the worst and p95 lag show how long the event loop was blocked.
+
+Usage (from agent-service/):
+    poetry run python -m benchmarks.rag_retrieval_bench --queries 32 --embed-ms 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import time
+from typing import Any, Awaitable, Callable, List
+
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from shared.rag_retriever import RAGRetriever
+
+HEARTBEAT_S = 0.005
+
+
+class SlowEmbedding(DeterministicFakeEmbedding):
+    """Deterministic fake vectors with a fixed per-query latency."""
+
+    delay_s: float = 0.0
+    native_async: bool = True
+
+    def embed_query(self, text: str) -> List[float]:
+        time.sleep(self.delay_s)
+        return super().embed_query(text)
+
+    async def aembed_query(self, text: str) -> List[float]:
+        if not self.native_async:
+            return await super().aembed_query(text)
+        await asyncio.sleep(self.delay_s)
+        return DeterministicFakeEmbedding.embed_query(self, text)
+
+
+def build_store(chunks: int, dim: int, embeddings: SlowEmbedding) -> FAISS:
+    rng = random.Random(0)
+    words = ["award", "penalty", "casual", "overtime", "ordinary", "hours", "rate", "loading", "shift", "leave"]
+    texts = [" ".join(rng.choice(words) for _ in range(40)) + f" #{n}" for n in range(chunks)]
+    delay, embeddings.delay_s = embeddings.delay_s, 0.0
+    try:
+        return FAISS.from_texts(texts, embeddings, metadatas=[{"source": f"doc{n % 20}.pdf"} for n in range(chunks)])
+    finally:
+        embeddings.delay_s = delay
+
+
+async def _heartbeat(stop: asyncio.Event, lags: list[float]) -> None:
+    loop = asyncio.get_running_loop()
+    while not stop.is_set():
+        started = loop.time()
+        await asyncio.sleep(HEARTBEAT_S)
+        lags.append(loop.time() - started - HEARTBEAT_S)
+
+
+async def _measure(queries: List[str], retrieve: Callable[[str], Awaitable[Any]]) -> dict[str, float]:
+    stop = asyncio.Event()
+    lags: list[float] = []
+    beat = asyncio.create_task(_heartbeat(stop, lags))
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await asyncio.gather(*(retrieve(query) for query in queries))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await beat
+    lags.sort()
+    return {
+        "total_s": elapsed,
+        "max_lag_ms": lags[-1] * 1000 if lags else 0.0,
+        "p95_lag_ms": lags[int(len(lags) * 0.95) - 1] * 1000 if len(lags) > 1 else 0.0,
+        "beats": len(lags),
+    }
+
+
+async def run(args: argparse.Namespace) -> None:
+    embeddings = SlowEmbedding(size=args.dim, delay_s=args.embed_ms / 1000, native_async=args.embed_mode == "async")
+    store = build_store(args.chunks, args.dim, embeddings)
+    retriever = RAGRetriever(store)
+    queries = [f"casual overtime penalty rate question {n}" for n in range(args.queries)]
+
+    async def blocking(query: str) -> Any:
+        return store.similarity_search_with_score(query, k=args.top_k)
+
+    async def non_blocking(query: str) -> Any:
+        return await retriever.retrieve(query, top_k=args.top_k)
+
+    print(
+        f"{args.queries} concurrent queries, {args.chunks} chunks x {args.dim} dims, "
+        f"embedding {args.embed_ms:g} ms ({args.embed_mode})"
+    )
+    for name, retrieve in (("blocking", blocking), ("async", non_blocking)):
+        result = await _measure(queries, retrieve)
+        print(
+            f"  {name:9s} total {result['total_s'] * 1000:8.1f} ms  "
+            f"loop lag max {result['max_lag_ms']:8.1f} ms  p95 {result['p95_lag_ms']:6.1f} ms  "
+            f"({result['beats']} heartbeats)"
+        )
+    same = [
+        [doc.page_content for doc, _ in store.similarity_search_with_score(query, k=args.top_k)]
+        for query in queries[:3]
+    ] == [(await retriever.retrieve(query, top_k=args.top_k)).documents for query in queries[:3]]
+    print(f"  results identical: {same}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--queries", type=int, default=32, help="retrievals started at once")
+    parser.add_argument("--chunks", type=int, default=5000, help="chunks in the synthetic index")
+    parser.add_argument("--dim", type=int, default=384, help="embedding dimension")
+    parser.add_argument("--top-k", type=int, default=3)
+    parser.add_argument("--embed-ms", type=float, default=50.0, help="simulated query embedding latency")
+    parser.add_argument("--embed-mode", choices=("async", "sync"), default="async")
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
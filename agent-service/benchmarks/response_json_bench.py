@@ -0,0 +1,78 @@
+"""Serialization cost of a roster chat response, old dict path vs pre-encoded JSON.
+
+Parses a synthetic roster (``synthetic_shift_rows``, 50k rows by default) and
+serializes the ``/api/agent/chat`` response body two ways:
+
+* dict:    ``model_dump()``, merge the envelope fields into a dict, then
+  FastAPI's ``jsonable_encoder`` + ``JSONResponse`` rendering (the previous
+  behaviour);
+* encoded: ``model_dump_json()`` once, then ``EncodedFeatureResult`` splices
+  the envelope fields and the chat envelope around the bytes.
+
+The two bodies are checked to be byte-identical before timing.
+
+Usage (from agent-service/):
+    poetry run python -m benchmarks.response_json_bench --rows 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import io
+import time
+from typing import Callable
+
+from fastapi.encoders import jsonable_encoder
+from starlette.responses import JSONResponse
+
+from agents.roster.services.roster_import import RosterExcelParser
+from master_agent.feature_registry import EncodedFeatureResult, encode_json
+
+from .synthetic import SYNTHETIC_HEADERS, synthetic_shift_rows
+
+_ENVELOPE = {"type": "roster", "message": "Roster file 'roster.csv' parsed successfully.", "model": None, "sources": [], "note": None}
+_CHAT = {"status": "success", "request_id": "bench", "message": "", "file_name": "roster.csv", "routed_to": "roster"}
+
+
+def _best_of(run: Callable[[], bytes], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        started = time.perf_counter()
+        run()
+        best = min(best, time.perf_counter() - started)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000, help="roster rows")
+    parser.add_argument("--repeat", type=int, default=3, help="best of N runs")
+    args = parser.parse_args()
+
+    text = io.StringIO()
+    writer = csv.writer(text)
+    writer.writerow(SYNTHETIC_HEADERS)
+    writer.writerows(synthetic_shift_rows(args.rows))
+    response = RosterExcelParser().parse_roster_excel(text.getvalue().encode(), file_name="roster.csv")
+
+    def dict_path() -> bytes:
+        result = dict(response.model_dump())
+        result.update(_ENVELOPE)
+        return JSONResponse(jsonable_encoder({**_CHAT, "result": result})).body
+
+    def encoded_path() -> bytes:
+        encoded = EncodedFeatureResult(response.model_dump_json().encode("utf-8"), dict(_ENVELOPE))
+        return encode_json(_CHAT)[:-1] + b',"result":' + encoded.to_json() + b"}"
+
+    old, new = dict_path(), encoded_path()
+    if old != new:
+        raise SystemExit("encoded response differs from the dict path")
+
+    print(f"{args.rows} rows, {len(response.issues)} issues, {len(new) / 1e6:.1f} MB response")
+    for name, run in (("dict", dict_path), ("encoded", encoded_path)):
+        print(f"  {name:8s} {_best_of(run, args.repeat) * 1e3:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+"""Per-row cost of building RosterEntry models in the parse loop.
+
+Parses the ``test-data`` fixture rows (repeated up to ``--rows``) with
+``parse_roster_values`` and compares, per row:
+
+* validated: ``RosterEntry(**fields)`` for every row, which re-runs EmailStr
+  and every field validator after the row parser has checked them;
+* parser:    what ``parse_roster_values`` does: validate the plain fields,
+  then set the email it already normalised instead of validating it again.
+
+The fixtures have no email column, so each case is also run with a
+synthetic address on every row. Memory is the tracemalloc peak while
+holding all rows.
+
+Usage (from agent-service/):
+    poetry run python -m benchmarks.roster_entries_bench --rows 50000
+"""
+
+from __future__ import annotations
+
+import argparse
+import gc
+import time
+import tracemalloc
+from itertools import cycle, islice
+from typing import Any, Callable
+
+from agents.roster.services.roster_import import ParseMode, RosterEntry
+from agents.roster.services.roster_import.header_map import HeaderMap
+from agents.roster.services.roster_import.models import ParseIssueError
+from agents.roster.services.roster_import.row_parsers import parse_roster_values
+
+from .synthetic import fixture_workbooks, load_fixture_rows
+
+
+def _parsed_fields(rows: int) -> list[dict[str, Any]]:
+    header_map = HeaderMap()
+    fields = []
+    for fixture in fixture_workbooks():
+        headers, data = load_fixture_rows(fixture)
+        schema = header_map.compile(headers)
+        for row_num, values in enumerate(data, start=2):
+            try:
+                entry, _ = parse_roster_values(values, row_num, schema, ParseMode.LENIENT)
+            except ParseIssueError:
+                continue
+            fields.append({name: getattr(entry, name) for name in RosterEntry.model_fields})
+    if not fields:
+        raise SystemExit("no parseable fixture rows found under test-data/")
+    return list(islice(cycle(fields), rows))
+
+
+def _parser_entry(employee_email: Any, fields: dict[str, Any]) -> RosterEntry:
+    entry = RosterEntry(**fields)
+    if employee_email is not None:
+        entry.__dict__["employee_email"] = employee_email
+    return entry
+
+
+def _measure(build: Callable[[], list[Any]]) -> tuple[float, int]:
+    # Start each case from a clean heap so one case's garbage is not
+    # collected on the next one's clock.
+    gc.collect()
+    started = time.perf_counter()
+    build()
+    elapsed = time.perf_counter() - started
+
+    tracemalloc.start()
+    kept = build()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del kept
+    return elapsed, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=50_000, help="rows to build")
+    args = parser.parse_args()
+
+    plain = _parsed_fields(args.rows)
+    with_email = [
+        {**row, "employee_email": f"{(row['employee_number'] or 'staff').lower()}@example.com"}
+        for row in plain
+    ]
+
+    for label, rows in (("no email", plain), ("with email", with_email)):
+        preset = [(row["employee_email"], {**row, "employee_email": None}) for row in rows]
+        cases = {
+            "validated": lambda: [RosterEntry(**row) for row in rows],
+            "parser": lambda: [_parser_entry(email, row) for email, row in preset],
+        }
+
+        print(f"{len(rows)} rows, {label}")
+        for name, build in cases.items():
+            elapsed, peak = _measure(build)
+            print(
+                f"  {name:10s} {elapsed * 1e6 / len(rows):8.1f} us/row"
+                f"  {peak / len(rows):8.0f} B/row  {len(rows) / elapsed:10.0f} rows/s"
+            )
+
+
+if __name__ == "__main__":
+    main()
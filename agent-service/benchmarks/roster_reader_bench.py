@@ -0,0 +1,53 @@
+"""Compare the Cell-based and values_only Excel reader paths.
+
+Scales each ``test-data`` workbook up to ``--rows`` data rows and times a full
+pass over ``open_excel_rows`` in both modes.
+
+Usage (from agent-service/):
+    poetry run python -m benchmarks.roster_reader_bench --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from pathlib import Path
+
+from agents.roster.services.roster_import.excel_reader import open_excel_rows
+
+from .synthetic import fixture_workbooks, scale_fixture
+
+
+def _time_read(path: Path, values_only: bool, repeat: int) -> tuple[float, int]:
+    best = float("inf")
+    count = 0
+    for _ in range(repeat):
+        started = time.perf_counter()
+        _, rows = open_excel_rows(str(path), values_only=values_only)
+        count = sum(1 for _ in rows)
+        best = min(best, time.perf_counter() - started)
+    return best, count
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="data rows per scaled workbook")
+    parser.add_argument("--repeat", type=int, default=3, help="runs per mode (best time is reported)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for fixture in fixture_workbooks():
+            scaled = scale_fixture(fixture, Path(tmp_dir) / fixture.name, args.rows)
+            cell_s, cell_rows = _time_read(scaled, values_only=False, repeat=args.repeat)
+            fast_s, fast_rows = _time_read(scaled, values_only=True, repeat=args.repeat)
+            assert cell_rows == fast_rows, (cell_rows, fast_rows)
+
+            print(f"{fixture.name} ({cell_rows} rows)")
+            print(f"  cells:       {cell_s:8.3f}s  {cell_rows / cell_s:10.0f} rows/s")
+            print(f"  values_only: {fast_s:8.3f}s  {fast_rows / fast_s:10.0f} rows/s")
+            print(f"  speedup:     {cell_s / fast_s:8.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,232 @@
+"""Roster import benchmark suite: per-stage timings at several roster sizes.
+
+For each size a synthetic roster (``synthetic.synthetic_roster``: mixed date
+and time styles, emails, extra columns, ~2% bad cells) is written as .xlsx or
+CSV, then imported twice:
+
+* stages: the import split into its steps, each timed on its own pass over
+  the rows held in memory --
+    read       open the file and pull every row (openpyxl / csv)
+    normalize  compile the header schema and build the raw display rows
+    parse      row parsers, with a per-job ParseContext, issues accumulated
+    aggregate  roster totals, then the ParseResponse
+    serialize  ``model_dump_json()`` of the response
+* end to end: ``RosterExcelParser.parse_roster_excel`` + ``model_dump_json``,
+  streaming as in production. Reported as total seconds and rows/s, plus
+  tracemalloc peak memory (a second, slower run; skip with ``--no-memory``).
+
+Results are printed and, with ``--output``, written as JSON together with
+the git commit and Python version. ``--compare`` reads an earlier results
+file and prints new/old time ratios per stage; with ``--max-regression`` the
+run exits non-zero if any end-to-end time grew by more than that factor.
+
+Usage (from agent-service/):
+    poetry run python -m benchmarks.roster_suite --sizes 1000,10000,100000 --output bench.json
+    poetry run python -m benchmarks.roster_suite --compare bench.json --max-regression 1.2
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+from agents.roster.services.roster_import import ParseIssueError, ParseMode, RosterExcelParser
+from agents.roster.services.roster_import.context import ParseContext
+from agents.roster.services.roster_import.header_map import HeaderMap
+from agents.roster.services.roster_import.issues import IssueAccumulator
+from agents.roster.services.roster_import.models import RosterAggregates, RosterParseResult
+from agents.roster.services.roster_import.readers import open_rows
+from agents.roster.services.roster_import.row_parsers import parse_roster_values
+
+from .synthetic import synthetic_roster, write_csv, write_workbook
+
+DEFAULT_SIZES = "1000,10000,100000,500000"
+STAGES = ("read", "normalize", "parse", "aggregate", "serialize")
+
+
+def _timed(run: Callable[[], Any]) -> tuple[float, Any]:
+    started = time.perf_counter()
+    value = run()
+    return time.perf_counter() - started, value
+
+
+def _stage_timings(path: Path) -> dict[str, float]:
+    timings: dict[str, float] = {}
+
+    def read() -> tuple[list[Any], list[tuple[int, tuple[Any, ...]]]]:
+        headers, rows = open_rows(str(path))
+        return headers, list(rows)
+
+    timings["read"], (headers, rows) = _timed(read)
+
+    def normalize() -> Any:
+        schema = HeaderMap().compile(headers)
+        raw_rows = [schema.build_raw_row(values, row_num) for row_num, values in rows]
+        return schema, raw_rows
+
+    timings["normalize"], (schema, raw_rows) = _timed(normalize)
+
+    def parse() -> tuple[list[Any], IssueAccumulator]:
+        context = ParseContext()
+        issues = IssueAccumulator()
+        entries = []
+        for row_num, values in rows:
+            try:
+                entry, warnings = parse_roster_values(values, row_num, schema, ParseMode.LENIENT, context=context)
+            except ParseIssueError as exc:
+                issues.add(exc.issue)
+                continue
+            entries.append(entry)
+            issues.extend(warnings)
+        return entries, issues
+
+    timings["parse"], (entries, issues) = _timed(parse)
+
+    def aggregate() -> Any:
+        aggregates = RosterAggregates.from_entries(entries)
+        result = RosterParseResult.model_construct(entries=entries, raw_rows=raw_rows)
+        result.set_aggregates(aggregates)
+        return issues.build_response(result)
+
+    timings["aggregate"], response = _timed(aggregate)
+    timings["serialize"], _ = _timed(response.model_dump_json)
+    return timings
+
+
+def _end_to_end(path: Path, measure_memory: bool) -> dict[str, Any]:
+    parser = RosterExcelParser()
+
+    def run() -> Any:
+        response = parser.parse_roster_excel(str(path))
+        return response, len(response.model_dump_json())
+
+    total_s, (response, json_bytes) = _timed(run)
+    result: dict[str, Any] = {
+        "total_s": total_s,
+        "entries": len(response.result.entries),
+        "issues": response.summary.total_issues,
+        "json_bytes": json_bytes,
+        "peak_memory_bytes": None,
+    }
+    del response
+
+    if measure_memory:
+        tracemalloc.start()
+        try:
+            run()
+            result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return result
+
+
+def run_size(rows: int, file_format: str, tmp_dir: Path, error_rate: float, measure_memory: bool) -> dict[str, Any]:
+    headers, data = synthetic_roster(rows, error_rate=error_rate)
+    path = tmp_dir / f"roster_{rows}.{file_format}"
+    if file_format == "csv":
+        write_csv(path, headers, data)
+    else:
+        write_workbook(path, headers, data)
+
+    stages = _stage_timings(path)
+    end_to_end = _end_to_end(path, measure_memory)
+    return {
+        "rows": rows,
+        "format": file_format,
+        "file_bytes": path.stat().st_size,
+        "stages": stages,
+        **end_to_end,
+        "rows_per_s": rows / end_to_end["total_s"],
+    }
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def _print_result(result: dict[str, Any]) -> None:
+    memory = result["peak_memory_bytes"]
+    peak = f"{memory / 1e6:8.1f} MB" if memory is not None else "     n/a"
+    print(
+        f"{result['rows']:>7} rows {result['format']:4s}  total {result['total_s']:8.2f}s"
+        f"  {result['rows_per_s']:9.0f} rows/s  peak {peak}"
+        f"  {result['issues']} issues, {result['json_bytes'] / 1e6:.1f} MB JSON"
+    )
+    print("         " + "  ".join(f"{stage} {result['stages'][stage]:7.3f}s" for stage in STAGES))
+
+
+def _compare(results: list[dict[str, Any]], baseline_path: Path) -> float:
+    """Print new/old ratios against a baseline file; return the worst end-to-end ratio."""
+    baseline = json.loads(baseline_path.read_text())
+    previous = {(item["rows"], item["format"]): item for item in baseline["results"]}
+    print(f"compared with {baseline_path} (commit {baseline.get('commit')})")
+    worst = 0.0
+    for result in results:
+        old = previous.get((result["rows"], result["format"]))
+        if old is None:
+            continue
+        ratio = result["total_s"] / old["total_s"]
+        worst = max(worst, ratio)
+        stages = "  ".join(
+            f"{stage} {result['stages'][stage] / old['stages'][stage]:5.2f}x"
+            for stage in STAGES
+            if old["stages"].get(stage)
+        )
+        print(f"{result['rows']:>7} rows {result['format']:4s}  total {ratio:5.2f}x  {stages}")
+    return worst
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help=f"comma-separated row counts (default {DEFAULT_SIZES})")
+    parser.add_argument("--format", choices=("xlsx", "csv"), default="xlsx", dest="file_format")
+    parser.add_argument("--error-rate", type=float, default=0.02, help="share of rows with one bad cell")
+    parser.add_argument("--no-memory", action="store_true", help="skip the tracemalloc peak-memory run")
+    parser.add_argument("--output", type=Path, help="write results as JSON to this path")
+    parser.add_argument("--compare", type=Path, help="earlier --output file to compare against")
+    parser.add_argument("--max-regression", type=float, help="fail if any total time / baseline exceeds this")
+    args = parser.parse_args()
+
+    sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    results = []
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        for rows in sizes:
+            result = run_size(rows, args.file_format, Path(tmp_dir), args.error_rate, not args.no_memory)
+            _print_result(result)
+            results.append(result)
+
+    report = {
+        "commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "created_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "error_rate": args.error_rate,
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+        print(f"wrote {args.output}")
+
+    if args.compare:
+        worst = _compare(results, args.compare)
+        if args.max_regression is not None and worst > args.max_regression:
+            print(f"end-to-end time regressed {worst:.2f}x (limit {args.max_regression:.2f}x)")
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
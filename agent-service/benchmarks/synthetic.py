@@ -0,0 +1,209 @@
+"""Helpers for building large roster workbooks for benchmarks."""
+
+from __future__ import annotations
+
+import csv
+import random
+from datetime import date, datetime, time, timedelta
+from itertools import cycle, islice
+from pathlib import Path
+from typing import Any, Iterable, Iterator, Optional
+
+from openpyxl import Workbook, load_workbook
+
+TEST_DATA_DIR = Path(__file__).resolve().parents[2] / "test-data"
+
+
+def fixture_workbooks() -> list[Path]:
+    """Return the hand-written fixture workbooks under ``test-data/``."""
+    return sorted(TEST_DATA_DIR.glob("*.xlsx"))
+
+
+def load_fixture_rows(path: Path) -> tuple[list[Any], list[tuple[Any, ...]]]:
+    """Return (headers, data rows) from the first sheet of a fixture workbook."""
+    workbook = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = list(workbook.active.iter_rows(values_only=True))
+    finally:
+        workbook.close()
+    return list(rows[0]), [row for row in rows[1:] if any(v is not None for v in row)]
+
+
+def write_workbook(
+    dest: Path,
+    headers: list[Any],
+    rows: Iterable[Iterable[Any]],
+    sheet_title: str = "Roster",
+) -> Path:
+    """
+    Stream rows into a write-only workbook so large files stay cheap to build.
+
+    Note that openpyxl stores strings inline rather than in a shared-strings
+    table (as Excel does), which makes these files slower to read back.
+    """
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet(sheet_title)
+    sheet.append(headers)
+    for row in rows:
+        sheet.append(list(row))
+    workbook.save(dest)
+    return dest
+
+
+def scale_fixture(source: Path, dest: Path, total_rows: int, sheet_title: Optional[str] = None) -> Path:
+    """Repeat a fixture's data rows until the sheet holds ``total_rows`` rows."""
+    headers, rows = load_fixture_rows(source)
+    if not rows:
+        raise ValueError(f"{source} has no data rows to scale")
+    return write_workbook(dest, headers, islice(cycle(rows), total_rows), sheet_title or "Roster")
+
+
+SYNTHETIC_HEADERS = [
+    "Employee Number",
+    "Employee Name",
+    "Employee Email",
+    "Date",
+    "Start Time",
+    "End Time",
+    "Meal Break Duration",
+    "Location",
+]
+
+# Start/end pairs in the mix of styles seen in real uploads.
+_SHIFT_TIMES = [
+    ("09:00", "17:00"),
+    ("9:00 AM", "5:30 PM"),
+    ("07:30", "15:30"),
+    ("6 AM", "2 PM"),
+    ("14:00:00", "22:00:00"),
+    ("22:00", "06:00"),
+    (0.375, 0.708333333),
+    ("10:15", "18:45"),
+    ("11:00 AM", "7:00 PM"),
+    ("16:00", "23:30"),
+]
+_LOCATIONS = ["Sydney CBD", "Parramatta", "Melbourne", "Brisbane", None]
+
+
+def synthetic_shift_rows(count: int, employees: int = 250, start: Optional[date] = None) -> Iterator[tuple[Any, ...]]:
+    """
+    Yield ``count`` deterministic roster rows matching ``SYNTHETIC_HEADERS``.
+
+    Rows cycle through ``employees`` staff and a fixed set of shift times, so
+    the distinct-value counts per column stay realistic at any size.
+    """
+    first = start or date(2024, 1, 15)
+    for index in range(count):
+        employee = index % employees
+        shift_start, shift_end = _SHIFT_TIMES[(index // employees) % len(_SHIFT_TIMES)]
+        yield (
+            f"EMP{employee:05d}",
+            f"Staff Member {employee}",
+            f"staff{employee}@example.com",
+            (first + timedelta(days=(index // employees) % 7)).isoformat(),
+            shift_start,
+            shift_end,
+            30 if index % 3 else None,
+            _LOCATIONS[employee % len(_LOCATIONS)],
+        )
+
+
+_EMPLOYMENT_TYPES = ["Full-time", "Part-time", "Casual", "FT", "casual"]
+_EXTRA_COLUMNS = ["Cost Centre", "Award Level", "Supervisor", "Shift Code", "Comments", "Pay Group"]
+
+# Bad cells injected at ``error_rate``: (column index in synthetic_roster, value).
+_BAD_CELLS = [
+    (4, "31/02/2024"),  # impossible date
+    (5, "25:99"),  # impossible time
+    (6, "9-5"),  # time range in one cell
+    (3, "staff.example.com"),  # malformed email
+    (0, None),  # missing employee number
+]
+
+
+def synthetic_roster(
+    count: int,
+    employees: int = 250,
+    error_rate: float = 0.02,
+    extra_columns: int = 2,
+    seed: int = 0,
+) -> tuple[list[str], Iterator[list[Any]]]:
+    """
+    Return (headers, rows) for a realistic synthetic roster of ``count`` rows.
+
+    Compared with ``synthetic_shift_rows`` the values vary the way real
+    exports do: dates as ISO strings, DD/MM/YYYY strings or date cells; times
+    as 24-hour, AM/PM, Excel fractions or time cells; an employment type and
+    ``extra_columns`` unmapped columns. About ``error_rate`` of the rows get
+    one bad cell (impossible date or time, time range, malformed email or a
+    missing employee number). Output is deterministic for a given ``seed``.
+    """
+    headers = [
+        "Employee Number",
+        "Employee Name",
+        "Employment Type",
+        "Employee Email",
+        "Date",
+        "Start Time",
+        "End Time",
+        "Meal Break Duration",
+        "Location",
+        *_EXTRA_COLUMNS[:extra_columns],
+    ]
+
+    def rows() -> Iterator[list[Any]]:
+        rng = random.Random(seed)
+        first = date(2024, 1, 15)
+        for index in range(count):
+            employee = index % employees
+            day = first + timedelta(days=(index // employees) % 14)
+            style = rng.random()
+            if style < 0.6:
+                shift_date: Any = day.isoformat()
+            elif style < 0.85:
+                shift_date = datetime(day.year, day.month, day.day)
+            else:
+                shift_date = day.strftime("%d/%m/%Y")
+            start, end = _SHIFT_TIMES[rng.randrange(len(_SHIFT_TIMES))]
+            if rng.random() < 0.15 and isinstance(start, str) and ":" in start and "M" not in start:
+                start = time.fromisoformat(start)
+            row = [
+                f"EMP{employee:05d}",
+                f"Staff Member {employee}",
+                _EMPLOYMENT_TYPES[employee % len(_EMPLOYMENT_TYPES)],
+                f"staff{employee}@example.com" if employee % 10 else None,
+                shift_date,
+                start,
+                end,
+                rng.choice((30, 30, 45, None)),
+                _LOCATIONS[employee % len(_LOCATIONS)],
+                *(f"{name[:3].upper()}-{employee % 17}" for name in _EXTRA_COLUMNS[:extra_columns]),
+            ]
+            if rng.random() < error_rate:
+                column, value = _BAD_CELLS[rng.randrange(len(_BAD_CELLS))]
+                row[column] = value
+            yield row
+
+    return headers, rows()
+
+
+def _csv_cell(value: Any) -> Any:
+    # Text exports carry what Excel would display for date/time cells.
+    if isinstance(value, datetime):
+        return value.date().isoformat()
+    if isinstance(value, time):
+        return value.strftime("%H:%M")
+    if isinstance(value, float) and 0 <= value < 1:  # Excel time fraction
+        minutes = round(value * 24 * 60)
+        return f"{minutes // 60:02d}:{minutes % 60:02d}"
+    return value
+
+
+def write_csv(dest: Path, headers: list[Any], rows: Iterable[Iterable[Any]]) -> Path:
+    """Write rows as a UTF-8 CSV export."""
+    with dest.open("w", newline="", encoding="utf-8") as handle:
+        writer = csv.writer(handle)
+        writer.writerow(headers)
+        for row in rows:
+            writer.writerow([_csv_cell(value) for value in row])
+    return dest
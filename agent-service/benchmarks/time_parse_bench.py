@@ -0,0 +1,86 @@
+"""Per-cell cost of time parsing with and without the per-job memo.
+
+Builds a synthetic roster (``synthetic_shift_rows``, 100k shifts by default)
+and parses its start and end time columns three ways:
+
+* parse_time:        ``parse_time`` on every cell (the previous behaviour);
+* TimeParser.parse:  one memo shared across the job, cell by cell, as the row
+  parser now does through ``ParseContext``;
+* parse_time_column: the batch API over each whole column.
+
+Also reports the full ``parse_roster_values`` loop with and without a
+``ParseContext``.
+
+Usage (from agent-service/):
+    poetry run python -m benchmarks.time_parse_bench --rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import time
+from typing import Any, Callable
+
+from agents.roster.services.roster_import import ParseMode
+from agents.roster.services.roster_import.context import ParseContext
+from agents.roster.services.roster_import.header_map import HeaderMap
+from agents.roster.services.roster_import.row_parsers import parse_roster_values
+from agents.roster.services.roster_import.utils import TimeParser, parse_time, parse_time_column
+
+from .synthetic import SYNTHETIC_HEADERS, synthetic_shift_rows
+
+
+def _timed(run: Callable[[], Any]) -> float:
+    started = time.perf_counter()
+    run()
+    return time.perf_counter() - started
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, default=100_000, help="shifts to generate")
+    args = parser.parse_args()
+
+    rows = list(synthetic_shift_rows(args.rows))
+    starts = [row[4] for row in rows]
+    ends = [row[5] for row in rows]
+    cells = len(starts) + len(ends)
+
+    def memoised() -> None:
+        memo = TimeParser()
+        for value in starts:
+            memo.parse(value)
+        for value in ends:
+            memo.parse(value)
+
+    def column() -> None:
+        memo = TimeParser()
+        parse_time_column(starts, memo)
+        parse_time_column(ends, memo)
+
+    cases = {
+        "parse_time": lambda: [parse_time(v) for v in starts] + [parse_time(v) for v in ends],
+        "TimeParser.parse": memoised,
+        "parse_time_column": column,
+    }
+    distinct = len(set(starts) | set(ends))
+    print(f"{args.rows} shifts, {cells} time cells, {distinct} distinct values")
+    for name, run in cases.items():
+        elapsed = _timed(run)
+        print(f"  {name:18s} {elapsed * 1e6 / cells:7.2f} us/cell  {elapsed * 1e3:8.1f} ms total")
+
+    schema = HeaderMap().compile(SYNTHETIC_HEADERS)
+
+    def row_loop(with_context: bool) -> None:
+        context = ParseContext() if with_context else None
+        for row_num, values in enumerate(rows, start=2):
+            parse_roster_values(values, row_num, schema, ParseMode.LENIENT, context=context)
+
+    print("parse_roster_values over every row")
+    for name, with_context in (("no context", False), ("ParseContext", True)):
+        elapsed = _timed(lambda: row_loop(with_context))
+        print(f"  {name:18s} {elapsed * 1e6 / len(rows):7.2f} us/row  {elapsed * 1e3:8.1f} ms total")
+
+
+if __name__ == "__main__":
+    main()
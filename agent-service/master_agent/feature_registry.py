@@ -1,4 +1,6 @@
-from typing import Any, Dict, Optional
+import json
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator, Optional
 
 
 def feature_response(
@@ -23,6 +25,59 @@ def feature_response(
     return resp
 
 
+def encode_json(value: Any) -> bytes:
+    """Compact UTF-8 JSON, byte-for-byte what FastAPI's JSONResponse renders."""
+    return json.dumps(value, ensure_ascii=False, allow_nan=False, separators=(",", ":")).encode("utf-8")
+
+
+class EncodedFeatureResult(Mapping):
+    """
+    A feature result whose bulk is already serialized to JSON bytes.
+
+    ``body`` is a JSON object (e.g. ``ParseResponse.model_dump_json()``) and
+    ``fields`` are extra top-level keys merged after it (type, message, ...).
+    The chat endpoint splices ``to_json()`` into its response as is, so the
+    body is never turned back into Python objects and re-encoded. Reading it
+    as a mapping still works, decoding the body on first access.
+    """
+
+    def __init__(self, body: bytes, fields: Dict[str, Any]):
+        self.body = body
+        self.fields = fields
+        self._decoded: Optional[Dict[str, Any]] = None
+
+    def to_json(self) -> bytes:
+        extra = encode_json(self.fields)
+        if self.body.strip() == b"{}":
+            return extra
+        if extra == b"{}":
+            return self.body
+        return self.body.rstrip()[:-1] + b"," + extra[1:]
+
+    def _body(self) -> Dict[str, Any]:
+        if self._decoded is None:
+            self._decoded = json.loads(self.body)
+        return self._decoded
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self.fields:
+            return self.fields[key]
+        return self._body()[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from (key for key in self._body() if key not in self.fields)
+        yield from self.fields
+
+    def __len__(self) -> int:
+        return len(self._body().keys() | self.fields.keys())
+
+    def get(self, key: str, default: Any = None) -> Any:
+        # Envelope lookups (e.g. logging the note) must not decode the body.
+        if key in self.fields:
+            return self.fields[key]
+        return super().get(key, default)
+
+
 class FeatureBase:
     """
     Base class for all Features
@@ -6,6 +6,7 @@ import time
 import uuid
 from collections import deque
 from pathlib import Path
+from contextlib import asynccontextmanager
 from typing import Deque, Dict, Optional
 
 from dotenv import load_dotenv
@@ -14,14 +15,15 @@ from dotenv import load_dotenv
 # OPENAI_API_KEY, etc. are available at module-import time.
 load_dotenv(dotenv_path=Path(__file__).resolve().parent.parent / ".env", override=False)
 
-from fastapi import Depends, FastAPI, File, Form, Header, HTTPException, Request, UploadFile
+from fastapi import Depends, FastAPI, File, Form, Header, HTTPException, Query, Request, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import RedirectResponse
 from starlette import status
-from starlette.responses import JSONResponse
+from starlette.responses import JSONResponse, Response
 
+from master_agent.config import load_config
 from master_agent.intent_router import IntentRouter
-from master_agent.feature_registry import FeatureRegistry
+from master_agent.feature_registry import EncodedFeatureResult, FeatureRegistry, encode_json
 
 
 # Import features from domain packages
@@ -29,11 +31,30 @@ from agents.compliance.feature import ComplianceFeature
 from agents.debate.feature import DebateFeature
 from agents.debate.models import DebateRequest
 from agents.payroll.feature import PayrollFeature
-from agents.payroll.models import PayrollExplainRequest
+from agents.payroll.models import PayrollExplainBatchRequest, PayrollExplainRequest
 from agents.roster.feature import RosterFeature
 from agents.roster.explain_feature import RosterExplainFeature
+from agents.roster.services.roster_import.issue_store import DEFAULT_PAGE_SIZE, MAX_PAGE_SIZE
+from shared.rag.retriever_manager import rag_stats, warm_up, warmup_status
 
-app = FastAPI(title="FairWorkly Master Agent")
+RAG_WARM_START = os.getenv("RAG_WARM_START", "").strip().lower() in ("1", "true", "yes", "on")
+
+
+@asynccontextmanager
+async def _lifespan(app: FastAPI):
+    # Opt-in: preload embeddings + FAISS in the background so the first
+    # request after a deploy does not pay the cold start; /ready reports it.
+    warm_task = None
+    if RAG_WARM_START:
+        warm_task = asyncio.create_task(warm_up(load_config(), logging.getLogger("rag.warmup")))
+    try:
+        yield
+    finally:
+        if warm_task is not None and not warm_task.done():
+            warm_task.cancel()
+
+
+app = FastAPI(title="FairWorkly Master Agent", lifespan=_lifespan)
 
 def _parse_allowed_origins(raw: str) -> list[str]:
     origins = [item.strip() for item in raw.split(",") if item.strip()]
@@ -162,7 +183,8 @@ registry = FeatureRegistry()
 
 # Register Features
 registry.register("compliance_qa", ComplianceFeature())
-registry.register("roster", RosterFeature())
+roster_feature = RosterFeature()
+registry.register("roster", roster_feature)
 registry.register("roster_explain", RosterExplainFeature())
 registry.register("debate", DebateFeature())
 
@@ -178,6 +200,29 @@ async def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/ready")
+async def readiness_check():
+    """
+    Readiness probe, separate from /health (liveness).
+
+    Without RAG_WARM_START the service is ready as soon as it is up (RAG
+    resources load on first use). With it, /ready returns 503 until the
+    warm-up has finished; a failed warm-up still reports ready, as
+    "degraded", because requests fall back to answering without retrieval.
+    """
+    warmup = warmup_status()
+    if not RAG_WARM_START:
+        return {"status": "ready", "rag": "lazy"}
+    if warmup["state"] == "ready":
+        return {"status": "ready", "rag": warmup}
+    if warmup["state"] == "failed":
+        return {"status": "degraded", "rag": warmup}
+    return JSONResponse(
+        content={"status": "starting", "rag": warmup},
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+    )
+
+
 @app.get("/", include_in_schema=False)
 async def root():
     # Redirect root requests straight to Swagger UI for convenience
@@ -274,14 +319,56 @@ async def chat(
         elapsed_ms,
     )
 
-    return {
+    envelope = {
         "status": "success",
         "request_id": request_id,
         "message": message,
         "file_name": file_name,
         "routed_to": feature_type,
-        "result": result,
     }
+    if isinstance(result, EncodedFeatureResult):
+        # Already serialized (e.g. roster parse results): splice the bytes in
+        # rather than have FastAPI walk and re-encode every entry and issue.
+        body = encode_json(envelope)[:-1] + b',"result":' + result.to_json() + b"}"
+        return Response(content=body, media_type="application/json")
+
+    envelope["result"] = result
+    return envelope
+
+
+@app.get("/api/agent/roster/issues/{result_id}")
+async def roster_issues(
+    result_id: str,
+    code: Optional[str] = None,
+    column: Optional[str] = None,
+    row_from: Optional[int] = Query(None, ge=0),
+    row_to: Optional[int] = Query(None, ge=0),
+    offset: int = Query(0, ge=0),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    _: None = Depends(verify_service_key),
+):
+    """Page through the full issue list of a roster parse whose response was truncated."""
+    page = roster_feature.issue_store.page(
+        result_id,
+        code=code,
+        column=column,
+        row_from=row_from,
+        row_to=row_to,
+        offset=offset,
+        limit=limit,
+    )
+    if page is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Unknown or expired issue result id",
+        )
+    return page
+
+
+@app.get("/api/agent/rag/stats")
+async def rag_cache_stats(_: None = Depends(verify_service_key)):
+    """Hit rates and sizes of this worker's RAG caches."""
+    return rag_stats()
 
 
 @app.post("/api/agent/debate")
@@ -323,6 +410,22 @@ async def payroll_explain(
         )
 
 
+@app.post("/api/agent/payroll/explain/batch")
+async def payroll_explain_batch(
+    request: PayrollExplainBatchRequest,
+    _: None = Depends(verify_service_key),
+):
+    """Explain up to 50 payroll issues with one batched Award retrieval."""
+    try:
+        result = await payroll_feature.process_batch([issue.model_dump() for issue in request.issues])
+        return JSONResponse(content=result, status_code=result.get("code", 500))
+    except Exception:
+        logger.exception("Unhandled error in payroll_explain_batch endpoint")
+        return JSONResponse(
+            content={"code": 500, "msg": "Internal processing error"},
+            status_code=500,
+        )
+
 if __name__ == "__main__":
     import uvicorn
 
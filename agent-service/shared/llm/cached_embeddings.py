@@ -0,0 +1,268 @@
+"""Query embedding cache in front of an embeddings model."""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import logging
+import os
+import threading
+import time
+import unicodedata
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from langchain_core.embeddings import Embeddings
+
+from shared.ttl_cache import TTLCache
+
+DEFAULT_MAX_ENTRIES = 2048
+DEFAULT_TTL_SECONDS = 86400.0
+DEFAULT_DISK_MAX_ENTRIES = 20000
+DEFAULT_DISK_TTL_SECONDS = 30 * 86400.0
+
+
+def normalize_query(text: str) -> str:
+    """Cache key form of a query: NFC, whitespace collapsed, ends trimmed (case kept)."""
+    return " ".join(unicodedata.normalize("NFC", text).split())
+
+
+def embedding_model_id(embeddings: Embeddings) -> str:
+    """Identify the model behind an embeddings object, e.g. ``OpenAIEmbeddings:text-embedding-ada-002``."""
+    name = getattr(embeddings, "model", None) or getattr(embeddings, "model_name", None) or ""
+    return f"{type(embeddings).__name__}:{name}"
+
+
+class _DiskStore:
+    """
+    One file per vector (raw float64), under a directory per model.
+
+    Bounded like the memory layer: files older than ``ttl_seconds`` are
+    treated as missing, and every so often a pruning pass deletes expired
+    files and then the oldest ones beyond ``max_entries``. Between passes the
+    directory may briefly hold about an eighth more than ``max_entries``.
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        model_id: str,
+        max_entries: int = DEFAULT_DISK_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = DEFAULT_DISK_TTL_SECONDS,
+    ) -> None:
+        self.path = root / hashlib.sha256(model_id.encode("utf-8")).hexdigest()[:16]
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._prune_every = max(1, max_entries // 8)
+        self._writes = 0
+        self._lock = threading.Lock()
+
+    def _file(self, text: str) -> Path:
+        return self.path / hashlib.sha256(text.encode("utf-8")).hexdigest()
+
+    def _expired(self, mtime: float, now: float) -> bool:
+        return self.ttl_seconds is not None and now - mtime > self.ttl_seconds
+
+    def get(self, text: str) -> Optional[List[float]]:
+        target = self._file(text)
+        try:
+            if self._expired(target.stat().st_mtime, time.time()):
+                return None
+            data = target.read_bytes()
+        except OSError:
+            return None
+        vector = array("d")
+        vector.frombytes(data)
+        return vector.tolist()
+
+    def put(self, text: str, vector: List[float]) -> None:
+        target = self._file(text)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        partial = target.with_name(f"{target.name}.{threading.get_ident()}.tmp")
+        partial.write_bytes(array("d", vector).tobytes())
+        partial.replace(target)
+        with self._lock:
+            # The first write of a process prunes too, so restarts cannot
+            # keep adding to a directory that is already over budget.
+            self._writes += 1
+            due = self._writes == 1 or self._writes % self._prune_every == 0
+        if due:
+            self.prune()
+
+    def prune(self) -> int:
+        """Delete expired files, then the oldest beyond ``max_entries``; returns how many went."""
+        now = time.time()
+        entries = []
+        with os.scandir(self.path) as listing:
+            for entry in listing:
+                if entry.name.endswith(".tmp"):
+                    continue  # being written
+                try:
+                    entries.append((entry.stat().st_mtime, entry.path))
+                except OSError:
+                    continue  # removed concurrently
+        entries.sort()
+        live = [item for item in entries if not self._expired(item[0], now)]
+        doomed = [path for _, path in entries[: len(entries) - len(live)]]
+        doomed += [path for _, path in live[: max(len(live) - self.max_entries, 0)]]
+        for path in doomed:
+            try:
+                os.unlink(path)
+            except OSError:
+                pass
+        return len(doomed)
+
+
+class CachedQueryEmbeddings(Embeddings):
+    """
+    Wraps an embeddings model and caches ``embed_query`` results.
+
+    Queries are keyed by ``normalize_query(text)`` (and the normalized text is
+    what gets embedded, so spacing variants share one vector). Vectors live in
+    an in-memory LRU/TTL cache and, when ``disk_path`` is set, in a local
+    directory that survives restarts, bounded by ``disk_max_entries`` and
+    ``disk_ttl_seconds``; the model id is part of every key, so a model change
+    never serves stale vectors. ``embed_documents`` (ingestion)
+    is passed through uncached.
+    """
+
+    def __init__(
+        self,
+        embeddings: Embeddings,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+        disk_path: Optional[str] = None,
+        logger: Optional[logging.Logger] = None,
+        disk_max_entries: int = DEFAULT_DISK_MAX_ENTRIES,
+        disk_ttl_seconds: Optional[float] = DEFAULT_DISK_TTL_SECONDS,
+    ) -> None:
+        self.embeddings = embeddings
+        self.model_id = embedding_model_id(embeddings)
+        self.logger = logger or logging.getLogger(__name__)
+        self._memory: TTLCache[str, List[float]] = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+        self._disk = (
+            _DiskStore(Path(disk_path), self.model_id, max_entries=disk_max_entries, ttl_seconds=disk_ttl_seconds)
+            if disk_path
+            else None
+        )
+        self._lock = threading.Lock()
+        self._disk_hits = 0
+        self._computed = 0
+
+    @classmethod
+    def from_config(
+        cls,
+        embeddings: Embeddings,
+        config: Dict[str, Any],
+        logger: Optional[logging.Logger] = None,
+    ) -> "CachedQueryEmbeddings":
+        """Build from the ``embedding_cache`` section of config.yaml."""
+        settings = config.get("embedding_cache") or {}
+        ttl = float(settings.get("ttl_seconds", DEFAULT_TTL_SECONDS) or 0)
+        disk_ttl = float(settings.get("disk_ttl_seconds", DEFAULT_DISK_TTL_SECONDS) or 0)
+        return cls(
+            embeddings,
+            max_entries=int(settings.get("max_entries", DEFAULT_MAX_ENTRIES)),
+            ttl_seconds=ttl if ttl > 0 else None,
+            disk_path=settings.get("disk_path") or None,
+            logger=logger,
+            disk_max_entries=int(settings.get("disk_max_entries", DEFAULT_DISK_MAX_ENTRIES)),
+            disk_ttl_seconds=disk_ttl if disk_ttl > 0 else None,
+        )
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        return self.embeddings.embed_documents(texts)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        return await self.embeddings.aembed_documents(texts)
+
+    def embed_query(self, text: str) -> List[float]:
+        key = normalize_query(text)
+        vector = self._memory.get(key)
+        if vector is None:
+            vector = self._disk_get(key)
+        if vector is None:
+            vector = self.embeddings.embed_query(key)
+            self._store(key, vector)
+        return vector
+
+    async def aembed_query(self, text: str) -> List[float]:
+        key = normalize_query(text)
+        vector = self._memory.get(key)
+        if vector is None and self._disk is not None:
+            vector = await asyncio.to_thread(self._disk_get, key)
+        if vector is None:
+            vector = await self.embeddings.aembed_query(key)
+            if self._disk is not None:
+                await asyncio.to_thread(self._store, key, vector)
+            else:
+                self._store(key, vector)
+        return vector
+
+    async def aembed_queries(self, texts: List[str]) -> List[List[float]]:
+        """
+        Embed several queries, sending every cache miss in one batched request.
+
+        Misses go through the model's ``aembed_documents``, which for OpenAI
+        and HuggingFace returns the same vectors as ``embed_query``.
+        """
+        keys = [normalize_query(text) for text in texts]
+        found: Dict[str, List[float]] = {}
+        for key in dict.fromkeys(keys):
+            vector = self._memory.get(key)
+            if vector is not None:
+                found[key] = vector
+        missing = [key for key in dict.fromkeys(keys) if key not in found]
+        if missing and self._disk is not None:
+            from_disk = await asyncio.to_thread(lambda: [self._disk_get(key) for key in missing])
+            found.update((key, vector) for key, vector in zip(missing, from_disk) if vector is not None)
+            missing = [key for key in missing if key not in found]
+        if missing:
+            vectors = await self.embeddings.aembed_documents(missing)
+
+            def store() -> None:
+                for key, vector in zip(missing, vectors):
+                    self._store(key, vector)
+
+            if self._disk is not None:
+                await asyncio.to_thread(store)
+            else:
+                store()
+            found.update(zip(missing, vectors))
+        return [found[key] for key in keys]
+
+    def _disk_get(self, key: str) -> Optional[List[float]]:
+        if self._disk is None:
+            return None
+        vector = self._disk.get(key)
+        if vector is not None:
+            with self._lock:
+                self._disk_hits += 1
+            self._memory.put(key, vector)
+        return vector
+
+    def _store(self, key: str, vector: List[float]) -> None:
+        with self._lock:
+            self._computed += 1
+        self._memory.put(key, vector)
+        if self._disk is not None:
+            try:
+                self._disk.put(key, vector)
+            except OSError as exc:
+                self.logger.warning("Query embedding not written to disk cache: %s", exc)
+
+    def stats(self) -> Dict[str, Any]:
+        """Memory cache counters plus disk hits, model calls and the overall hit rate."""
+        stats: Dict[str, Any] = self._memory.stats()
+        with self._lock:
+            disk_hits = self._disk_hits
+            computed = self._computed
+        lookups = stats["hits"] + disk_hits + computed
+        stats.update(
+            model=self.model_id,
+            disk_hits=disk_hits,
+            computed=computed,
+            hit_rate=round((stats["hits"] + disk_hits) / lookups, 4) if lookups else 0.0,
+        )
+        return stats
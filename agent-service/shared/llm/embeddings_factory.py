@@ -8,12 +8,20 @@ from typing import Optional, Dict, Any
 from langchain_core.embeddings import Embeddings
 from langchain_openai import OpenAIEmbeddings
 
+from shared.llm.cached_embeddings import CachedQueryEmbeddings
+
 
 def create_embeddings(
     config: Dict[str, Any],
     logger: Optional[logging.Logger] = None,
 ) -> Embeddings:
-    """Return embeddings instance based on deployment mode."""
+    """
+    Return embeddings instance based on deployment mode.
+
+    Unless the ``embedding_cache`` config section disables it (``max_entries: 0``
+    and no ``disk_path``), the model is wrapped in CachedQueryEmbeddings so
+    repeated queries skip the embedding call.
+    """
     logger = logger or logging.getLogger(__name__)
     model_params = config.get("model_params", {})
     mode = model_params.get("deployment_mode_embedding", "local").lower()
@@ -30,10 +38,21 @@ def create_embeddings(
                 "Install it with: poetry install --with local-models"
             ) from err
         logger.debug("Creating local embeddings using %s", model_name)
-        return HuggingFaceEmbeddings(model_name=model_name)
+        return _with_query_cache(HuggingFaceEmbeddings(model_name=model_name), config, logger)
 
     if mode == "online":
         logger.debug("Creating OpenAI embeddings using environment credentials")
-        return OpenAIEmbeddings()
+        return _with_query_cache(OpenAIEmbeddings(), config, logger)
 
     raise ValueError(f"Unsupported deployment_mode_embedding: {mode}")
+
+
+def _with_query_cache(
+    embeddings: Embeddings,
+    config: Dict[str, Any],
+    logger: logging.Logger,
+) -> Embeddings:
+    settings = config.get("embedding_cache") or {}
+    if int(settings.get("max_entries", 1)) <= 0 and not settings.get("disk_path"):
+        return embeddings
+    return CachedQueryEmbeddings.from_config(embeddings, config, logger=logger)
@@ -1,5 +1,6 @@
 """Shared RAG execution entrypoint."""
 
+import asyncio
 from typing import Any, Dict
 
 from shared.llm.factory import LLMProvider
@@ -41,7 +42,7 @@ async def run(
 
     retriever = None
     try:
-        retriever, _ = ensure_retriever(config, logger)
+        retriever, _ = await asyncio.to_thread(ensure_retriever, config, logger)
     except FileNotFoundError as exc:
         logger.warning("Vector store unavailable: %s", exc, exc_info=True)
     except Exception as exc:
@@ -0,0 +1,78 @@
+"""Cache of whole retrieval results, keyed by query, top_k and index version."""
+
+from __future__ import annotations
+
+import hashlib
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+
+from shared.llm.cached_embeddings import normalize_query
+from shared.ttl_cache import TTLCache
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_TTL_SECONDS = 3600.0
+
+# (index version, normalized query, top_k)
+RetrievalKey = Tuple[str, str, int]
+
+
+def index_version(store_path: str) -> str:
+    """
+    Fingerprint of a FAISS store directory from its files' names, sizes and mtimes.
+
+    Cheap enough to check on every request (a few ``stat`` calls); any rewrite
+    of the index, e.g. by scripts/ingest_assets_to_faiss.py, changes it.
+    """
+    digest = hashlib.sha256()
+    for path in sorted(Path(store_path).iterdir()):
+        if path.is_file():
+            info = path.stat()
+            digest.update(f"{path.name}:{info.st_size}:{info.st_mtime_ns};".encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+class RetrievalCache:
+    """
+    LRU/TTL cache of RetrievalResult objects.
+
+    A result is fully determined by the query, ``top_k`` and the index it was
+    searched in, so the index version is part of the key: after the index is
+    rebuilt, old entries are simply never hit again and age out of the LRU.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: Optional[float] = DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self._cache: TTLCache[RetrievalKey, Any] = TTLCache(max_entries=max_entries, ttl_seconds=ttl_seconds)
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "RetrievalCache":
+        """Build from the ``retrieval_cache`` section of config.yaml (``max_entries: 0`` disables)."""
+        settings = config.get("retrieval_cache") or {}
+        ttl = float(settings.get("ttl_seconds", DEFAULT_TTL_SECONDS) or 0)
+        return cls(
+            max_entries=int(settings.get("max_entries", DEFAULT_MAX_ENTRIES)),
+            ttl_seconds=ttl if ttl > 0 else None,
+        )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache.enabled
+
+    @staticmethod
+    def make_key(version: str, query: str, top_k: int) -> RetrievalKey:
+        return (version, normalize_query(query), top_k)
+
+    def get(self, key: RetrievalKey) -> Optional[Any]:
+        return self._cache.get(key)
+
+    def put(self, key: RetrievalKey, result: Any) -> None:
+        self._cache.put(key, result)
+
+    def clear(self) -> None:
+        self._cache.clear()
+
+    def stats(self) -> Dict[str, int]:
+        return self._cache.stats()
@@ -1,10 +1,14 @@
 """RAG retriever manager with process-wide caching."""
 
+import asyncio
 import threading
-from typing import Any
+import time
+from typing import Any, Optional
 
 from master_agent.config import CONFIG_PATH, resolve_document_faiss_path
+from shared.llm.cached_embeddings import CachedQueryEmbeddings
 from shared.llm.embeddings_factory import create_embeddings
+from shared.rag.retrieval_cache import RetrievalCache, index_version
 from shared.vector_db import load_faiss
 from shared.rag_retriever import RAGRetriever
 
@@ -12,31 +16,139 @@ _RESOURCE_LOCK = threading.Lock()
 _EMBEDDINGS = None
 _VECTORSTORE = None
 _RETRIEVER = None
+_RETRIEVAL_CACHE = None
+_STORE_PATH = None
+_INDEX_VERSION = None
+# Background reload of a rebuilt index; a version whose reload failed is not
+# retried until the files change again.
+_RELOAD_THREAD: Optional[threading.Thread] = None
+_FAILED_VERSION = None
+
+# A query that touches the Award text, used to exercise the embeddings client
+# and the FAISS index before real traffic arrives.
+WARMUP_QUERY = "ordinary hours of work and penalty rates"
+_WARMUP: dict[str, Any] = {"state": "idle"}
+
+
+def _current_version(logger) -> Any:
+    try:
+        return index_version(_STORE_PATH)
+    except OSError as exc:
+        # The store directory is being replaced; keep serving what is loaded.
+        logger.warning("Could not fingerprint FAISS store %s: %s", _STORE_PATH, exc)
+        return _INDEX_VERSION
 
 
 def _ensure_retriever(config, logger):
-    """Ensure embeddings/vector store/retriever exist exactly once per process."""
-    global _EMBEDDINGS, _VECTORSTORE, _RETRIEVER
+    """
+    Ensure embeddings/vector store/retriever exist exactly once per process.
 
-    if _RETRIEVER is not None and _VECTORSTORE is not None:
-        return _RETRIEVER, _VECTORSTORE
+    Once loaded, the FAISS directory is fingerprinted on each call (a few
+    ``stat``s); if the index on disk was rebuilt, it is reloaded in a
+    background thread while the loaded store keeps serving. The new store is
+    swapped in with its version, so cached retrieval results of the old index
+    are no longer served.
+
+    The first load blocks on ``_RESOURCE_LOCK`` (also while the startup
+    warm-up holds it), so coroutines call this via ``asyncio.to_thread``.
+    """
+    global _EMBEDDINGS, _VECTORSTORE, _RETRIEVER, _RETRIEVAL_CACHE, _STORE_PATH, _INDEX_VERSION
+
+    retriever = _RETRIEVER
+    if retriever is not None:
+        version = _current_version(logger)
+        if version != retriever.index_version:
+            _start_reload(version, logger)
+        return retriever, retriever.vectorstore
 
     with _RESOURCE_LOCK:
-        if _RETRIEVER is not None and _VECTORSTORE is not None:
-            return _RETRIEVER, _VECTORSTORE
+        if _RETRIEVER is not None:
+            return _RETRIEVER, _RETRIEVER.vectorstore
 
         if _EMBEDDINGS is None:
             _EMBEDDINGS = create_embeddings(config, logger=logger)
 
         if _VECTORSTORE is None:
             store_relative = resolve_document_faiss_path(config)
-            store_absolute = (CONFIG_PATH.parent / store_relative).resolve()
-            _VECTORSTORE = load_faiss(str(store_absolute), _EMBEDDINGS, logger=logger)
+            _STORE_PATH = str((CONFIG_PATH.parent / store_relative).resolve())
+            _VECTORSTORE = load_faiss(_STORE_PATH, _EMBEDDINGS, logger=logger)
+            _INDEX_VERSION = index_version(_STORE_PATH)
+
+        if _RETRIEVAL_CACHE is None:
+            _RETRIEVAL_CACHE = RetrievalCache.from_config(config)
 
-        _RETRIEVER = RAGRetriever(_VECTORSTORE, logger=logger)
+        _RETRIEVER = RAGRetriever(
+            _VECTORSTORE, logger=logger, result_cache=_RETRIEVAL_CACHE, index_version=_INDEX_VERSION
+        )
         logger.info("RAG resources initialized")
         return _RETRIEVER, _VECTORSTORE
 
 
+def _start_reload(version, logger) -> None:
+    global _RELOAD_THREAD
+    with _RESOURCE_LOCK:
+        if version == _FAILED_VERSION or (_RELOAD_THREAD is not None and _RELOAD_THREAD.is_alive()):
+            return
+        _RELOAD_THREAD = threading.Thread(
+            target=_reload_store, args=(version, logger), name="faiss-reload", daemon=True
+        )
+        _RELOAD_THREAD.start()
+
+
+def _reload_store(version, logger) -> None:
+    global _VECTORSTORE, _RETRIEVER, _INDEX_VERSION, _FAILED_VERSION
+    try:
+        vectorstore = load_faiss(_STORE_PATH, _EMBEDDINGS, logger=logger)
+    except Exception as exc:
+        logger.error("Reloading changed FAISS store failed, keeping the loaded one: %s", exc)
+        _FAILED_VERSION = version
+        return
+    retriever = RAGRetriever(vectorstore, logger=logger, result_cache=_RETRIEVAL_CACHE, index_version=version)
+    with _RESOURCE_LOCK:
+        _VECTORSTORE, _RETRIEVER, _INDEX_VERSION = vectorstore, retriever, version
+    logger.info("FAISS store changed on disk, reloaded (version %s)", version)
+
+
+async def warm_up(config, logger) -> dict[str, Any]:
+    """
+    Load embeddings and the FAISS store, then run one retrieval.
+
+    Meant for application startup: the loading runs in a worker thread so
+    the event loop keeps serving meanwhile; requests that need the retriever
+    wait for it in their own worker threads. The outcome is
+    kept for ``warmup_status``; failures are logged, not raised, so requests
+    still fall back to lazy loading.
+    """
+    _WARMUP.clear()
+    _WARMUP["state"] = "warming"
+    started = time.perf_counter()
+    try:
+        retriever, _ = await asyncio.to_thread(_ensure_retriever, config, logger)
+        await retriever.retrieve(WARMUP_QUERY, top_k=1)
+    except Exception as exc:
+        _WARMUP.update(state="failed", error=str(exc))
+        logger.error("RAG warm-up failed: %s", exc, exc_info=True)
+    else:
+        _WARMUP["state"] = "ready"
+        logger.info("RAG warm-up completed in %.2fs", time.perf_counter() - started)
+    _WARMUP["elapsed_ms"] = int((time.perf_counter() - started) * 1000)
+    return warmup_status()
+
+
+def warmup_status() -> dict[str, Any]:
+    """State of the startup warm-up: idle (not requested), warming, ready or failed."""
+    return dict(_WARMUP)
+
+
+def rag_stats() -> dict[str, Any]:
+    """Cache counters of the process-wide RAG resources (empty until first use)."""
+    stats: dict[str, Any] = {}
+    if isinstance(_EMBEDDINGS, CachedQueryEmbeddings):
+        stats["embedding_cache"] = _EMBEDDINGS.stats()
+    if _RETRIEVAL_CACHE is not None:
+        stats["retrieval_cache"] = dict(_RETRIEVAL_CACHE.stats(), index_version=_INDEX_VERSION)
+    return stats
+
+
 # Public alias to minimize call site churn.
 ensure_retriever = _ensure_retriever
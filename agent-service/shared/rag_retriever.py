@@ -2,11 +2,18 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+import numpy as np
+
+from langchain_core.documents import Document
 
 from langchain_community.vectorstores import FAISS
 
+from shared.rag.retrieval_cache import RetrievalCache
+
 
 class RetrievalResult:
     """Container for retrieved documents and metadata."""
@@ -21,21 +28,47 @@ class RetrievalResult:
         self.scores = scores
         self.metadatas = metadatas
 
+    def copy(self) -> "RetrievalResult":
+        """Shallow copy with fresh lists, so a cached result is never mutated by a caller."""
+        return RetrievalResult(list(self.documents), list(self.scores), list(self.metadatas))
+
+
+def _to_result(docs_with_scores: List[Tuple[Document, float]]) -> RetrievalResult:
+    documents, scores, metadatas = [], [], []
+    for doc, score in docs_with_scores:
+        documents.append(doc.page_content)
+        scores.append(score)
+        metadatas.append(doc.metadata or {})
+    return RetrievalResult(documents=documents, scores=scores, metadatas=metadatas)
+
 
 class RAGRetriever:
-    """Simple retriever that queries a FAISS vector store."""
+    """
+    Simple retriever that queries a FAISS vector store.
+
+    Retrieval never blocks the event loop: the query is embedded with the
+    embeddings' ``aembed_query`` (native async for OpenAI; models without an
+    async client run it on the default executor) and the FAISS search, which
+    is CPU-bound, runs in a worker thread. With a ``result_cache``, results
+    are reused for the same (query, top_k) as long as ``index_version`` -- the
+    fingerprint of the loaded index -- stays the same.
+    """
 
     def __init__(
         self,
         vectorstore: FAISS,
         *,
         logger: Optional[logging.Logger] = None,
+        result_cache: Optional[RetrievalCache] = None,
+        index_version: str = "",
     ):
         if vectorstore is None:
             raise ValueError("vectorstore must be provided")
 
         self.vectorstore = vectorstore
         self.logger = logger or logging.getLogger(__name__)
+        self.result_cache = result_cache if result_cache is not None and result_cache.enabled else None
+        self.index_version = index_version
 
     async def retrieve(
         self,
@@ -50,15 +83,106 @@ class RAGRetriever:
         if filter:
             self.logger.debug("FAISS filter ignored (not supported): %s", filter)
 
-        docs_with_scores = self.vectorstore.similarity_search_with_score(query, k=top_k)
-
-        documents, scores, metadatas = [], [], []
-        for doc, score in docs_with_scores:
-            documents.append(doc.page_content)
-            scores.append(score)
-            metadatas.append(doc.metadata or {})
-
-        return RetrievalResult(documents=documents, scores=scores, metadatas=metadatas)
+        cache_key = None
+        if self.result_cache is not None:
+            cache_key = self.result_cache.make_key(self.index_version, query, top_k)
+            cached = self.result_cache.get(cache_key)
+            if cached is not None:
+                return cached.copy()
+
+        embedding = await self._embed_query(query)
+        result = _to_result(await self._search_by_vector(embedding, top_k))
+        if cache_key is not None:
+            self.result_cache.put(cache_key, result.copy())
+        return result
+
+    async def _embed_query(self, query: str) -> List[float]:
+        embeddings = self.vectorstore.embeddings
+        if embeddings is None:
+            # A bare embedding function (deprecated in langchain) has no async form.
+            return await asyncio.to_thread(self.vectorstore._embed_query, query)
+        return await embeddings.aembed_query(query)
+
+    async def _search_by_vector(self, embedding: List[float], top_k: int) -> List[Tuple[Document, float]]:
+        return await asyncio.to_thread(
+            self.vectorstore.similarity_search_with_score_by_vector, embedding, k=top_k
+        )
+
+    async def retrieve_many(self, queries: Sequence[str], top_k: int = 5) -> List[RetrievalResult]:
+        """
+        Retrieve the top_k chunks for each query, in order.
+
+        Cached results are reused; the remaining distinct queries are embedded
+        in one batched embeddings request and searched in a single worker
+        thread, with one FAISS ``index.search`` over the query matrix. Each
+        result equals what ``retrieve(query, top_k)`` returns.
+        """
+        results: List[Optional[RetrievalResult]] = [None] * len(queries)
+        pending: Dict[str, List[int]] = {}
+        for position, query in enumerate(queries):
+            if not query:
+                results[position] = RetrievalResult(documents=[], scores=[], metadatas=[])
+                continue
+            if self.result_cache is not None:
+                cached = self.result_cache.get(self.result_cache.make_key(self.index_version, query, top_k))
+                if cached is not None:
+                    results[position] = cached.copy()
+                    continue
+            pending.setdefault(query, []).append(position)
+
+        if pending:
+            texts = list(pending)
+            embeddings = await self._embed_queries(texts)
+            searched = await asyncio.to_thread(self._search_many, embeddings, top_k)
+            for query, result in zip(texts, searched):
+                if self.result_cache is not None:
+                    self.result_cache.put(self.result_cache.make_key(self.index_version, query, top_k), result.copy())
+                for position in pending[query]:
+                    results[position] = result.copy()
+        return results
+
+    async def _embed_queries(self, queries: List[str]) -> List[List[float]]:
+        embeddings = self.vectorstore.embeddings
+        if embeddings is None:
+            return [await self._embed_query(query) for query in queries]
+        batched = getattr(embeddings, "aembed_queries", None)
+        if batched is not None:
+            return await batched(queries)
+        return await embeddings.aembed_documents(queries)
+
+    def _search_many(self, embeddings: List[List[float]], top_k: int) -> List[RetrievalResult]:
+        store = self.vectorstore
+        if not isinstance(store, FAISS):
+            # Other vector stores: one thread hop, one search per query.
+            search = store.similarity_search_with_score_by_vector
+            return [_to_result(search(embedding, k=top_k)) for embedding in embeddings]
+
+        # The batched form of FAISS.similarity_search_with_score_by_vector
+        # (no filter): the same L2 normalisation when the store was built for
+        # cosine, and the raw index scores, which that method also returns
+        # for every distance strategy (the strategy only changes how a
+        # score_threshold compares, and none is used here).
+        matrix = np.array(embeddings, dtype=np.float32)
+        if store._normalize_L2:
+            import faiss
+
+            faiss.normalize_L2(matrix)
+        all_scores, all_indices = store.index.search(matrix, top_k)
+
+        results = []
+        for scores, indices in zip(all_scores, all_indices):
+            docs_with_scores = []
+            for score, index in zip(scores, indices):
+                if index == -1:
+                    # Fewer than top_k vectors in the index.
+                    continue
+                doc_id = store.index_to_docstore_id[index]
+                doc = store.docstore.search(doc_id)
+                if not isinstance(doc, Document):
+                    raise ValueError(f"Could not find document for id {doc_id}, got {doc}")
+                docs_with_scores.append((doc, score))
+            results.append(_to_result(docs_with_scores))
+        return results
 
     async def retrieve_with_threshold(
         self,
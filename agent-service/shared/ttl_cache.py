@@ -0,0 +1,121 @@
+"""Thread-safe LRU cache with optional TTL and byte budget."""
+
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Least-recently-used cache bounded by entry count and, optionally, bytes.
+
+    Entries older than ``ttl_seconds`` are treated as misses and dropped on
+    access. ``size_of`` measures a value for the ``max_bytes`` budget; a value
+    larger than the whole budget is not stored. Safe to share between the
+    event loop and worker threads.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 128,
+        ttl_seconds: Optional[float] = None,
+        max_bytes: Optional[int] = None,
+        size_of: Optional[Callable[[V], int]] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        if max_bytes is not None and size_of is None:
+            raise ValueError("size_of is required when max_bytes is set")
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._size_of = size_of
+        self._clock = clock
+        self._lock = threading.Lock()
+        # key -> (stored_at, size, value), oldest first
+        self._entries: "OrderedDict[K, Tuple[float, int, V]]" = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_entries > 0
+
+    def get(self, key: K) -> Optional[V]:
+        with self._lock:
+            item = self._entries.get(key)
+            if item is None:
+                self._misses += 1
+                return None
+            stored_at, size, value = item
+            if self.ttl_seconds is not None and self._clock() - stored_at > self.ttl_seconds:
+                del self._entries[key]
+                self._bytes -= size
+                self._expirations += 1
+                self._misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: K, value: V, size: Optional[int] = None) -> bool:
+        """
+        Store ``value``; returns False if it was not stored (disabled or over budget).
+
+        ``size`` skips ``size_of`` when the caller already knows the value's size.
+        """
+        if not self.enabled:
+            return False
+        if size is None:
+            size = self._size_of(value) if self._size_of is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            return False
+
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._bytes -= previous[1]
+            self._entries[key] = (self._clock(), size, value)
+            self._bytes += size
+            while len(self._entries) > self.max_entries or (
+                self.max_bytes is not None and self._bytes > self.max_bytes
+            ):
+                _, (_, evicted_size, _) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self._evictions += 1
+        return True
+
+    def invalidate(self, key: K) -> None:
+        with self._lock:
+            item = self._entries.pop(key, None)
+            if item is not None:
+                self._bytes -= item[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def stats(self) -> Dict[str, int]:
+        """Snapshot of size and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "hits": self._hits,
+                "misses": self._misses,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
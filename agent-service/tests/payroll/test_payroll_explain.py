@@ -127,6 +127,7 @@ def patch_feature(monkeypatch):
                 "sleep": _instant_sleep,
                 "wait_for": _instant_wait_for,
                 "TimeoutError": asyncio.TimeoutError,
+                "to_thread": asyncio.to_thread,
             }),
         )
 
@@ -205,6 +206,7 @@ def test_retry_success_on_second_attempt(monkeypatch):
             "sleep": _instant_sleep,
             "wait_for": _instant_wait_for,
             "TimeoutError": asyncio.TimeoutError,
+            "to_thread": asyncio.to_thread,
         }),
     )
 
@@ -259,3 +261,47 @@ def test_payroll_explain_rejects_missing_service_key():
         json=VALID_PAYLOAD,
     )
     assert response.status_code == 401
+
+
+# ---------------------------------------------------------------------------
+# Batch explain
+# ---------------------------------------------------------------------------
+
+
+class StubBatchRetriever(StubRetriever):
+    def __init__(self):
+        self.batches = []
+
+    async def retrieve_many(self, queries, top_k=3):
+        self.batches.append(list(queries))
+        return [StubRetrievalResult() for _ in queries]
+
+
+def test_batch_uses_one_retrieval_and_keeps_order(patch_feature, monkeypatch):
+    patch_feature()
+    monkeypatch.setattr(feature_module, "asyncio", asyncio)
+    retriever = StubBatchRetriever()
+    monkeypatch.setattr(feature_module, "ensure_retriever", lambda config, logger: (retriever, None))
+
+    second = {**VALID_PAYLOAD, "issueId": "test-002", "categoryType": "Overtime"}
+    feature = feature_module.PayrollFeature()
+    result = asyncio.run(feature.process_batch([VALID_PAYLOAD, second]))
+
+    assert result["code"] == 200
+    assert retriever.batches == [["PenaltyRate Saturday (125% rate)", "Overtime Saturday (125% rate)"]]
+    items = result["data"]["results"]
+    assert [item["issueId"] for item in items] == ["test-001", "test-002"]
+    assert all(item["code"] == 200 and item["data"]["recommendation"] for item in items)
+
+
+def test_batch_missing_field_returns_400(patch_feature):
+    patch_feature()
+    feature = feature_module.PayrollFeature()
+    result = asyncio.run(feature.process_batch([{"issueId": "x"}]))
+    assert result["code"] == 400
+
+
+def test_batch_endpoint_validates_size():
+    client = TestClient(main_module.app)
+    response = client.post("/api/agent/payroll/explain/batch", json={"issues": []}, headers=_AUTH_HEADERS)
+    assert response.status_code == 422
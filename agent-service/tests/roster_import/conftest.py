@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 from openpyxl import Workbook
 
@@ -46,3 +48,66 @@ def employee_excel(temp_excel_path):
 
     wb.save(temp_excel_path)
     return temp_excel_path
+
+
+ROSTER_HEADERS = ["Employee Number", "Date", "Start Time", "End Time", "Employment Type", "Employee Email"]
+
+
+class DummyUploadFile:
+    """Minimal stand-in for an UploadFile: async read() and a filename."""
+
+    def __init__(self, content: bytes, filename: str):
+        self._content = content
+        self.filename = filename
+
+    async def read(self) -> bytes:
+        return self._content
+
+
+@pytest.fixture
+def make_upload():
+    """Build a DummyUploadFile from bytes and a file name."""
+    return DummyUploadFile
+
+
+@pytest.fixture
+def process_upload():
+    """Run RosterFeature.process on an upload of ``content``."""
+    def _process(feature, content, file_name="roster.xlsx", context_payload=None):
+        payload = {"file": DummyUploadFile(content, file_name), "file_name": file_name}
+        if context_payload is not None:
+            payload["context_payload"] = context_payload
+        return asyncio.run(feature.process(payload))
+
+    return _process
+
+
+@pytest.fixture
+def roster_headers():
+    """Roster header row used with write_roster / write_workbook."""
+    return list(ROSTER_HEADERS)
+
+
+@pytest.fixture
+def write_workbook():
+    """Write ``{sheet title: rows}`` to a new workbook at ``path``."""
+    def _write(path, sheets):
+        wb = Workbook()
+        wb.remove(wb.active)
+        for title, rows in sheets.items():
+            ws = wb.create_sheet(title)
+            for row in rows:
+                ws.append(row)
+        wb.save(path)
+        return path
+
+    return _write
+
+
+@pytest.fixture
+def write_roster(write_workbook):
+    """Write ROSTER_HEADERS plus ``rows`` to a single-sheet workbook at ``path``."""
+    def _write(path, rows):
+        return write_workbook(path, {"Roster": [ROSTER_HEADERS, *rows]})
+
+    return _write
@@ -0,0 +1,100 @@
+from agents.roster.services.roster_import import ParseIssueSeverity, ParseResultStatus
+
+class TestParseRosterBatch:
+    """Tests for parse_roster_batch()."""
+
+    def test_all_sheets_of_one_workbook(self, handler, tmp_path, write_workbook, roster_headers):
+        path = write_workbook(
+            tmp_path / "sites.xlsx",
+            {
+                "Sydney": [roster_headers, ["EMP001", "2024-01-15", "09:00", "17:00", "casual"]],
+                "Melbourne": [
+                    roster_headers,
+                    ["EMP002", "2024-01-16", "10:00", "18:00", "casual"],
+                    ["EMP003", "2024-01-17", "bad", "18:00", "casual"],
+                ],
+                "Instructions": [["Fill in one row per shift."]],
+            },
+        )
+
+        response = handler.parse_roster_batch([str(path)], max_workers=2)
+
+        assert [e.employee_number for e in response.result.entries] == ["EMP001", "EMP002"]
+        assert response.summary.status == ParseResultStatus.ROW_ERROR
+        errors = [i for i in response.issues if i.severity == ParseIssueSeverity.ERROR.value]
+        assert [(i.sheet, i.row) for i in errors] == [("Melbourne", 3)]
+        skipped = [i for i in response.issues if i.code == "SHEET_SKIPPED"]
+        assert [i.sheet for i in skipped] == ["Instructions"]
+        assert [r["__sheet__"] for r in response.result.raw_rows] == ["Sydney", "Melbourne", "Melbourne"]
+
+    def test_multiple_files_are_labelled_by_file(self, handler, tmp_path, roster_excel, write_workbook, roster_headers):
+        other = write_workbook(
+            tmp_path / "site-b.xlsx",
+            {"Roster": [roster_headers, ["EMP009", "2024-01-15", "09:00", "not a time", "casual"]]},
+        )
+
+        response = handler.parse_roster_batch([str(roster_excel), str(other)], max_workers=2)
+
+        assert response.result.total_shifts == 3
+        assert {i.sheet for i in response.issues} == {"site-b.xlsx:Roster"}
+
+    def test_only_non_roster_sheets_stay_blocking(self, handler, tmp_path, write_workbook):
+        path = write_workbook(
+            tmp_path / "empty.xlsx",
+            {"A": [["Note"]], "B": [["Name", "Value"], ["x", 1]]},
+        )
+
+        response = handler.parse_roster_batch([str(path)], max_workers=1)
+
+        assert response.summary.status == ParseResultStatus.BLOCKING
+        assert {i.sheet for i in response.issues} == {"A", "B"}
+
+    def test_missing_file_is_reported(self, handler, tmp_path):
+        response = handler.parse_roster_batch([str(tmp_path / "missing.xlsx")])
+
+        assert response.issues[0].code == "FILE_NOT_FOUND"
+        assert response.issues[0].sheet == "missing.xlsx"
+
+    def test_same_file_names_get_distinct_labels(self, handler, tmp_path, write_workbook, roster_headers):
+        paths = []
+        for site in ("north", "south"):
+            (tmp_path / site).mkdir()
+            paths.append(
+                str(
+                    write_workbook(
+                        tmp_path / site / "roster.xlsx",
+                        {"Roster": [roster_headers, ["EMP001", "2024-01-15", "09:00", "bad", "casual"]]},
+                    )
+                )
+            )
+
+        from concurrent.futures import ThreadPoolExecutor
+
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            response = handler.parse_roster_batch(paths, executor=executor)
+
+        assert [i.sheet for i in response.issues] == ["roster.xlsx#1:Roster", "roster.xlsx#2:Roster"]
+
+    def test_process_pool_is_reused_across_calls(self, handler, tmp_path, roster_excel, write_workbook, roster_headers):
+        from agents.roster.services.roster_import import batch
+
+        other = write_workbook(
+            tmp_path / "b.xlsx", {"Roster": [roster_headers, ["EMP009", "2024-01-15", "09:00", "17:00", "casual"]]}
+        )
+        handler.parse_roster_batch([str(roster_excel), str(other)], max_workers=2)
+        pool = batch._POOLS[2]
+        handler.parse_roster_batch([str(roster_excel), str(other)], max_workers=2)
+
+        assert batch._POOLS[2] is pool
+
+    def test_single_file_issues_have_no_sheet_key(self, handler, tmp_path, write_workbook, roster_headers):
+        path = write_workbook(
+            tmp_path / "one.xlsx", {"Roster": [roster_headers, ["EMP001", "2024-01-15", "bad", "17:00", "casual"]]}
+        )
+
+        issue = handler.parse_roster_excel(str(path)).issues[0]
+
+        assert "sheet" not in issue.model_dump()
+        assert '"sheet"' not in issue.model_dump_json()
+        issue.sheet = "Roster"
+        assert issue.model_dump(by_alias=True)["sheet"] == "Roster"
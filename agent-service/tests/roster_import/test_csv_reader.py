@@ -0,0 +1,115 @@
+import pytest
+
+from agents.roster.services.roster_import.readers import FORMAT_CSV, FORMAT_XLSX, detect_format
+
+ROSTER_CSV = (
+    "Employee Email,Employee Number,Employee Name,Employment Type,Date,Start Time,End Time,"
+    "Has Meal Break,Meal Break Duration,Location,Notes\n"
+    "john@example.com,EMP001,John Smith,full-time,2024-01-15,09:00,17:00,Yes,30,Office,Regular shift\n"
+    ",,,,,,,,,,\n"
+    "jane@example.com,EMP002,Jane Doe,part-time,2024-01-15,14:00,22:00,Yes,30,Store,\n"
+)
+
+
+class TestReadCsv:
+    """Tests for read_csv()."""
+
+    def test_read_csv_rows_and_row_numbers(self, handler, tmp_path):
+        path = tmp_path / "roster.csv"
+        path.write_text(ROSTER_CSV, encoding="utf-8")
+
+        data = handler.read_csv(str(path))
+
+        assert [row["__row__"] for row in data] == [2, 4]  # blank record 3 skipped
+        assert data[0]["Employee Number"] == "EMP001"
+        assert data[1]["Notes"] is None
+
+    def test_read_tsv_by_suffix(self, handler, tmp_path):
+        path = tmp_path / "roster.tsv"
+        path.write_text("Name\tValue\nTest1\t100\n", encoding="utf-8")
+
+        assert handler.read_csv(str(path)) == [{"Name": "Test1", "Value": "100", "__row__": 2}]
+
+    def test_header_detection_skips_title_rows(self, handler, tmp_path):
+        path = tmp_path / "roster.csv"
+        path.write_text("Weekly roster\n\nName,Value\nTest1,100\n", encoding="utf-8-sig")
+
+        assert handler.read_csv(str(path)) == [{"Name": "Test1", "Value": "100", "__row__": 4}]
+
+    def test_explicit_header_row_not_found(self, handler, tmp_path):
+        path = tmp_path / "roster.csv"
+        path.write_text("Name,Value\n", encoding="utf-8")
+
+        with pytest.raises(ValueError, match=r"Header row not found"):
+            handler.read_csv(str(path), header_row=5)
+
+
+class TestFormatDispatch:
+    """Tests for suffix/content based reader selection."""
+
+    def test_detect_format(self, tmp_path, roster_excel):
+        unnamed_csv = tmp_path / "upload"
+        unnamed_csv.write_text("Name;Value\nTest1;100\n", encoding="utf-8")
+        unnamed_xlsx = tmp_path / "upload.bin"
+        unnamed_xlsx.write_bytes(roster_excel.read_bytes())
+
+        assert detect_format(str(roster_excel)) == FORMAT_XLSX
+        assert detect_format(str(unnamed_xlsx)) == FORMAT_XLSX
+        assert detect_format(str(unnamed_csv)) == FORMAT_CSV
+
+    def test_parse_roster_csv_matches_xlsx(self, handler, tmp_path, roster_excel):
+        csv_path = tmp_path / "roster.csv"
+        csv_path.write_text(ROSTER_CSV.replace(",,,,,,,,,,\n", ""), encoding="utf-8")
+
+        from_csv = handler.parse_roster_excel(str(csv_path))
+        from_xlsx = handler.parse_roster_excel(str(roster_excel))
+
+        assert from_csv.issues == []
+        assert [e.model_dump() for e in from_csv.result.entries] == [
+            e.model_dump() for e in from_xlsx.result.entries[:2]
+        ]
+
+    def test_parse_sniffed_csv_without_suffix(self, handler, tmp_path):
+        path = tmp_path / "upload"
+        path.write_text(
+            "Employee Number;Date;Start Time;End Time;Employment Type\nEMP001;2024-01-15;09:00;17:00;casual\n",
+            encoding="utf-8",
+        )
+
+        response = handler.parse_roster_excel(str(path))
+
+        assert response.issues == []
+        assert response.result.entries[0].excel_row == 2
+
+    def test_parse_sniffed_xlsx_without_suffix(self, handler, tmp_path, roster_excel):
+        path = tmp_path / "upload"
+        path.write_bytes(roster_excel.read_bytes())
+
+        response = handler.parse_roster_excel(str(path))
+
+        assert len(response.result.entries) == 3
+
+    def test_unknown_suffix_is_rejected(self, handler, tmp_path):
+        path = tmp_path / "award.pdf"
+        path.write_bytes(b"%PDF-1.7\n%\xe2\xe3\xcf\xd3\n")
+        blob = tmp_path / "upload"
+        blob.write_bytes(b"\x00\x01binary")
+
+        response = handler.parse_roster_excel(str(path))
+
+        assert [(i.code, i.message) for i in response.issues] == [
+            ("FILE_READ_ERROR", "Invalid file format. Expected .xlsx, got: .pdf")
+        ]
+        with pytest.raises(ValueError, match=r"Invalid file format"):
+            detect_format(str(blob))
+
+    def test_read_error_mid_file_becomes_issue(self, handler, tmp_path):
+        path = tmp_path / "roster.csv"
+        header, first, _, second = ROSTER_CSV.splitlines()
+        path.write_text("\n".join([header, first, second.replace("Store", "x" * 200_000)]) + "\n")
+
+        response = handler.parse_roster_excel(str(path))
+
+        assert len(response.result.entries) == 1
+        assert response.issues[-1].code == "FILE_READ_ERROR"
+        assert "field larger than field limit" in response.issues[-1].message
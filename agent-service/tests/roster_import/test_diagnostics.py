@@ -0,0 +1,107 @@
+import json
+import logging
+
+from agents.roster.feature import RosterFeature
+from agents.roster.services.parse_executor import RosterParseExecutor
+from agents.roster.services.roster_import.diagnostics import NO_DIAGNOSTICS, ParseDiagnostics
+from agents.roster.services.roster_import.result_cache import ParseResultCache
+
+
+class TestParseDiagnostics:
+    """Tests for the stage timers and counters."""
+
+    def test_stage_excludes_nested_stage_time(self):
+        diagnostics = ParseDiagnostics()
+        rows = diagnostics.timed_rows("read_rows", iter([(2, ("a",)), (3, ("b",))]))
+        with diagnostics.stage("parse_rows", exclude="read_rows"):
+            assert [row for row, _ in rows] == [2, 3]
+
+        report = diagnostics.as_dict()
+        assert set(report["stages_ms"]) == {"read_rows", "parse_rows"}
+        assert report["stages_ms"]["parse_rows"] >= 0
+        assert report["counters"] == {"rows_read": 2}
+
+    def test_timed_rows_closes_source(self):
+        closed = []
+
+        def source():
+            try:
+                yield 1
+                yield 2
+            finally:
+                closed.append(True)
+
+        diagnostics = ParseDiagnostics()
+        rows = diagnostics.timed_rows("read_rows", source())
+        next(rows)
+        rows.close()
+
+        assert closed == [True]
+        assert diagnostics.counters["rows_read"] == 1
+
+    def test_disabled_diagnostics_record_nothing(self):
+        rows = iter([1, 2])
+        assert NO_DIAGNOSTICS.timed_rows("read_rows", rows) is rows
+        with NO_DIAGNOSTICS.stage("parse_rows"):
+            NO_DIAGNOSTICS.count("entries", 3)
+        assert NO_DIAGNOSTICS.as_dict() == {"stages_ms": {}, "counters": {}}
+
+
+class TestParserDiagnostics:
+    def test_parse_records_stages_and_counts(self, handler, roster_excel):
+        diagnostics = ParseDiagnostics()
+        response = handler.parse_roster_excel(str(roster_excel), diagnostics=diagnostics)
+
+        assert {"load_workbook", "header_detect", "read_rows", "schema", "parse_rows", "build_result",
+                "build_response"} <= set(diagnostics.stages)
+        counters = diagnostics.counters
+        assert counters["rows_read"] == 3
+        assert counters["entries"] == len(response.result.entries) == 3
+        assert counters["issues"] == response.summary.total_issues
+        assert counters["bytes_read"] == roster_excel.stat().st_size
+
+    def test_response_is_unchanged(self, handler, roster_excel):
+        plain = handler.parse_roster_excel(str(roster_excel))
+        traced = handler.parse_roster_excel(str(roster_excel), diagnostics=ParseDiagnostics())
+        assert plain.model_dump_json() == traced.model_dump_json()
+
+
+class TestRosterFeatureDiagnostics:
+    def test_block_only_when_requested(self, roster_excel, process_upload):
+        feature = RosterFeature(
+            parse_executor=RosterParseExecutor(max_workers=1),
+            result_cache=ParseResultCache(max_entries=0),
+            log_diagnostics=False,
+        )
+        content = roster_excel.read_bytes()
+
+        plain = process_upload(feature, content)
+        traced = process_upload(feature, content, context_payload={"diagnostics": True})
+
+        assert "diagnostics" not in plain
+        report = traced["diagnostics"]
+        assert {"spool", "parse_rows", "serialize", "total"} <= set(report["stages_ms"])
+        assert report["counters"]["entries"] == 3
+        assert json.loads(traced.to_json())["diagnostics"] == report
+
+    def test_logged_when_enabled(self, roster_excel, caplog, process_upload):
+        feature = RosterFeature(
+            parse_executor=RosterParseExecutor(max_workers=1),
+            result_cache=ParseResultCache(max_entries=4),
+            log_diagnostics=True,
+        )
+        content = roster_excel.read_bytes()
+
+        with caplog.at_level(logging.INFO, logger="agents.roster.feature"):
+            first = process_upload(feature, content)
+            process_upload(feature, content)
+
+        assert "diagnostics" not in first
+        reports = [
+            json.loads(record.getMessage().split(": ", 1)[1])
+            for record in caplog.records
+            if record.getMessage().startswith("Roster parse diagnostics")
+        ]
+        assert len(reports) == 2
+        assert "hash" in reports[0]["stages_ms"]
+        assert reports[1]["counters"] == {"cache_hits": 1}
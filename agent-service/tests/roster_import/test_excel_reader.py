@@ -1,5 +1,8 @@
 import pytest
 from openpyxl import Workbook, load_workbook
+from openpyxl.styles import Font
+
+from agents.roster.services.roster_import.excel_reader import open_excel_rows
 
 class TestReadExcel:
     """Tests for read_excel() function."""
@@ -107,3 +110,81 @@ class TestReadExcel:
 
         data = handler.read_excel(str(temp_excel_path))
         assert data[0]["Optional"] is None
+
+
+class TestIterExcel:
+    """Tests for the lazy iter_excel() reader."""
+
+    def test_iter_excel_yields_same_rows_as_read_excel(self, handler, roster_excel):
+        """Streaming and eager reads produce identical rows."""
+        rows = handler.iter_excel(str(roster_excel))
+
+        assert not isinstance(rows, list)
+        assert list(rows) == handler.read_excel(str(roster_excel))
+
+    def test_iter_excel_is_lazy(self, handler):
+        """Nothing is opened until the first row is requested."""
+        rows = handler.iter_excel("/nonexistent/path/file.xlsx")
+
+        with pytest.raises(FileNotFoundError):
+            next(rows)
+
+    def test_iter_excel_closing_early_closes_workbook(self, handler, roster_excel):
+        """Abandoning the iterator mid-sheet should release the workbook."""
+        rows = handler.iter_excel(str(roster_excel))
+        first = next(rows)
+        rows.close()
+
+        assert first["__row__"] == 2
+        with pytest.raises(StopIteration):
+            next(rows)
+
+
+class TestReadExcelValuesOnly:
+    """Tests for the values_only reader mode."""
+
+    def test_values_only_matches_cell_reader(self, handler, roster_excel):
+        """Both reader modes return identical rows."""
+        assert handler.read_excel(str(roster_excel), values_only=True) == handler.read_excel(str(roster_excel))
+
+    def test_values_only_row_numbers_with_gaps(self, handler, temp_excel_path):
+        """Row counter stays aligned with Excel rows across blank and leading rows."""
+        wb = Workbook()
+        ws = wb.active
+        ws["A3"] = "Name"
+        ws["B3"] = "Value"
+        ws["A4"] = "Test1"
+        ws["B4"] = 100
+        ws["A7"] = "Test2"
+        ws["B7"] = 200
+        wb.save(temp_excel_path)
+
+        data = handler.read_excel(str(temp_excel_path), values_only=True)
+
+        assert [row["__row__"] for row in data] == [4, 7]
+        assert data == handler.read_excel(str(temp_excel_path))
+
+    def test_values_only_explicit_header_row(self, handler, temp_excel_path):
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Title only"])
+        ws.append(["Name", "Value"])
+        ws.append(["Test1", 100])
+        wb.save(temp_excel_path)
+
+        data = handler.read_excel(str(temp_excel_path), header_row=2, values_only=True)
+
+        assert data == [{"Name": "Test1", "Value": 100, "__row__": 3}]
+
+    def test_values_only_stops_at_last_header_column(self, handler, temp_excel_path):
+        """Formatted-but-empty trailing columns are not read."""
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Name", "Value"])
+        ws.append(["Test1", 100])
+        ws.cell(row=2, column=40).font = Font(bold=True)
+        wb.save(temp_excel_path)
+
+        headers, rows = open_excel_rows(str(temp_excel_path), values_only=True)
+        assert headers == ["Name", "Value"]
+        assert list(rows) == [(2, ("Test1", 100))]
@@ -1,6 +1,10 @@
-import pytest
+import json
+from datetime import datetime, timedelta
+
+from fastapi.encoders import jsonable_encoder
 from openpyxl import Workbook
 
+from agents.roster.services.roster_import import RawRowsMode
 from agents.roster.services.roster_import.header_map import HeaderMap, normalize_header
 
 class TestHeaderAliases:
@@ -76,3 +80,64 @@ class TestDuplicateCanonicalDetection:
         result = response.result
         assert len(result.entries) == 1
         assert result.entries[0].employee_email == "john@example.com"
+
+
+class TestSheetSchema:
+    """Tests for the compiled per-sheet header schema."""
+
+    def test_compile_resolves_columns_extras_and_duplicates(self):
+        mapper = HeaderMap()
+        schema = mapper.compile(["Employee Number", "Date", None, "Shift Code", "date"])
+
+        assert schema.columns == {"employee_number": 0, "date": 4}
+        assert schema.extras == {"Shift Code": 3}
+        assert schema.duplicates == {"date": ["Date", "date"]}
+        assert schema.value(("EMP001", "2024-01-15", None, "A", "2024-01-16"), "date") == "2024-01-16"
+        assert schema.missing_keys(["employee_number", "start_time"]) == ["start_time"]
+
+    def test_compile_is_memoised_per_header_row(self):
+        mapper = HeaderMap()
+        headers = ["Employee Number", "Date"]
+
+        assert mapper.compile(headers) is mapper.compile(list(headers))
+
+    def test_schema_matches_dict_normalization(self):
+        mapper = HeaderMap()
+        row = {"Employee Number": "EMP001", "Employee Email": "a@example.com", "Shift Code": "A", "__row__": 2}
+        schema, values = mapper.compile_row(row)
+
+        expected = mapper.normalize_headers(row)
+        expected.pop("__row__")
+        assert schema.normalize(values) == expected
+
+    def test_duplicate_columns_warn_on_every_row(self, handler, temp_excel_path):
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Employee Number", "Date", "date", "Start Time", "End Time", "Employment Type"])
+        ws.append(["EMP001", "2024-01-15", "2024-01-16", "09:00", "17:00", "casual"])
+        ws.append(["EMP002", "2024-01-15", "2024-01-16", "09:00", "17:00", "casual"])
+        wb.save(temp_excel_path)
+
+        response = handler.parse_roster_excel(str(temp_excel_path))
+
+        duplicate_rows = [i.row for i in response.issues if i.code == "DUPLICATE_CANONICAL_COLUMN_IN_ROW"]
+        assert duplicate_rows == [2, 3]
+        assert [e.date.isoformat() for e in response.result.entries] == ["2024-01-16", "2024-01-16"]
+
+    def test_raw_rows_encode_like_jsonable_encoder(self, handler, temp_excel_path):
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Employee Number", "Date", "Start Time", "End Time", "Employment Type", "Hours", "Approved At"])
+        ws.append(["EMP001", datetime(2024, 1, 15), "09:00", "17:00", "casual", timedelta(hours=30),
+                   datetime(2024, 1, 16, 8, 30)])
+        ws["F2"].number_format = "[h]:mm"
+        wb.save(temp_excel_path)
+
+        for mode in (RawRowsMode.FULL, RawRowsMode.COLUMNAR):
+            response = handler.parse_roster_excel(str(temp_excel_path), raw_rows=mode)
+            encoded = json.loads(response.model_dump_json())["result"]["raw_rows"]
+
+            assert encoded == jsonable_encoder(response.model_dump())["result"]["raw_rows"]
+        full = handler.parse_roster_excel(str(temp_excel_path)).result.raw_rows[0]
+        assert full["date"] == "2024-01-15T00:00:00"
+        assert (full["Hours"], full["Approved At"]) == (108000.0, "2024-01-16T08:30:00")
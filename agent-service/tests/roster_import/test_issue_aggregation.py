@@ -1,4 +1,10 @@
-from agents.roster.services.roster_import.issues import build_summary, build_issue_summary, is_blocking_issue
+from agents.roster.services.roster_import.issues import (
+    IssueAccumulator,
+    build_issue_summary,
+    build_response,
+    build_summary,
+    is_blocking_issue,
+)
 from agents.roster.services.roster_import import ParseIssue, ParseIssueSeverity, ParseResultStatus
 
 def test_build_summary_statuses():
@@ -44,3 +50,33 @@ def test_blocking_rule():
 
     assert is_blocking_issue(blocking) is True
     assert is_blocking_issue(non_blocking) is False
+
+def test_accumulator_matches_batch_builders():
+    issues = [
+        ParseIssue(row=0, severity=ParseIssueSeverity.ERROR, code="EMPTY_FILE", message="empty"),
+        ParseIssue(row=2, severity=ParseIssueSeverity.WARNING, code="W", message="w", column="date"),
+        ParseIssue(row=3, severity=ParseIssueSeverity.ERROR, code="E", message="e1", column="date"),
+        ParseIssue(row=4, severity=ParseIssueSeverity.ERROR, code="E", message="e2", column="date"),
+    ]
+    accumulator = IssueAccumulator()
+    for issue in issues:
+        accumulator.add(issue)
+
+    expected = build_response(None, issues)
+    assert accumulator.build_response(None).model_dump() == expected.model_dump()
+    assert (expected.summary.error_count, expected.summary.warning_count, expected.summary.blocking_count) == (3, 1, 1)
+
+def test_accumulator_cap_keeps_counts_exact():
+    accumulator = IssueAccumulator(max_issues=2)
+    accumulator.extend(
+        ParseIssue(row=row, severity=ParseIssueSeverity.ERROR, code="INVALID_DATE", message=f"bad {row}", column="date")
+        for row in range(2, 12)
+    )
+
+    response = accumulator.build_response(None)
+    assert accumulator.truncated is True
+    assert [issue.row for issue in response.issues] == [2, 3]
+    assert response.summary.total_issues == 10
+    assert response.summary.error_count == 10
+    assert response.issue_summary[0].count == 10
+    assert response.issue_summary[0].sample_rows == [2, 3, 4]
@@ -0,0 +1,98 @@
+from agents.roster.feature import RosterFeature
+from agents.roster.services.parse_executor import RosterParseExecutor
+from agents.roster.services.roster_import.issue_store import IssueStore
+from agents.roster.services.roster_import.result_cache import ParseResultCache
+
+
+def _issues(count):
+    return [
+        {
+            "row": row,
+            "severity": "error",
+            "code": "INVALID_DATE" if row % 2 else "INVALID_TIME",
+            "message": f"bad row {row}",
+            "column": "date" if row % 2 else "start_time",
+        }
+        for row in range(2, count + 2)
+    ]
+
+
+class TestIssueStore:
+    """Tests for IssueStore paging and filters."""
+
+    def test_page_and_filters(self):
+        store = IssueStore()
+        result_id = store.put(_issues(10))
+
+        page = store.page(result_id, offset=8, limit=5)
+        assert (page["total"], [i["row"] for i in page["issues"]]) == (10, [10, 11])
+
+        by_code = store.page(result_id, code="INVALID_DATE")
+        assert by_code["total"] == 5
+        assert all(i["code"] == "INVALID_DATE" for i in by_code["issues"])
+
+        by_range = store.page(result_id, column="start_time", row_from=4, row_to=8)
+        assert [i["row"] for i in by_range["issues"]] == [4, 6, 8]
+
+    def test_unknown_id_and_disabled_store(self):
+        assert IssueStore().page("missing") is None
+        assert IssueStore(max_entries=0).put(_issues(1)) is None
+
+    def test_list_over_budget_is_not_stored(self):
+        assert IssueStore(max_bytes=100).put(_issues(10)) is None
+
+
+class TestRosterFeatureIssueLimit:
+    """Roster responses inline at most issue_limit issues."""
+
+    CSV = (
+        "Employee Number,Date,Start Time,End Time\n"
+        + "".join(f"EMP{n:03d},not-a-date,09:00,17:00\n" for n in range(6))
+        + "EMP100,2024-01-15,09:00,17:00\n"
+    ).encode()
+
+    def _feature(self, **kwargs):
+        return RosterFeature(
+            parse_executor=RosterParseExecutor(max_workers=1),
+            result_cache=ParseResultCache(max_entries=0),
+            **kwargs,
+        )
+
+    def test_default_returns_every_issue(self, process_upload):
+        result = process_upload(self._feature(), self.CSV, "roster.csv")
+
+        assert len(result["issues"]) == result["summary"]["total_issues"] == 7
+        assert "issue_result_id" not in result
+
+    def test_truncated_response_pages_from_store(self, process_upload):
+        feature = self._feature(issue_inline_limit=2)
+        result = process_upload(feature, self.CSV, "roster.csv")
+
+        assert [issue["row"] for issue in result["issues"]] == [2, 3]
+        assert result["issues_truncated"] is True
+        assert result["summary"]["total_issues"] == 7  # six bad dates + a warning on the valid row
+        assert result["issue_summary"][0]["count"] == 6
+
+        page = feature.issue_store.page(result["issue_result_id"], code="INVALID_DATE", offset=2, limit=10)
+        assert [issue["row"] for issue in page["issues"]] == [4, 5, 6, 7]
+
+    def test_request_can_set_issue_limit(self, process_upload):
+        result = process_upload(self._feature(), self.CSV, "roster.csv", context_payload={"issue_limit": 0})
+
+        assert result["issues"] == []
+        assert result["issue_result_id"]
+
+    def test_cache_hit_truncates_to_the_same_response(self, process_upload):
+        feature = RosterFeature(parse_executor=RosterParseExecutor(max_workers=1), issue_inline_limit=2)
+
+        fresh = process_upload(feature, self.CSV, "roster.csv")
+        cached = process_upload(feature, self.CSV, "roster.csv")
+
+        assert feature.result_cache.stats()["hits"] == 1
+        ids = [result.fields["issue_result_id"] for result in (fresh, cached)]
+        pages = [feature.issue_store.page(result_id, limit=1000) for result_id in ids]
+        assert pages[0]["issues"] == pages[1]["issues"]
+        assert pages[0]["total"] == 7
+        for result in (fresh, cached):
+            result.fields["issue_result_id"] = "id"
+        assert fresh.to_json() == cached.to_json()
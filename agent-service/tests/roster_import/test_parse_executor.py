@@ -0,0 +1,140 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from agents.roster.feature import RosterFeature
+from agents.roster.services.parse_executor import (
+    ParseQueueFullError,
+    ParseTimeoutError,
+    RosterParseExecutor,
+)
+
+
+class TestRosterParseExecutor:
+    """Tests for RosterParseExecutor."""
+
+    def test_run_returns_result_off_loop_thread(self):
+        executor = RosterParseExecutor(max_workers=1)
+        loop_thread = threading.get_ident()
+
+        result = asyncio.run(executor.run(lambda x: (x * 2, threading.get_ident()), 21))
+
+        assert result[0] == 42
+        assert result[1] != loop_thread
+        assert executor.stats()["completed"] == 1
+
+    def test_saturated_pool_rejects(self):
+        executor = RosterParseExecutor(max_workers=1, max_queue=0)
+        release = threading.Event()
+
+        async def scenario():
+            first = asyncio.ensure_future(executor.run(release.wait))
+            await asyncio.sleep(0.05)
+            with pytest.raises(ParseQueueFullError):
+                await executor.run(lambda: None)
+            release.set()
+            await first
+
+        asyncio.run(scenario())
+        assert executor.stats()["rejected"] == 1
+        assert executor.stats()["completed"] == 1
+
+    def test_timeout_keeps_worker_until_job_finishes(self):
+        executor = RosterParseExecutor(max_workers=1, max_queue=1)
+        release = threading.Event()
+
+        async def scenario():
+            with pytest.raises(ParseTimeoutError):
+                await executor.run(release.wait, timeout=0.05)
+            assert executor.stats()["running"] == 1
+
+            # A job still queued when it times out is cancelled outright.
+            with pytest.raises(ParseTimeoutError):
+                await executor.run(lambda: None, timeout=0.05)
+            assert executor.stats()["queued"] == 0
+            release.set()
+
+        asyncio.run(scenario())
+        executor.shutdown()
+        stats = executor.stats()
+        assert stats["timed_out"] == 2
+        assert stats["running"] == 0
+        assert stats["max_queue_depth"] == 1
+
+
+    def test_timeout_cancels_cooperative_job(self):
+        executor = RosterParseExecutor(max_workers=1, max_queue=0)
+        cancel = threading.Event()
+
+        async def scenario():
+            with pytest.raises(ParseTimeoutError):
+                await executor.run(cancel.wait, 5, timeout=0.05, cancel=cancel)
+
+        asyncio.run(scenario())
+        assert cancel.is_set()
+        executor.shutdown()
+        assert executor.stats()["running"] == 0
+        assert executor.stats()["completed"] == 1
+
+
+def _wait_until_idle(executor, seconds=2.0):
+    deadline = time.perf_counter() + seconds
+    while executor.stats()["running"] and time.perf_counter() < deadline:
+        time.sleep(0.01)
+    return executor.stats()
+
+
+class TestRosterFeatureExecutor:
+    """RosterFeature parses uploads on its executor."""
+
+    def test_upload_is_parsed_on_executor(self, roster_excel, make_upload):
+        feature = RosterFeature(parse_executor=RosterParseExecutor(max_workers=1))
+        upload = make_upload(roster_excel.read_bytes(), "roster.xlsx")
+
+        result = asyncio.run(feature.process({"file": upload, "file_name": "roster.xlsx"}))
+
+        assert result["note"] is None
+        assert result["result"]["total_shifts"] == 3
+        assert feature.parse_executor.stats()["completed"] == 1
+
+    def test_busy_executor_returns_parse_busy(self, roster_excel, make_upload):
+        feature = RosterFeature(parse_executor=RosterParseExecutor(max_workers=1, max_queue=0))
+        upload = make_upload(roster_excel.read_bytes(), "roster.xlsx")
+        release = threading.Event()
+
+        async def scenario():
+            blocker = asyncio.ensure_future(feature.parse_executor.run(release.wait))
+            await asyncio.sleep(0.05)
+            result = await feature.process({"file": upload, "file_name": "roster.xlsx"})
+            release.set()
+            await blocker
+            return result
+
+        result = asyncio.run(scenario())
+
+        assert result["note"] == "PARSE_BUSY"
+
+    def test_timed_out_parse_stops_and_frees_its_worker(self, monkeypatch, temp_excel_path, write_roster, make_upload):
+        from agents.roster.services.roster_import import parser
+
+        parse_values = parser.parse_roster_values
+
+        def slow_parse_values(*args, **kwargs):
+            time.sleep(0.01)
+            return parse_values(*args, **kwargs)
+
+        monkeypatch.setattr(parser, "parse_roster_values", slow_parse_values)
+        rows = [[f"EMP{n:03d}", "2024-01-15", "09:00", "17:00", "casual", ""] for n in range(500)]
+        write_roster(temp_excel_path, rows)
+        feature = RosterFeature(parse_executor=RosterParseExecutor(max_workers=1, timeout_seconds=0.1))
+        upload = make_upload(temp_excel_path.read_bytes(), "roster.xlsx")
+
+        result = asyncio.run(feature.process({"file": upload, "file_name": "roster.xlsx"}))
+
+        assert result["note"] == "PARSE_TIMEOUT"
+        # 500 rows at 10ms each would hold the worker for 5s; cancelled, it is back within a row or two.
+        stats = _wait_until_idle(feature.parse_executor, seconds=1.0)
+        assert stats["running"] == 0
+        assert feature.result_cache.stats()["entries"] == 0
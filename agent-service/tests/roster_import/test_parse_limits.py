@@ -0,0 +1,114 @@
+import threading
+
+from openpyxl import Workbook
+
+from agents.roster.feature import RosterFeature
+from agents.roster.services.parse_executor import RosterParseExecutor
+from agents.roster.services.roster_import import ParseLimits, ParseMode, ParseResultStatus
+from agents.roster.services.roster_import.result_cache import ParseResultCache
+
+
+def _valid_rows(count):
+    return [[f"EMP{n:03d}", "2024-01-15", "09:00", "17:00", "casual", f"emp{n}@example.com"] for n in range(count)]
+
+
+class TestParseLimits:
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("ROSTER_PARSE_ROW_LIMIT", "5000")
+        monkeypatch.setenv("ROSTER_PARSE_ERROR_LIMIT", "0")
+        monkeypatch.setenv("ROSTER_PARSE_TIME_LIMIT_SECONDS", "2.5")
+
+        limits = ParseLimits.from_env()
+
+        assert (limits.max_rows, limits.max_errors, limits.max_seconds) == (5000, None, 2.5)
+        assert limits.enabled
+        assert not ParseLimits().enabled
+
+    def test_row_limit_stops_with_blocking_summary(self, handler, temp_excel_path, write_roster):
+        write_roster(temp_excel_path, _valid_rows(10))
+
+        response = handler.parse_roster_excel(str(temp_excel_path), limits=ParseLimits(max_rows=4))
+
+        assert len(response.result.entries) == 4
+        assert len(response.result.raw_rows) == 4
+        assert response.summary.status == ParseResultStatus.BLOCKING
+        stop = next(issue for issue in response.issues if issue.code == "ROW_LIMIT_EXCEEDED")
+        assert stop.row == 0
+        assert stop.detail == "stopped_at_row=6"
+        assert "row 6" in stop.message
+
+    def test_error_limit_fails_fast_in_strict_mode(self, handler, temp_excel_path, write_roster):
+        bad_row = ["EMP999", "not-a-date", "09:00", "17:00", "casual", "bad@example.com"]
+        rows = _valid_rows(2) + [bad_row] * 5 + _valid_rows(3)
+        write_roster(temp_excel_path, rows)
+
+        response = handler.parse_roster_excel(
+            str(temp_excel_path), mode=ParseMode.STRICT, limits=ParseLimits(max_errors=1)
+        )
+
+        assert len(response.result.entries) == 2
+        codes = [issue.code for issue in response.issues]
+        assert codes.count("INVALID_DATE") == 1
+        assert codes[-1] == "ERROR_LIMIT_EXCEEDED"
+        assert response.issues[-1].detail == "stopped_at_row=4"
+        assert response.summary.blocking_count == 1
+
+    def test_time_limit(self, handler, temp_excel_path, write_roster):
+        write_roster(temp_excel_path, _valid_rows(3))
+
+        response = handler.parse_roster_excel(str(temp_excel_path), limits=ParseLimits(max_seconds=1e-9))
+
+        assert response.result.entries == []
+        assert response.issues[-1].code == "TIME_LIMIT_EXCEEDED"
+        assert response.summary.status == ParseResultStatus.BLOCKING
+
+    def test_cancel_stops_at_next_row(self, handler, temp_excel_path, write_roster):
+        write_roster(temp_excel_path, _valid_rows(3))
+        cancel = threading.Event()
+        cancel.set()
+
+        response = handler.parse_roster_excel(str(temp_excel_path), limits=ParseLimits(cancel=cancel))
+
+        assert response.result.entries == []
+        assert response.issues[-1].code == "PARSE_CANCELLED"
+        assert response.issues[-1].value is None
+        assert response.summary.status == ParseResultStatus.BLOCKING
+
+    def test_within_limits_is_unchanged(self, handler, temp_excel_path, write_roster):
+        write_roster(temp_excel_path, _valid_rows(3))
+        limits = ParseLimits(max_rows=3, max_errors=1, max_seconds=60)
+
+        limited = handler.parse_roster_excel(str(temp_excel_path), limits=limits)
+        plain = handler.parse_roster_excel(str(temp_excel_path))
+
+        assert limited.model_dump_json() == plain.model_dump_json()
+
+    def test_employee_row_limit(self, handler, temp_excel_path):
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Name", "Role"])
+        for n in range(5):
+            ws.append([f"Person {n}", "Staff"])
+        wb.save(temp_excel_path)
+
+        response = handler.parse_employee_excel(str(temp_excel_path), limits=ParseLimits(max_rows=2))
+
+        assert len(response.result.entries) == 2
+        assert response.issues[-1].code == "ROW_LIMIT_EXCEEDED"
+
+
+class TestRosterFeatureLimits:
+    def test_time_limited_result_is_not_cached(self, temp_excel_path, write_roster, process_upload):
+        write_roster(temp_excel_path, _valid_rows(3))
+        feature = RosterFeature(
+            parse_executor=RosterParseExecutor(max_workers=1),
+            result_cache=ParseResultCache(max_entries=4),
+            parse_limits=ParseLimits(max_seconds=1e-9),
+        )
+        content = temp_excel_path.read_bytes()
+
+        for _ in range(2):
+            result = process_upload(feature, content)
+            assert result["summary"]["status"] == "blocking"
+
+        assert feature.parse_executor.stats()["completed"] == 2
@@ -3,6 +3,7 @@ import pytest
 from datetime import date, time
 from decimal import Decimal
 from openpyxl import Workbook
+from pydantic import ValidationError
 
 from agents.roster.services.roster_import import ParseIssueSeverity, ParseMode, ParseResultStatus
 
@@ -121,6 +122,82 @@ class TestParseRosterExcel:
         result = RosterParseResult(entries=entries, raw_rows=[])
         assert result.unique_employees == 3
 
+    def test_aggregates_accumulated_during_parse(self, handler, roster_excel):
+        """Parser-attached totals match a fresh pass and the dump shape is unchanged."""
+        from agents.roster.services.roster_import import RosterAggregates
+
+        result = handler.parse_roster_excel(str(roster_excel)).result
+        attached = result.aggregates
+        fresh = RosterAggregates.from_entries(result.entries)
+
+        assert result.aggregates is attached
+        assert (attached.week_start_date, attached.week_end_date, attached.total_hours) == (
+            fresh.week_start_date,
+            fresh.week_end_date,
+            fresh.total_hours,
+        )
+        assert list(result.model_dump().keys()) == [
+            "entries",
+            "raw_rows",
+            "week_start_date",
+            "week_end_date",
+            "total_shifts",
+            "total_hours",
+            "unique_employees",
+        ]
+
+    def test_aggregates_recomputed_when_entries_change(self, handler, roster_excel):
+        result = handler.parse_roster_excel(str(roster_excel)).result
+        extra = result.entries[0].model_copy(update={"employee_number": "EMP999"})
+
+        result.entries.append(extra)
+
+        assert result.total_shifts == 4
+        assert result.unique_employees == 4
+        assert result.total_hours == Decimal("32.00")
+
+        result.entries[3] = extra.model_copy(update={"end_time": time(13, 0)})
+
+        assert result.total_shifts == 4
+        assert result.total_hours == Decimal("28.00")
+
+    def test_entry_hours_are_memoised(self):
+        from agents.roster.services.roster_import.models import RosterEntry
+
+        entry = RosterEntry(
+            excel_row=2,
+            date=date(2024, 1, 15),
+            start_time=time(22, 0),
+            end_time=time(6, 0),
+            is_overnight=True,
+            meal_break_duration=30,
+        )
+
+        assert entry.duration_hours is entry.duration_hours
+        assert entry.net_hours == Decimal("7.50")
+        dumped = entry.model_dump()
+        assert (dumped["duration_hours"], dumped["net_hours"]) == (Decimal("8.00"), Decimal("7.50"))
+
+        shorter = entry.model_copy(update={"end_time": time(4, 0)})
+        assert (shorter.duration_hours, shorter.net_hours) == (Decimal("6.00"), Decimal("5.50"))
+        with pytest.raises(ValidationError):
+            entry.end_time = time(4, 0)
+        assert entry.net_hours == Decimal("7.50")
+
+    def test_raw_rows_modes(self, handler, roster_excel):
+        from agents.roster.services.roster_import import RawRowsMode, RawRowTable
+
+        full = handler.parse_roster_excel(str(roster_excel))
+        columnar = handler.parse_roster_excel(str(roster_excel), raw_rows=RawRowsMode.COLUMNAR)
+        skipped = handler.parse_roster_excel(str(roster_excel), raw_rows="none")
+
+        table = columnar.result.raw_rows
+        assert isinstance(table, RawRowTable)
+        assert [dict(zip(table.columns, row)) for row in table.rows] == full.result.raw_rows
+        assert skipped.result.raw_rows == []
+        assert skipped.result.entries == full.result.entries
+        assert columnar.model_dump()["result"]["raw_rows"]["columns"][0] == "excel_row"
+
     def test_missing_required_columns(self, handler, temp_excel_path):
         """Test error when required columns are missing."""
         wb = Workbook()
@@ -156,6 +233,20 @@ class TestParseRosterExcel:
         assert errors[0].row == 3  # Real Excel row number
         assert errors[0].severity == ParseIssueSeverity.ERROR.value
 
+    def test_max_issues_caps_detail_list(self, handler, temp_excel_path):
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Employee Number", "Employee Email", "Date", "Start Time", "End Time"])
+        for n in range(5):
+            ws.append([f"EMP00{n}", None, "invalid-date", "09:00", "17:00"])
+        wb.save(temp_excel_path)
+
+        response = handler.parse_roster_excel(str(temp_excel_path), max_issues=2)
+
+        assert len(response.issues) == 2
+        assert response.summary.error_count == 5
+        assert response.issue_summary[0].count == 5
+
     def test_empty_roster_file(self, handler, temp_excel_path):
         """Test parsing an empty roster file."""
         wb = Workbook()
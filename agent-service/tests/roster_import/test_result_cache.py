@@ -0,0 +1,134 @@
+import io
+import json
+
+from fastapi.encoders import jsonable_encoder
+
+from agents.roster.feature import RosterFeature
+from agents.roster.services.parse_executor import RosterParseExecutor
+from agents.roster.services.roster_import import ParseLimits, ParseMode, RawRowsMode
+from agents.roster.services.roster_import import parser
+from agents.roster.services.roster_import.result_cache import ParseResultCache, hash_stream
+
+
+class TestParseResultCache:
+    """Tests for ParseResultCache keys and storage."""
+
+    def test_hash_stream_rewinds(self):
+        stream = io.BytesIO(b"abc")
+        stream.seek(1)
+
+        digest = hash_stream(stream)
+
+        assert stream.tell() == 1
+        assert digest == hash_stream(io.BytesIO(b"bc"))
+
+    def test_key_includes_mode_header_row_and_suffix(self):
+        make_key = ParseResultCache.make_key
+        base = make_key("h", ParseMode.LENIENT, None, "a.xlsx")
+
+        assert base == make_key("h", ParseMode.LENIENT, None, "b.XLSX")
+        assert base != make_key("h", ParseMode.STRICT, None, "a.xlsx")
+        assert base != make_key("h", ParseMode.LENIENT, 2, "a.xlsx")
+        assert base != make_key("h", ParseMode.LENIENT, None, "a.csv")
+        assert base != make_key("h", ParseMode.LENIENT, None, "a.xlsx", RawRowsMode.NONE)
+
+    def test_disabled_cache(self):
+        cache = ParseResultCache(max_entries=0)
+        key = cache.make_key("h", ParseMode.LENIENT)
+        cache.put_encoded(key, b'{"issues":[]}')
+
+        assert cache.get_encoded(key) is None
+
+
+class TestRosterFeatureCache:
+    """Duplicate uploads are served from the cache."""
+
+    def test_duplicate_upload_hits_cache_with_identical_json(self, roster_excel, process_upload):
+        feature = RosterFeature(
+            parse_executor=RosterParseExecutor(max_workers=1),
+            result_cache=ParseResultCache(max_entries=4),
+        )
+        content = roster_excel.read_bytes()
+
+        first = process_upload(feature, content)
+        second = process_upload(feature, content)
+
+        assert json.dumps(jsonable_encoder(first)) == json.dumps(jsonable_encoder(second))
+        assert feature.parse_executor.stats()["completed"] == 1
+        stats = feature.result_cache.stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    def test_changed_content_is_parsed_again(self, roster_excel, process_upload):
+        feature = RosterFeature(
+            parse_executor=RosterParseExecutor(max_workers=1),
+            result_cache=ParseResultCache(max_entries=4),
+        )
+        csv_content = b"Employee Number,Date,Start Time,End Time\nEMP001,2024-01-15,09:00,17:00\n"
+
+        process_upload(feature, roster_excel.read_bytes())
+        result = process_upload(feature, csv_content, "roster.csv")
+
+        assert result["result"]["total_shifts"] == 1
+        assert feature.parse_executor.stats()["completed"] == 2
+
+    def test_raw_rows_option_is_part_of_the_key(self, roster_excel, process_upload):
+        feature = RosterFeature(
+            parse_executor=RosterParseExecutor(max_workers=1),
+            result_cache=ParseResultCache(max_entries=4),
+        )
+        content = roster_excel.read_bytes()
+
+        full = process_upload(feature, content)
+        columnar = process_upload(feature, content, context_payload={"raw_rows": "columnar"})
+
+        assert len(full["result"]["raw_rows"]) == 3
+        assert columnar["result"]["raw_rows"]["columns"][0] == "excel_row"
+        assert len(columnar["result"]["raw_rows"]["rows"]) == 3
+        assert feature.parse_executor.stats()["completed"] == 2
+
+    def test_failed_read_is_not_cached(self, roster_excel, process_upload, monkeypatch):
+        feature = RosterFeature(
+            parse_executor=RosterParseExecutor(max_workers=1),
+            result_cache=ParseResultCache(max_entries=4),
+        )
+        open_rows = parser.open_rows
+        failures = [OSError("disk went away")]
+
+        def flaky_open_rows(*args, **kwargs):
+            headers, rows = open_rows(*args, **kwargs)
+
+            def fail_after_first_row():
+                yield next(rows)
+                if failures:
+                    raise failures.pop()
+                yield from rows
+
+            return headers, fail_after_first_row()
+
+        monkeypatch.setattr(parser, "open_rows", flaky_open_rows)
+        content = roster_excel.read_bytes()
+
+        broken = process_upload(feature, content)
+        retried = process_upload(feature, content)
+        cached = process_upload(feature, content)
+
+        assert [issue["code"] for issue in broken["issues"]] == ["FILE_READ_ERROR"]
+        assert broken["result"]["total_shifts"] == 1
+        assert retried["result"]["total_shifts"] == cached["result"]["total_shifts"] == 3
+        assert feature.parse_executor.stats()["completed"] == 2
+        assert feature.result_cache.stats()["hits"] == 1
+
+    def test_budget_stop_is_not_cached(self, roster_excel, process_upload):
+        feature = RosterFeature(
+            parse_executor=RosterParseExecutor(max_workers=1),
+            result_cache=ParseResultCache(max_entries=4),
+            parse_limits=ParseLimits(max_rows=1),
+        )
+        content = roster_excel.read_bytes()
+
+        process_upload(feature, content)
+        result = process_upload(feature, content)
+
+        assert result["issues"][-1]["code"] == "ROW_LIMIT_EXCEEDED"
+        assert feature.parse_executor.stats()["completed"] == 2
+        assert feature.result_cache.stats()["entries"] == 0
@@ -192,3 +192,23 @@ class TestTimeRangeDetection:
         assert len(errors) == 1
         assert "Time range detected" in errors[0].message
         assert errors[0].column == "start_time"
+
+
+class TestRosterEntryBuild:
+    """Row parsing builds entries without validating the email a second time."""
+
+    def test_entry_matches_validated_entry(self):
+        from agents.roster.services.roster_import import RosterEntry
+        from agents.roster.services.roster_import.header_map import HeaderMap
+        from agents.roster.services.roster_import.row_parsers import parse_roster_values
+
+        headers = ["Employee Number", "Employee Email", "Date", "Start Time", "End Time", "Employment Type"]
+        schema = HeaderMap().compile(headers)
+        entry, warnings = parse_roster_values(
+            ("EMP001", "John.Smith@EXAMPLE.com", "2024-01-15", "22:00", "06:00", "casual"), 2, schema, ParseMode.LENIENT
+        )
+
+        assert [w.code for w in warnings] == ["OVERNIGHT_ASSUMED"]
+        validated = RosterEntry(**{name: getattr(entry, name) for name in RosterEntry.model_fields})
+        assert entry.model_dump_json() == validated.model_dump_json()
+        assert entry.employee_email == validated.employee_email
@@ -0,0 +1,97 @@
+import asyncio
+import io
+import tempfile
+
+from starlette.datastructures import UploadFile
+
+from agents.roster.feature import RosterFeature
+from agents.roster.services.parse_executor import RosterParseExecutor
+from agents.roster.services.roster_import.uploads import spool_upload
+
+CSV_CONTENT = (
+    b"Employee Number,Date,Start Time,End Time,Employment Type\n"
+    b"EMP001,2024-01-15,09:00,17:00,casual\n"
+)
+
+
+class TestInMemoryParsing:
+    """Parsing bytes and streams without a temp file."""
+
+    def test_parse_roster_from_bytes(self, handler, roster_excel):
+        response = handler.parse_roster_excel(roster_excel.read_bytes())
+
+        assert len(response.result.entries) == 3
+
+    def test_parse_roster_from_csv_stream_leaves_it_open(self, handler):
+        stream = io.BytesIO(CSV_CONTENT)
+
+        response = handler.parse_roster_excel(stream, file_name="roster.csv")
+
+        assert response.result.entries[0].employee_number == "EMP001"
+        assert not stream.closed
+
+    def test_parse_excel_upload_reads_in_place(self, handler, roster_excel, monkeypatch):
+        def no_temp_files(*_args, **_kwargs):
+            raise AssertionError("temp file should not be created")
+
+        monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_temp_files)
+        upload = UploadFile(io.BytesIO(roster_excel.read_bytes()), filename="roster.xlsx")
+
+        rows = asyncio.run(handler.parse_excel(upload))
+
+        assert [row["__row__"] for row in rows] == [2, 3, 4]
+
+
+class TestSpoolUpload:
+    """Tests for spool_upload()."""
+
+    def test_rolled_upload_stream_outlives_the_request(self):
+        underlying = tempfile.SpooledTemporaryFile(max_size=1)
+        underlying.write(CSV_CONTENT)
+        upload = UploadFile(underlying, filename="roster.csv")
+
+        stream = asyncio.run(spool_upload(upload))
+        asyncio.run(upload.close())
+
+        assert stream is not underlying
+        assert stream.read() == CSV_CONTENT
+        stream.close()
+
+    def test_in_memory_upload_stream_is_copied(self):
+        underlying = tempfile.SpooledTemporaryFile()
+        underlying.write(CSV_CONTENT)
+        upload = UploadFile(underlying, filename="roster.csv")
+
+        stream = asyncio.run(spool_upload(upload))
+        asyncio.run(upload.close())
+
+        assert not underlying._rolled
+        assert stream.read() == CSV_CONTENT
+
+    def test_small_upload_stays_in_memory(self, make_upload):
+        stream = asyncio.run(spool_upload(make_upload(CSV_CONTENT, "roster.csv")))
+
+        assert isinstance(stream, io.BytesIO)
+        assert stream.read() == CSV_CONTENT
+
+    def test_large_upload_spools_to_disk(self, make_upload):
+        stream = asyncio.run(spool_upload(make_upload(CSV_CONTENT, "roster.csv"), threshold=16))
+
+        assert isinstance(stream, tempfile.SpooledTemporaryFile)
+        assert stream._rolled
+        assert stream.read() == CSV_CONTENT
+        stream.close()
+
+
+def test_roster_feature_parses_without_temp_file(roster_excel, monkeypatch, make_upload):
+    def no_temp_files(*_args, **_kwargs):
+        raise AssertionError("temp file should not be created")
+
+    monkeypatch.setattr(tempfile, "NamedTemporaryFile", no_temp_files)
+    feature = RosterFeature(parse_executor=RosterParseExecutor(max_workers=1))
+    upload = make_upload(roster_excel.read_bytes(), "upload")
+
+    result = asyncio.run(feature.process({"file": upload, "file_name": "upload"}))
+
+    assert result["note"] is None
+    assert result["result"]["total_shifts"] == 3
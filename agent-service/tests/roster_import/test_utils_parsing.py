@@ -2,8 +2,13 @@ import pytest
 from datetime import date, time
 
 from agents.roster.services.roster_import.utils import (
+    DateColumnParser,
     parse_date,
     parse_time,
+    parse_time_column,
+    TimeParser,
+    EmailValidator,
+    validate_email,
     parse_boolean,
     parse_int,
     normalize_employment_type,
@@ -50,6 +55,39 @@ class TestParseDateHelper:
         with pytest.raises(ValueError, match="Unable to parse date"):
             parse_date("not-a-date")
 
+class TestDateColumnParser:
+    """Tests for DateColumnParser format inference."""
+
+    def test_locks_most_common_format(self):
+        parser = DateColumnParser(sample_size=3)
+        for value in ["15.01.2024", "16.01.2024", "2024-01-17"]:
+            parser.parse(value)
+
+        assert parser.locked_format == "%d.%m.%Y"
+        assert parser.parse("18.01.2024") == date(2024, 1, 18)
+        assert parser.parse("2024-01-19") == date(2024, 1, 19)  # other formats still work
+
+    def test_locked_month_first_keeps_day_first_precedence(self):
+        parser = DateColumnParser(sample_size=2)
+        parser.parse("01/25/2024")
+        parser.parse("12/31/2024")
+
+        assert parser.locked_format == "%m/%d/%Y"
+        # Same answer as parse_date: DD/MM/YYYY is tried first for ambiguous values.
+        assert parser.parse("05/06/2024") == parse_date("05/06/2024") == date(2024, 6, 5)
+
+    def test_matches_parse_date_for_edge_values(self):
+        parser = DateColumnParser(sample_size=1)
+        for value in ["2024-1-5", " 15/01/2024 ", "29/02/2023", "2024/02/30", "", None, 45306, "1/2/24"]:
+            try:
+                expected = parse_date(value)
+            except ValueError as exc:
+                with pytest.raises(ValueError, match="Unable to parse date"):
+                    parser.parse(value)
+                assert "Unable to parse date" in str(exc)
+                continue
+            assert parser.parse(value) == expected
+
 class TestParseTimeHelper:
     """Tests for _parse_time() helper."""
 
@@ -115,6 +153,68 @@ class TestParseTimeHelper:
         result = parse_time(None)
         assert result is None
 
+class TestTimeParser:
+    """Tests for the memoised TimeParser and column API."""
+
+    def test_repeated_values_parse_once(self):
+        parser = TimeParser()
+        values = ["09:00", "5:30 PM", 0.5, "09:00", "5:30 PM", 0.5, "09:00"]
+
+        assert [parser.parse(v) for v in values] == [parse_time(v) for v in values]
+        assert (parser.misses, parser.hits, len(parser)) == (3, 4, 3)
+
+    def test_errors_are_memoised_and_reraised(self):
+        parser = TimeParser()
+        for _ in range(2):
+            with pytest.raises(ValueError, match="Time range detected"):
+                parser.parse("9:00-17:00")
+        assert parser.hits == 1
+
+    def test_bool_and_int_keys_do_not_collide(self):
+        parser = TimeParser()
+        assert parser.parse(1) == parse_time(1)
+        assert parser.parse(True) == parse_time(True)
+        assert len(parser) == 2
+
+    def test_memo_is_bounded(self):
+        parser = TimeParser(max_entries=2)
+        for value in ["09:00", "10:00", "11:00", "11:00"]:
+            parser.parse(value)
+        assert len(parser) == 2
+        assert parser.parse("11:00") == time(11, 0)
+
+    def test_parse_time_column_returns_errors_in_place(self):
+        results = parse_time_column(["09:00", None, "bogus", time(8, 15), "9 PM"])
+
+        assert results[0] == time(9, 0)
+        assert results[1] is None
+        assert isinstance(results[2], ValueError)
+        assert "Unable to parse time" in str(results[2])
+        assert results[3:] == [time(8, 15), time(21, 0)]
+
+class TestEmailValidator:
+    """Tests for the memoised email check used by the row parsers."""
+
+    def test_normalises_and_memoises(self):
+        validator = EmailValidator()
+        for _ in range(3):
+            assert validator.validate("John <john@Example.COM>") == "john@example.com"
+        assert validator.validate("not-an-email") is None
+        assert validator.validate("not-an-email") is None
+        assert (validator.misses, validator.hits) == (2, 3)
+
+    @pytest.mark.parametrize(
+        "value", ["plain", "@example.com", "john@", "john@localhost", "a@b@c.com", "john@example。com"]
+    )
+    def test_prefilter_agrees_with_full_validator(self, value):
+        from pydantic import EmailStr, TypeAdapter, ValidationError
+
+        try:
+            expected = TypeAdapter(EmailStr).validate_python(value)
+        except ValidationError:
+            expected = None
+        assert validate_email(value) == expected
+
 class TestParseBooleanHelper:
     """Tests for _parse_boolean() helper."""
 
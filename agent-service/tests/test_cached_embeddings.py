@@ -0,0 +1,96 @@
+import asyncio
+import logging
+from typing import List
+
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from shared.llm.cached_embeddings import CachedQueryEmbeddings, normalize_query
+from shared.llm import embeddings_factory
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    calls: int = 0
+    model: str = "fake-small"
+
+    def embed_query(self, text: str) -> List[float]:
+        self.calls += 1
+        return super().embed_query(text)
+
+
+def test_normalize_query_collapses_whitespace_only():
+    assert normalize_query("  Casual \n overtime\trate ") == "Casual overtime rate"
+    assert normalize_query("Café") == "Café"
+
+
+def test_repeated_queries_embed_once():
+    model = CountingEmbedding(size=8)
+    cached = CachedQueryEmbeddings(model)
+
+    first = cached.embed_query("casual loading")
+    assert cached.embed_query(" casual  loading ") == first
+    assert asyncio.run(cached.aembed_query("casual loading")) == first
+
+    assert model.calls == 1
+    stats = cached.stats()
+    assert (stats["hits"], stats["computed"], stats["hit_rate"]) == (2, 1, 0.6667)
+    assert stats["model"] == "CountingEmbedding:fake-small"
+
+
+def test_documents_are_not_cached():
+    model = CountingEmbedding(size=8)
+    cached = CachedQueryEmbeddings(model)
+    assert cached.embed_documents(["a", "b"]) == model.embed_documents(["a", "b"])
+    assert len(cached._memory) == 0
+
+
+def test_disk_store_survives_restart_and_is_per_model(tmp_path):
+    model = CountingEmbedding(size=8)
+    vector = CachedQueryEmbeddings(model, disk_path=str(tmp_path)).embed_query("penalty rates")
+
+    restarted = CachedQueryEmbeddings(model, disk_path=str(tmp_path))
+    assert asyncio.run(restarted.aembed_query("penalty rates")) == vector
+    assert model.calls == 1
+    assert restarted.stats()["disk_hits"] == 1
+
+    other = CountingEmbedding(size=8, model="fake-large")
+    CachedQueryEmbeddings(other, disk_path=str(tmp_path)).embed_query("penalty rates")
+    assert other.calls == 1
+
+
+def test_ttl_expiry_re_embeds():
+    model = CountingEmbedding(size=8)
+    cached = CachedQueryEmbeddings(model, ttl_seconds=10)
+    now = [0.0]
+    cached._memory._clock = lambda: now[0]
+
+    cached.embed_query("leave")
+    now[0] = 11.0
+    cached.embed_query("leave")
+
+    assert model.calls == 2
+
+
+def test_factory_wraps_unless_disabled(monkeypatch):
+    monkeypatch.setattr(embeddings_factory, "OpenAIEmbeddings", lambda: CountingEmbedding(size=8))
+    logger = logging.getLogger("test")
+    config = {"model_params": {"deployment_mode_embedding": "online"}}
+
+    assert isinstance(embeddings_factory.create_embeddings(config, logger=logger), CachedQueryEmbeddings)
+    disabled = dict(config, embedding_cache={"max_entries": 0})
+    assert isinstance(embeddings_factory.create_embeddings(disabled, logger=logger), CountingEmbedding)
+
+
+def test_disk_store_is_bounded_and_expires(tmp_path):
+    model = CountingEmbedding(size=8)
+    cached = CachedQueryEmbeddings(model, max_entries=0, disk_path=str(tmp_path), disk_max_entries=8)
+    for n in range(40):
+        cached.embed_query(f"query {n}")
+
+    files = list(cached._disk.path.iterdir())
+    assert len(files) <= 9  # max_entries plus at most one pruning interval
+    assert cached._disk.get("query 39") is not None
+    assert cached._disk.get("query 0") is None
+
+    cached._disk.ttl_seconds = 0.0
+    assert cached._disk.get("query 39") is None
+    assert cached._disk.prune() == len(files)
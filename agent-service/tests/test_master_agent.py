@@ -1,6 +1,7 @@
 import importlib
 import json
 import sys
+import time
 from typing import Callable
 
 import pytest
@@ -522,3 +523,127 @@ def test_chat_request_size_limit_enforced(client_factory):
     client = client_factory(max_request_bytes=10)
     response = client.post("/api/agent/chat", data={"message": "message-too-large"})
     assert response.status_code == 413
+
+
+def test_roster_issue_pages_endpoint(client_factory):
+    client = client_factory()
+    main_module = sys.modules["master_agent.main"]
+    result_id = main_module.roster_feature.issue_store.put(
+        [{"row": row, "severity": "error", "code": "INVALID_DATE", "message": "bad", "column": "date"} for row in range(2, 7)]
+    )
+
+    response = client.get(f"/api/agent/roster/issues/{result_id}", params={"row_from": 3, "limit": 2})
+    assert response.status_code == 200
+    page = response.json()
+    assert (page["total"], [issue["row"] for issue in page["issues"]]) == (4, [3, 4])
+
+    assert client.get("/api/agent/roster/issues/unknown").status_code == 404
+    assert client.get(f"/api/agent/roster/issues/{result_id}", params={"limit": 0}).status_code == 422
+
+
+def test_roster_upload_response_matches_dict_encoding(client_factory):
+    from fastapi.encoders import jsonable_encoder
+    from starlette.responses import JSONResponse
+
+    from agents.roster.services.roster_import import RosterExcelParser
+
+    client = client_factory()
+    content = b"Employee Number,Date,Start Time,End Time\nEMP001,2024-01-15,09:00,17:30\nEMP002,bad,09:00,17:00\n"
+    response = client.post(
+        "/api/agent/chat",
+        data={"message": "Check this roster"},
+        files={"file": ("roster.csv", content, "text/csv")},
+        headers={"X-Request-ID": "req-1"},
+    )
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+
+    # Same bytes the previous model_dump() + jsonable_encoder path produced.
+    parsed = RosterExcelParser().parse_roster_excel(content, file_name="roster.csv").model_dump()
+    parsed.update(
+        {"type": "roster", "message": "Roster file 'roster.csv' parsed successfully.", "model": None, "sources": [], "note": None}
+    )
+    expected = {
+        "status": "success",
+        "request_id": "req-1",
+        "message": "Check this roster",
+        "file_name": "roster.csv",
+        "routed_to": "roster",
+        "result": parsed,
+    }
+    assert response.content == JSONResponse(jsonable_encoder(expected)).body
+    assert response.json()["result"]["result"]["total_hours"] == 8.5
+
+
+def test_rag_stats_reports_embedding_cache(client_factory, monkeypatch):
+    from langchain_core.embeddings import DeterministicFakeEmbedding
+
+    import shared.rag.retriever_manager as retriever_manager
+    from shared.llm.cached_embeddings import CachedQueryEmbeddings
+
+    client = client_factory()
+    assert client.get("/api/agent/rag/stats").json() == {}
+
+    cached = CachedQueryEmbeddings(DeterministicFakeEmbedding(size=4))
+    cached.embed_query("overtime")
+    cached.embed_query("overtime")
+    monkeypatch.setattr(retriever_manager, "_EMBEDDINGS", cached)
+
+    stats = client.get("/api/agent/rag/stats").json()["embedding_cache"]
+    assert (stats["hits"], stats["computed"], stats["hit_rate"]) == (1, 1, 0.5)
+
+
+def test_ready_without_warm_start(client_factory, monkeypatch):
+    monkeypatch.delenv("RAG_WARM_START", raising=False)
+    client = client_factory()
+    response = client.get("/ready")
+    assert response.status_code == 200
+    assert response.json() == {"status": "ready", "rag": "lazy"}
+    assert client.get("/health").json() == {"status": "healthy"}
+
+
+def test_warm_start_preloads_rag_and_reports_ready(client_factory, monkeypatch):
+    import shared.rag.retriever_manager as retriever_manager
+
+    queries = []
+
+    class _StubRetriever:
+        async def retrieve(self, query, top_k=5):
+            queries.append(query)
+
+    monkeypatch.setenv("RAG_WARM_START", "true")
+    monkeypatch.setattr(retriever_manager, "_WARMUP", {"state": "idle"})
+    monkeypatch.setattr(retriever_manager, "_ensure_retriever", lambda config, logger: (_StubRetriever(), None))
+    client = client_factory()
+
+    assert client.get("/ready").status_code == 503  # lifespan not started yet
+    with client:
+        for _ in range(100):
+            response = client.get("/ready")
+            if response.status_code == 200:
+                break
+            time.sleep(0.01)
+    assert response.json()["status"] == "ready"
+    assert response.json()["rag"]["state"] == "ready"
+    assert queries == [retriever_manager.WARMUP_QUERY]
+
+
+def test_failed_warm_start_reports_degraded(client_factory, monkeypatch):
+    import shared.rag.retriever_manager as retriever_manager
+
+    def _missing(config, logger):
+        raise FileNotFoundError("FAISS store not found")
+
+    monkeypatch.setenv("RAG_WARM_START", "1")
+    monkeypatch.setattr(retriever_manager, "_WARMUP", {"state": "idle"})
+    monkeypatch.setattr(retriever_manager, "_ensure_retriever", _missing)
+    client = client_factory()
+
+    with client:
+        for _ in range(100):
+            response = client.get("/ready")
+            if response.status_code == 200:
+                break
+            time.sleep(0.01)
+    assert response.json()["status"] == "degraded"
+    assert "FAISS store not found" in response.json()["rag"]["error"]
@@ -0,0 +1,232 @@
+import asyncio
+import time
+from typing import List
+
+from langchain_community.vectorstores import FAISS
+from langchain_core.embeddings import DeterministicFakeEmbedding
+
+from shared.rag_retriever import RAGRetriever
+
+TEXTS = [
+    "Casual employees receive a 25% loading.",
+    "Overtime is paid at time and a half for the first two hours.",
+    "Saturday work attracts a penalty rate.",
+    "Meal breaks are unpaid and at least 30 minutes.",
+]
+
+
+class BlockingEmbedding(DeterministicFakeEmbedding):
+    """Sync-only embeddings (like HuggingFace): aembed_query falls back to the executor."""
+
+    delay_s: float = 0.0
+
+    def embed_query(self, text: str) -> List[float]:
+        time.sleep(self.delay_s)
+        return super().embed_query(text)
+
+
+def _store(embeddings) -> FAISS:
+    return FAISS.from_texts(TEXTS, embeddings, metadatas=[{"source": f"doc{i}.pdf"} for i in range(len(TEXTS))])
+
+
+def test_retrieve_matches_sync_search():
+    store = _store(DeterministicFakeEmbedding(size=32))
+    retriever = RAGRetriever(store)
+
+    result = asyncio.run(retriever.retrieve("overtime rate", top_k=2))
+    expected = store.similarity_search_with_score("overtime rate", k=2)
+
+    assert result.documents == [doc.page_content for doc, _ in expected]
+    assert result.scores == [score for _, score in expected]
+    assert result.metadatas == [doc.metadata for doc, _ in expected]
+
+
+def test_empty_query_short_circuits():
+    retriever = RAGRetriever(_store(DeterministicFakeEmbedding(size=8)))
+    result = asyncio.run(retriever.retrieve(""))
+    assert result.documents == []
+
+
+def test_retrieve_does_not_block_event_loop():
+    embeddings = BlockingEmbedding(size=16)
+    retriever = RAGRetriever(_store(embeddings))
+    embeddings.delay_s = 0.2
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        await asyncio.gather(*(retriever.retrieve(f"question {n}", top_k=1) for n in range(3)))
+        task.cancel()
+        return ticks
+
+    # A blocking embed would starve the ticker for the whole 0.2 s per query.
+    assert asyncio.run(scenario()) >= 5
+
+
+class CountingEmbedding(DeterministicFakeEmbedding):
+    calls: int = 0
+
+    def embed_query(self, text: str) -> List[float]:
+        self.calls += 1
+        return super().embed_query(text)
+
+
+def test_result_cache_skips_embedding_and_search():
+    from shared.rag.retrieval_cache import RetrievalCache
+
+    embeddings = CountingEmbedding(size=16)
+    cache = RetrievalCache()
+    retriever = RAGRetriever(_store(embeddings), result_cache=cache, index_version="v1")
+
+    first = asyncio.run(retriever.retrieve("penalty rate", top_k=2))
+    first.documents.clear()  # callers get their own lists
+    second = asyncio.run(retriever.retrieve("  penalty   rate ", top_k=2))
+    other_k = asyncio.run(retriever.retrieve("penalty rate", top_k=1))
+
+    assert len(second.documents) == 2
+    assert len(other_k.documents) == 1
+    assert embeddings.calls == 2
+    assert cache.stats()["hits"] == 1
+
+    rebuilt = RAGRetriever(retriever.vectorstore, result_cache=cache, index_version="v2")
+    asyncio.run(rebuilt.retrieve("penalty rate", top_k=2))
+    assert embeddings.calls == 3
+
+
+def test_manager_reloads_rebuilt_index(tmp_path, monkeypatch):
+    import logging
+    import os
+
+    import shared.rag.retriever_manager as manager
+
+    embeddings = CountingEmbedding(size=16)
+    _store(embeddings).save_local(str(tmp_path))
+    for name in (
+        "_EMBEDDINGS", "_VECTORSTORE", "_RETRIEVER", "_RETRIEVAL_CACHE", "_STORE_PATH", "_INDEX_VERSION",
+        "_RELOAD_THREAD", "_FAILED_VERSION",
+    ):
+        monkeypatch.setattr(manager, name, None)
+    monkeypatch.setattr(manager, "create_embeddings", lambda config, logger=None: embeddings)
+    config = {"paths": {"document_faiss_path": str(tmp_path)}}
+    logger = logging.getLogger("test")
+
+    retriever, _ = manager.ensure_retriever(config, logger)
+    assert manager.ensure_retriever(config, logger)[0] is retriever
+    asyncio.run(retriever.retrieve("meal break", top_k=1))
+
+    FAISS.from_texts(["Annual leave accrues progressively."], embeddings).save_local(str(tmp_path))
+    index_file = tmp_path / "index.faiss"
+    stat = index_file.stat()
+    os.utime(index_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    # The old store keeps serving while the new one loads in the background.
+    assert manager.ensure_retriever(config, logger)[0] is retriever
+    manager._RELOAD_THREAD.join(timeout=5)
+    reloaded, _ = manager.ensure_retriever(config, logger)
+    assert reloaded is not retriever
+    result = asyncio.run(reloaded.retrieve("meal break", top_k=1))
+    assert result.documents == ["Annual leave accrues progressively."]
+    assert manager.rag_stats()["retrieval_cache"]["index_version"] == reloaded.index_version
+
+    index_file.write_bytes(b"not an index")
+    manager.ensure_retriever(config, logger)
+    manager._RELOAD_THREAD.join(timeout=5)
+    assert manager.ensure_retriever(config, logger)[0] is reloaded
+    assert manager._FAILED_VERSION is not None
+
+
+class BatchCountingEmbedding(DeterministicFakeEmbedding):
+    query_calls: int = 0
+    batches: List[int] = []
+
+    def embed_query(self, text: str) -> List[float]:
+        self.query_calls += 1
+        return super().embed_query(text)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        self.batches = self.batches + [len(texts)]
+        return super().embed_documents(texts)
+
+
+def test_retrieve_many_matches_retrieve_with_one_batch():
+    from shared.llm.cached_embeddings import CachedQueryEmbeddings
+
+    model = BatchCountingEmbedding(size=16)
+    store = _store(model)
+    model.batches = []
+    retriever = RAGRetriever(store)
+    queries = ["overtime rate", "", "casual loading", "overtime rate"]
+
+    many = asyncio.run(retriever.retrieve_many(queries, top_k=2))
+
+    assert model.batches == [2]
+    assert model.query_calls == 0
+    for query, result in zip(queries, many):
+        single = asyncio.run(retriever.retrieve(query, top_k=2))
+        assert (result.documents, result.scores, result.metadatas) == (
+            single.documents, single.scores, single.metadatas
+        )
+
+    # Through the query cache, only misses are sent in the batch.
+    cached = CachedQueryEmbeddings(model)
+    cached.embed_query("overtime rate")
+    model.batches = []
+    store.embedding_function = cached
+    asyncio.run(RAGRetriever(store).retrieve_many(["overtime rate", "meal breaks"], top_k=1))
+    assert model.batches == [1]
+
+
+class CountingIndex:
+    """Wraps a FAISS index and records every search call."""
+
+    def __init__(self, index):
+        self._index = index
+        self.searches = []
+
+    def search(self, matrix, k):
+        self.searches.append(len(matrix))
+        return self._index.search(matrix, k)
+
+    def __getattr__(self, name):
+        return getattr(self._index, name)
+
+
+def test_retrieve_many_runs_one_index_search():
+    from langchain_community.vectorstores.utils import DistanceStrategy
+
+    for store in (
+        _store(DeterministicFakeEmbedding(size=16)),
+        FAISS.from_texts(TEXTS, DeterministicFakeEmbedding(size=16), normalize_L2=True),
+        FAISS.from_texts(
+            TEXTS, DeterministicFakeEmbedding(size=16), distance_strategy=DistanceStrategy.MAX_INNER_PRODUCT
+        ),
+    ):
+        queries = ["overtime rate", "casual loading", "meal breaks", "public holiday"]
+        expected = [store.similarity_search_with_score_by_vector(store.embeddings.embed_query(q), k=3) for q in queries]
+        store.index = CountingIndex(store.index)
+
+        many = asyncio.run(RAGRetriever(store).retrieve_many(queries, top_k=3))
+
+        assert store.index.searches == [len(queries)]
+        for result, docs_with_scores in zip(many, expected):
+            assert result.documents == [doc.page_content for doc, _ in docs_with_scores]
+            assert result.scores == [score for _, score in docs_with_scores]
+
+
+def test_retrieve_many_falls_back_for_other_vector_stores():
+    store = _store(DeterministicFakeEmbedding(size=16))
+
+    class OtherStore:
+        embeddings = store.embeddings
+        similarity_search_with_score_by_vector = staticmethod(store.similarity_search_with_score_by_vector)
+
+    many = asyncio.run(RAGRetriever(OtherStore()).retrieve_many(["overtime rate", "meal breaks"], top_k=2))
+
+    assert [len(result.documents) for result in many] == [2, 2]
@@ -65,3 +65,36 @@ def test_llm_unavailable_returns_structured_fallback(monkeypatch):
     assert "I cannot provide a compliance answer right now." in result["content"]
     assert "Reason: AI provider is not configured." in result["content"]
     assert "Next steps:" in result["content"]
+
+
+def test_slow_retriever_load_does_not_block_event_loop(monkeypatch):
+    import time
+
+    class _StubLLM:
+        async def generate(self, messages, temperature: float = 0.7, max_tokens: int = 800):
+            return {"content": "Stub answer", "model": "stub-model"}
+
+    def _slow_missing_vectorstore(*_args, **_kwargs):
+        time.sleep(0.3)  # e.g. waiting on the lock while warm-up loads FAISS
+        raise FileNotFoundError("Vector store missing")
+
+    monkeypatch.setattr(rag_client, "LLMProvider", lambda: _StubLLM())
+    monkeypatch.setattr(rag_client, "ensure_retriever", _slow_missing_vectorstore)
+
+    async def scenario():
+        ticks = 0
+
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+
+        task = asyncio.create_task(ticker())
+        result = await rag_client.run("Hello", system_prompt="sys", config={}, logger=logging.getLogger("test"))
+        task.cancel()
+        return result, ticks
+
+    result, ticks = asyncio.run(scenario())
+    assert result["content"] == "Stub answer"
+    assert ticks >= 10
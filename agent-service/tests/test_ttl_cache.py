@@ -0,0 +1,56 @@
+from shared.ttl_cache import TTLCache
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_lru_eviction_by_entry_count():
+    cache = TTLCache(max_entries=2)
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1  # "b" is now least recently used
+    cache.put("c", 3)
+
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (3, 1, 1)
+
+
+def test_ttl_expiry():
+    clock = _Clock()
+    cache = TTLCache(max_entries=4, ttl_seconds=10, clock=clock)
+    cache.put("a", 1)
+
+    clock.now = 10
+    assert cache.get("a") == 1
+    clock.now = 10.5
+    assert cache.get("a") is None
+    assert cache.stats()["expirations"] == 1
+    assert len(cache) == 0
+
+
+def test_byte_budget():
+    cache = TTLCache(max_entries=10, max_bytes=10, size_of=len)
+    cache.put("a", b"12345")
+    cache.put("b", b"123456")  # over budget: "a" goes
+    cache.put("huge", b"x" * 11)  # larger than the whole budget: not stored
+
+    assert cache.get("a") is None
+    assert cache.get("b") == b"123456"
+    assert cache.get("huge") is None
+    assert cache.stats()["bytes"] == 6
+
+
+def test_disabled_cache_stores_nothing():
+    cache = TTLCache(max_entries=0)
+    cache.put("a", 1)
+
+    assert cache.get("a") is None
+    assert not cache.enabled